@@ -0,0 +1,1248 @@
+"""An asyncio flavoured version of the ticketswitch client.
+
+.. note:: this module requires python 3.6 or later and the optional
+          `aiohttp <https://aiohttp.readthedocs.io>`_ dependency, which can
+          be installed with ``pip install pyticketswitch[async]``.
+
+"""
+import asyncio
+import collections
+import functools
+import logging
+
+from pyticketswitch import (
+    deadline as deadlines, decoding, endpoints, exceptions)
+from pyticketswitch.batching import kwargs_key
+from pyticketswitch.client import (
+    Client, DEFAULT_MAX_WORKERS, DEFAULT_PAGE_LENGTH, GET, POST)
+from pyticketswitch.concurrency import ConcurrencyLimiter
+from pyticketswitch.event import Event
+from pyticketswitch.streaming import (
+    DEFAULT_CHUNK_SIZE, ItemParser, ResultStream)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _stringify_params(params):
+    """Convert parameter values into strings that aiohttp will accept.
+
+    ``requests`` silently converts values with ``str`` and drops any that are
+    :obj:`None`, we do the same here so both clients send identical requests.
+
+    """
+    return {
+        key: str(value)
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+class AsyncSingleFlight(object):
+    """Makes sure only one coroutine per key is in progress at a time
+
+    The asyncio equivalent of :class:`SingleFlight
+    <pyticketswitch.coalescing.SingleFlight>`. The call runs in its own task,
+    so cancelling one of the waiters doesn't cancel it for the others.
+
+    Attributes:
+        calls (int): the number of calls that were made.
+        shared (int): the number of calls that waited for, and shared the
+            result of, a call that was already in progress.
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._flights = {}
+
+    def __len__(self):
+        return len(self._flights)
+
+    async def do(self, key, func):
+        """Await a coroutine function unless a call with the same key is in
+        progress
+
+        Args:
+            key: a hashable key identifying the call.
+            func (callable): coroutine function that takes no arguments.
+
+        Returns:
+            the result of **func**, or of the call already in progress.
+
+        Raises:
+            DeadlineExceededError: when the current deadline passed while
+                waiting for the call.
+
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self.calls += 1
+            flight = asyncio.ensure_future(func())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            self.shared += 1
+
+        deadline = deadlines.get_current()
+        if deadline is None:
+            return await asyncio.shield(flight)
+
+        # waiting on the task doesn't cancel it when the deadline passes
+        while not flight.done():
+            await asyncio.wait([flight], timeout=deadline.check())
+        return flight.result()
+
+
+class AsyncLoader(object):
+    """Collects single ID lookups and fetches them all at once
+
+    The asyncio equivalent of :class:`Loader
+    <pyticketswitch.batching.Loader>`. Lookups made within **window** seconds
+    of the first one, or before the event loop next runs when **window** is
+    ``0``, are fetched together. When **window** is :obj:`None` lookups are
+    only fetched when :meth:`dispatch` is called.
+
+    Args:
+        fetch (callable): coroutine function that takes a list of IDs and
+            keyword arguments and returns a dict of objects indexed by ID and
+            the meta data.
+        window (float): seconds to wait for more lookups after the first one.
+
+    Attributes:
+        batches (int): the number of requests made for batches of lookups.
+        lookups (int): the number of lookups made.
+
+    """
+
+    def __init__(self, fetch, window=0):
+        self.fetch = fetch
+        self.window = window
+        self.batches = 0
+        self.lookups = 0
+        self._pending = {}
+        self._handle = None
+
+    def load(self, id_, **kwargs):
+        """Look up an ID in the next batch
+
+        Args:
+            id_ (str): the ID to look up.
+            **kwargs: keyword arguments to fetch the ID with.
+
+        Returns:
+            :class:`asyncio.Future`: resolves to the object with the ID, or
+            :obj:`None` when it doesn't exist, and the meta data.
+
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self.lookups += 1
+
+        _, lookups = self._pending.setdefault(kwargs_key(kwargs), (kwargs, []))
+        lookups.append((id_, future))
+
+        if self.window is not None and self._handle is None:
+            self._handle = loop.call_later(self.window, self.dispatch)
+
+        return future
+
+    def dispatch(self):
+        """Start fetching all the pending lookups
+
+        Returns:
+            list: the :class:`asyncio.Task` fetching each batch.
+
+        """
+        pending, self._pending = self._pending, {}
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        return [
+            asyncio.ensure_future(self._fetch_batch(kwargs, lookups))
+            for kwargs, lookups in pending.values()
+        ]
+
+    async def _fetch_batch(self, kwargs, lookups):
+        ids = []
+        for id_, _ in lookups:
+            if id_ not in ids:
+                ids.append(id_)
+        self.batches += 1
+
+        try:
+            objects, meta = await self.fetch(ids, **kwargs)
+        except Exception as error:
+            for _, future in lookups:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for id_, future in lookups:
+            if not future.done():
+                future.set_result((objects.get(id_), meta))
+
+
+class AsyncBatch(object):
+    """Collects lookups made through it and fetches them in batches
+
+    The asyncio equivalent of :class:`Batch
+    <pyticketswitch.batching.Batch>`. Use it as an asynchronous context
+    manager, pending lookups are fetched on exit. Await the lookups after
+    the block, awaiting one inside it waits forever. Created by
+    :meth:`AsyncClient.batch <pyticketswitch.async_client.AsyncClient.batch>`.
+
+    Args:
+        client (:class:`AsyncClient
+            <pyticketswitch.async_client.AsyncClient>`): the client to fetch
+            the lookups with.
+
+    """
+
+    def __init__(self, client):
+        self.events = AsyncLoader(client.get_events, window=None)
+        self.performances = AsyncLoader(client.get_performances, window=None)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.dispatch()
+
+    def get_event(self, event_id, **kwargs):
+        """Look up an event in this batch
+
+        Args:
+            event_id (str): ID of the event to retrieve.
+            **kwargs: see :meth:`Client.get_events
+                <pyticketswitch.client.Client.get_events>`.
+
+        Returns:
+            :class:`asyncio.Future`: resolves to the event, or :obj:`None`
+            when it doesn't exist, and the meta data.
+
+        """
+        return self.events.load(event_id, **kwargs)
+
+    def get_performance(self, performance_id, **kwargs):
+        """Look up a performance in this batch
+
+        Args:
+            performance_id (str): ID of the performance to retrieve.
+            **kwargs: see :meth:`Client.get_performances
+                <pyticketswitch.client.Client.get_performances>`.
+
+        Returns:
+            :class:`asyncio.Future`: resolves to the performance, or
+            :obj:`None` when it doesn't exist, and the meta data.
+
+        """
+        return self.performances.load(performance_id, **kwargs)
+
+    async def dispatch(self):
+        """Fetch all the pending lookups"""
+        tasks = self.events.dispatch() + self.performances.dispatch()
+        if tasks:
+            await asyncio.wait(tasks)
+
+
+class AsyncConcurrencyLimiter(ConcurrencyLimiter):
+    """A limit on the number of requests in flight from coroutines
+
+    The asyncio equivalent of :class:`ConcurrencyLimiter
+    <pyticketswitch.concurrency.ConcurrencyLimiter>`, it accepts the same
+    arguments. Waiting coroutines don't block the event loop, and a waiter
+    that is cancelled gives up its place in the queue.
+
+    """
+
+    async def acquire(self, endpoint, timeout=None):
+        """Wait for a slot to make a request in
+
+        See :meth:`ConcurrencyLimiter.acquire
+        <pyticketswitch.concurrency.ConcurrencyLimiter.acquire>`.
+
+        """
+        started = self.clock()
+        if self._can_run(endpoint) and not self._queue:
+            return self._take(endpoint, started)
+
+        if self.max_waiting is not None and \
+                len(self._queue) >= self.max_waiting:
+            self.rejected += 1
+            raise exceptions.ClientOverloadedError(
+                'too many requests waiting to be sent')
+
+        future = asyncio.get_event_loop().create_future()
+        ticket = (future, endpoint, started)
+        self._queue.append(ticket)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except BaseException as error:
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+            elif future.done() and not future.cancelled():
+                # we were handed a slot but can't use it
+                self.release(endpoint)
+            if isinstance(error, asyncio.TimeoutError):
+                self.rejected += 1
+                raise exceptions.DeadlineExceededError(
+                    'no free slot to send {} in time'.format(endpoint))
+            raise
+
+    def release(self, endpoint):
+        """Give back a slot once a request has finished
+
+        The slot is handed straight to the next waiter that can use it.
+
+        Args:
+            endpoint (str): the API endpoint the request was for.
+
+        """
+        self._active -= 1
+        self._active_by_endpoint[endpoint] -= 1
+
+        ticket = self._next_runnable()
+        while ticket is not None:
+            self._queue.remove(ticket)
+            future, endpoint, started = ticket
+            if not future.done():
+                future.set_result(self._take(endpoint, started))
+            ticket = self._next_runnable()
+
+    def slot(self, endpoint, timeout=None):
+        """Hold a slot for the duration of an ``async with`` block
+
+        Args:
+            endpoint (str): the API endpoint the request is for.
+            timeout (float): the maximum seconds to wait.
+
+        """
+        return _AsyncSlot(self, endpoint, timeout)
+
+
+class _AsyncSlot(object):
+
+    def __init__(self, limiter, endpoint, timeout):
+        self.limiter = limiter
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        await self.limiter.acquire(self.endpoint, timeout=self.timeout)
+
+    async def __aexit__(self, *exc_info):
+        self.limiter.release(self.endpoint)
+
+
+class AsyncResultStream(ResultStream):
+    """The objects in a response, parsed as the response is downloaded
+
+    The asyncio equivalent of :class:`ResultStream
+    <pyticketswitch.streaming.ResultStream>`, iterate over it with
+    ``async for``. **chunks** is an asynchronous iterable.
+
+    """
+
+    async def __aiter__(self):
+        parser = ItemParser(self.path, self.use_decimal)
+        try:
+            async for chunk in self.chunks:
+                for _, data in parser.feed(chunk):
+                    item = self.parse_item(data)
+                    if item is not None:
+                        yield item
+            self.meta = self.finish(parser.remainder())
+        finally:
+            self.close()
+
+
+class AsyncClient(Client):
+    """AsyncClient wraps the ticketswitch f13 API for asyncio applications.
+
+    It accepts the same arguments as :class:`Client
+    <pyticketswitch.client.Client>` and provides the same methods, however
+    every method that calls the API is a coroutine::
+
+        >>> async with AsyncClient('demo', 'demopass') as client:
+        ...     events, meta = await client.list_events()
+
+    Connections are always kept alive between calls, **pool_maxsize** limits
+    the number of connections that will be opened to the API. A
+    **concurrency_limiter** must be an :class:`AsyncConcurrencyLimiter
+    <pyticketswitch.async_client.AsyncConcurrencyLimiter>`. Call
+    :meth:`close <pyticketswitch.async_client.AsyncClient.close>` or use the
+    client as an asynchronous context manager to release them.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        if aiohttp is None:
+            raise ImportError(
+                'aiohttp is required to use the AsyncClient, install it with '
+                '`pip install pyticketswitch[async]`'
+            )
+        super(AsyncClient, self).__init__(*args, **kwargs)
+        self._session = None
+
+    def __enter__(self):
+        raise TypeError(
+            'AsyncClient must be used with "async with", not "with"')
+
+    def __exit__(self, *exc_info):
+        raise TypeError(
+            'AsyncClient must be used with "async with", not "with"')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def get_auth(self):
+        """Get the authentication parameter for the raw request
+
+        This method is intended to be overwritten if required.
+
+        Returns:
+            :class:`aiohttp.BasicAuth`: the authentication parameter
+                accepted by the `aiohttp` module
+        """
+        if self.user and self.password:
+            return aiohttp.BasicAuth(self.user, self.password, encoding='utf-8')
+
+    async def get_session(self):
+        """Get the aiohttp.ClientSession instance to use to make HTTP requests
+
+        The session is created on first use and then reused for every
+        subsequent request made by this client.
+
+        Returns:
+            :class:`aiohttp.ClientSession`: the http session.
+
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the persistent connections held by the client."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            logger.debug('aiohttp session closing')
+            await session.close()
+
+    async def make_request(self, endpoint, params, method=GET, headers={},
+                           timeout=None):
+        """Makes actual requests to the API
+
+        See :meth:`Client.make_request
+        <pyticketswitch.client.Client.make_request>` for more info.
+
+        """
+        url = self.get_url(endpoint)
+        params.update(self.get_extra_params())
+        if not params.get('tsw_session_track_id'):
+            params.update(self.get_tracking_params())
+
+        logger.debug(u'url: %s; endpoint: %s; params: %s', self.url, endpoint, params)
+
+        raw_headers = self.get_headers(dict(headers))
+
+        auth = self.get_auth()
+
+        session = await self.get_session()
+
+        request_kwargs = {'auth': auth, 'headers': raw_headers}
+        if timeout is not None:
+            request_kwargs.update(timeout=aiohttp.ClientTimeout(total=timeout))
+
+        if method == POST:
+            request_kwargs.update(data=_stringify_params(params))
+        else:
+            request_kwargs.update(params=_stringify_params(params))
+
+        async with session.request(method.upper(), url, **request_kwargs) as response:
+            content = await response.read()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(content.decode('utf-8', 'replace'))
+
+        contents = endpoints.decode_response(
+            endpoint,
+            response.status,
+            lambda: decoding.loads(content, self.use_decimal),
+        )
+
+        return endpoints.check_response(
+            endpoint, response.status, contents, response)
+
+    async def make_streaming_request(self, endpoint, params, path,
+                                     parse_item, parse_rest, headers={},
+                                     timeout=None,
+                                     chunk_size=DEFAULT_CHUNK_SIZE):
+        """Makes a GET request to the API and parses the response as it is
+        downloaded
+
+        See :meth:`Client.make_streaming_request
+        <pyticketswitch.client.Client.make_streaming_request>`.
+
+        Returns:
+            :class:`AsyncResultStream
+            <pyticketswitch.async_client.AsyncResultStream>`: iterate over it
+            with ``async for``.
+
+        """
+        url = self.get_url(endpoint)
+        params.update(self.get_extra_params())
+        if not params.get('tsw_session_track_id'):
+            params.update(self.get_tracking_params())
+
+        logger.debug(u'url: %s; endpoint: %s; params: %s', self.url, endpoint, params)
+
+        request_kwargs = {
+            'auth': self.get_auth(),
+            'headers': self.get_headers(dict(headers)),
+            'params': _stringify_params(params),
+        }
+        if timeout is not None:
+            request_kwargs.update(timeout=aiohttp.ClientTimeout(total=timeout))
+
+        session = await self.get_session()
+        response = await session.request(GET.upper(), url, **request_kwargs)
+
+        def finish(rest):
+            contents = endpoints.decode_response(
+                endpoint,
+                response.status,
+                lambda: decoding.loads(rest, self.use_decimal),
+            )
+            endpoints.check_response(
+                endpoint, response.status, contents, response)
+            return parse_rest(contents)
+
+        return AsyncResultStream(
+            response.content.iter_chunked(chunk_size), path, parse_item,
+            finish, use_decimal=self.use_decimal, close=response.release)
+
+    async def stream(self, call, path, parse_item):
+        """Make the request described by an API call and parse the items of
+        its response as they are downloaded
+
+        See :meth:`Client.stream <pyticketswitch.client.Client.stream>`.
+
+        """
+        return await self.make_streaming_request(
+            call.endpoint, call.params, path, parse_item,
+            lambda contents: call.parse(contents)[1],
+            **self.get_request_kwargs())
+
+    async def execute(self, call):
+        """Make the request described by an API call and parse the response
+
+        See :meth:`Client.execute <pyticketswitch.client.Client.execute>`.
+
+        """
+        cache_key = self.get_cache_key(call)
+        if cache_key is not None:
+            response = self.cache.get(cache_key)
+            if response is not None:
+                return call.parse(response)
+
+        coalescing_key = self.get_coalescing_key(call)
+        try:
+            if coalescing_key is not None:
+                response = await self.single_flight.do(
+                    coalescing_key, lambda: self.send_through_circuit(call))
+            else:
+                response = await self.send_through_circuit(call)
+        except exceptions.CircuitOpenError:
+            response = self.get_stale_response(cache_key)
+            if response is None:
+                raise
+            return call.parse(response)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+
+        return call.parse(response)
+
+    async def send(self, call):
+        """Make the request described by an API call
+
+        See :meth:`Client.send <pyticketswitch.client.Client.send>`.
+
+        """
+        kwargs = self.get_request_kwargs()
+        if call.method == POST:
+            return await self.make_request(call.endpoint, call.params,
+                                           method=POST, **kwargs)
+        return await self.make_request(call.endpoint, call.params, **kwargs)
+
+    async def send_through_circuit(self, call):
+        """Make the request unless the circuit for its backend is open
+
+        See :meth:`Client.send_through_circuit
+        <pyticketswitch.client.Client.send_through_circuit>`.
+
+        """
+        if self.circuit_breaker is None:
+            return await self.send_with_retry(call)
+
+        self.circuit_breaker.before_call(
+            self.circuit_breaker.get_source_code(call))
+
+        try:
+            response = await self.send_with_retry(call)
+        except Exception as error:
+            self.circuit_breaker.record_error(
+                call, error, transient_errors=self.get_transient_errors())
+            raise
+
+        self.circuit_breaker.record_response(call, response)
+        return response
+
+    async def send_with_retry(self, call):
+        """Make the request described by an API call, retrying on failure
+
+        See :meth:`Client.send_with_retry
+        <pyticketswitch.client.Client.send_with_retry>`.
+
+        """
+        if self.retry is None:
+            return await self.send_hedged(call)
+
+        started = self.retry.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self.send_hedged(call)
+            except Exception as error:
+                delay = self.retry.get_delay(
+                    call, error, attempt, started,
+                    transient_errors=self.get_transient_errors())
+                if delay is None or not deadlines.allows(delay):
+                    raise
+            await asyncio.sleep(delay)
+
+    async def send_hedged(self, call):
+        """Make the request, and a second one if the first is slow
+
+        See :meth:`Client.send_hedged
+        <pyticketswitch.client.Client.send_hedged>`. The slower request is
+        cancelled.
+
+        """
+        if self.hedge is None or not self.hedge.is_hedgeable(call):
+            return await self.send_rate_limited(call)
+
+        async def attempt():
+            started = self.hedge.clock()
+            response = await self.send_rate_limited(call)
+            self.hedge.record(call.endpoint, self.hedge.clock() - started)
+            return response
+
+        delay = self.hedge.get_delay(call.endpoint)
+        if delay is None or not deadlines.allows(delay):
+            return await attempt()
+
+        tasks = [asyncio.ensure_future(attempt())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self.hedge.record_hedge()
+                tasks.append(asyncio.ensure_future(attempt()))
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for index, task in enumerate(tasks):
+                    if task not in done:
+                        continue
+                    if task.exception() is None:
+                        if index:
+                            self.hedge.record_win()
+                        return task.result()
+                    if error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def send_rate_limited(self, call):
+        """Make the request once the rate limiter allows it
+
+        See :meth:`Client.send_rate_limited
+        <pyticketswitch.client.Client.send_rate_limited>`.
+
+        """
+        if self.rate_limiter is None:
+            return await self.send_in_slot(call)
+
+        delay = self.rate_limiter.acquire(call.endpoint, self.sub_user)
+        if delay > 0:
+            if not deadlines.allows(delay):
+                raise exceptions.DeadlineExceededError(
+                    'deadline passes before {} can be sent'.format(
+                        call.endpoint))
+            await asyncio.sleep(delay)
+
+        try:
+            response = await self.send_in_slot(call)
+        except Exception as error:
+            self.rate_limiter.record_error(call.endpoint, self.sub_user, error)
+            raise
+
+        self.rate_limiter.record_response(
+            call.endpoint, self.sub_user, response)
+        return response
+
+    async def send_in_slot(self, call):
+        """Make the request once the concurrency limiter has a free slot
+
+        See :meth:`Client.send_in_slot
+        <pyticketswitch.client.Client.send_in_slot>`.
+
+        """
+        if self.concurrency_limiter is None:
+            return await self.send(call)
+
+        async with self.concurrency_limiter.slot(
+                call.endpoint, timeout=deadlines.get_timeout()):
+            return await self.send(call)
+
+    def get_transient_errors(self):
+        """Get the transport errors that are worth retrying
+
+        Returns:
+            tuple: exception types raised for dropped connections and
+            timeouts.
+
+        """
+        return (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    def make_single_flight(self):
+        """Create the object used to coalesce identical requests
+
+        Returns:
+            :class:`AsyncSingleFlight
+            <pyticketswitch.async_client.AsyncSingleFlight>`
+
+        """
+        return AsyncSingleFlight()
+
+    def make_loader(self, fetch):
+        """Create an object that batches up single ID lookups
+
+        Returns:
+            :class:`AsyncLoader <pyticketswitch.async_client.AsyncLoader>`
+
+        """
+        return AsyncLoader(fetch, window=self.batch_window)
+
+    def batch(self):
+        """Collect event and performance lookups to fetch them together
+
+        Lookups made through the returned batch are fetched with one request
+        per type when the batch is exited::
+
+            >>> async with client.batch() as batch:
+            ...     lookups = [batch.get_event(event_id) for event_id in ids]
+            >>> event, meta = await lookups[0]
+
+        Returns:
+            :class:`AsyncBatch <pyticketswitch.async_client.AsyncBatch>`: the
+            batch.
+
+        """
+        return AsyncBatch(self)
+
+    async def test(self):
+        """Test the connection
+
+        See :meth:`Client.test <pyticketswitch.client.Client.test>`.
+
+        """
+        return await self.execute(endpoints.test())
+
+    async def list_events(self, *args, **kwargs):
+        """List events with the given parameters
+
+        Accepts the same arguments as :meth:`Client.list_events
+        <pyticketswitch.client.Client.list_events>`.
+
+        """
+        return await self.execute(endpoints.list_events(
+            *args, lazy=self.lazy_models, keep_raw=self.keep_raw,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    def iter_events(self, page=0, page_length=DEFAULT_PAGE_LENGTH,
+                    prefetch=1, concurrent=False,
+                    max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Iterate over all the events matching the given parameters
+
+        Returns an asynchronous generator, use it with ``async for``::
+
+            >>> async for event in client.iter_events(city_code='london-uk'):
+            ...     print(event.description)
+
+        Accepts the same arguments as :meth:`Client.iter_events
+        <pyticketswitch.client.Client.iter_events>`.
+
+        """
+        async def fetch(page_number):
+            return await self.list_events(
+                page=page_number, page_length=page_length, **kwargs)
+
+        return self._iter_pages(
+            fetch, deadlines.get_current(), page, prefetch, concurrent,
+            max_workers)
+
+    async def stream_events(self, **kwargs):
+        """List events, parsing them as the response is downloaded
+
+        Use the stream with ``async for``::
+
+            >>> stream = await client.stream_events(page_length=1000)
+            >>> async for event in stream:
+            ...     print(event.description)
+
+        See :meth:`Client.stream_events
+        <pyticketswitch.client.Client.stream_events>`.
+
+        """
+        return await self.stream(
+            endpoints.list_events(
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs),
+            endpoints.EVENTS_PATH,
+            functools.partial(
+                Event.from_api_data, lazy=self.lazy_models,
+                keep_raw=self.keep_raw))
+
+    async def stream_events_by_id(self, event_ids, with_addons=False,
+                                  with_upsells=False, **kwargs):
+        """Get events with the given id's, parsing them as the response is
+        downloaded
+
+        See :meth:`Client.stream_events_by_id
+        <pyticketswitch.client.Client.stream_events_by_id>`.
+
+        """
+        call = endpoints.get_events(
+            event_ids, with_addons=with_addons, with_upsells=with_upsells,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return await self.stream(
+            call, endpoints.EVENTS_BY_ID_PATH,
+            functools.partial(
+                endpoints.parse_event_by_id, lazy=self.lazy_models,
+                keep_raw=self.keep_raw))
+
+    async def get_events(self, event_ids, chunk_size=None,
+                         max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Get events with the given id's
+
+        See :meth:`Client.get_events <pyticketswitch.client.Client.get_events>`.
+
+        """
+        async def fetch(ids):
+            return await self.execute(endpoints.get_events(
+                ids, lazy=self.lazy_models, keep_raw=self.keep_raw,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+        return await self._fetch_in_chunks(
+            fetch, event_ids, chunk_size, max_workers)
+
+    async def get_event(self, event_id, **kwargs):
+        """Get a specific event by id
+
+        See :meth:`Client.get_event <pyticketswitch.client.Client.get_event>`.
+
+        """
+        if self.event_loader is not None:
+            return await self.event_loader.load(event_id, **kwargs)
+
+        events, meta = await self.get_events([event_id], **kwargs)
+        return events.get(event_id), meta
+
+    async def get_months(self, event_id, **kwargs):
+        """Returns a summary of availability accross months.
+
+        See :meth:`Client.get_months <pyticketswitch.client.Client.get_months>`.
+
+        """
+        return await self.execute(endpoints.get_months(
+            event_id, add_optional_kwargs=self.add_optional_kwargs,
+            **kwargs))
+
+    async def list_performances(self, event_id, *args, **kwargs):
+        """List performances for a specified event
+
+        Accepts the same arguments as :meth:`Client.list_performances
+        <pyticketswitch.client.Client.list_performances>`.
+
+        """
+        return await self.execute(endpoints.list_performances(
+            event_id, *args, lazy=self.lazy_models,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    def iter_performances(self, event_id, page=0,
+                          page_length=DEFAULT_PAGE_LENGTH, prefetch=1,
+                          concurrent=False,
+                          max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Iterate over all the performances for a specified event
+
+        Returns an asynchronous generator, use it with ``async for``.
+
+        Accepts the same arguments as :meth:`Client.iter_performances
+        <pyticketswitch.client.Client.iter_performances>`.
+
+        """
+        async def fetch(page_number):
+            return await self.list_performances(
+                event_id, page=page_number, page_length=page_length, **kwargs)
+
+        return self._iter_pages(
+            fetch, deadlines.get_current(), page, prefetch, concurrent,
+            max_workers)
+
+    async def get_performances(self, performance_ids, chunk_size=None,
+                               max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Get performances with the given ID's
+
+        See :meth:`Client.get_performances
+        <pyticketswitch.client.Client.get_performances>`.
+
+        """
+        async def fetch(ids):
+            return await self.execute(endpoints.get_performances(
+                ids, lazy=self.lazy_models,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+        return await self._fetch_in_chunks(
+            fetch, performance_ids, chunk_size, max_workers)
+
+    async def get_performance(self, performance_id, **kwargs):
+        """Get a specific performance by id
+
+        See :meth:`Client.get_performance
+        <pyticketswitch.client.Client.get_performance>`.
+
+        """
+        if self.performance_loader is not None:
+            return await self.performance_loader.load(
+                performance_id, **kwargs)
+
+        performances, meta = await self.get_performances(
+            [performance_id], **kwargs)
+        return performances.get(performance_id), meta
+
+    async def get_availability(self, performance_id, **kwargs):
+        """Fetch available tickets and prices for a given performance
+
+        Accepts the same arguments as :meth:`Client.get_availability
+        <pyticketswitch.client.Client.get_availability>`.
+
+        """
+        return await self.execute(
+            endpoints.get_availability(
+                performance_id,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    async def get_availability_many(self, performance_ids,
+                                    max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Fetch availability for several performances at once
+
+        At most **max_workers** requests will be in flight at the same time.
+
+        See :meth:`Client.get_availability_many
+        <pyticketswitch.client.Client.get_availability_many>`.
+
+        """
+        async def fetch(performance_id):
+            return await self.get_availability(performance_id, **kwargs)
+
+        results = {}
+        errors = {}
+        outcomes = await self._run_concurrently(
+            fetch, endpoints.unique_ids(performance_ids), max_workers)
+        for performance_id, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                errors[performance_id] = outcome
+            else:
+                results[performance_id] = outcome
+
+        return results, errors
+
+    async def _fetch_in_chunks(self, fetch, ids, chunk_size, max_workers):
+        """Fetch objects by ID, a chunk of IDs at a time.
+
+        See :meth:`Client._fetch_in_chunks
+        <pyticketswitch.client.Client._fetch_in_chunks>`.
+
+        """
+        if chunk_size is None:
+            chunk_size = self.id_chunk_size
+
+        if not chunk_size or len(ids) <= chunk_size:
+            return await fetch(ids)
+
+        chunks = endpoints.chunk_ids(ids, chunk_size)
+        logger.debug(u'fetching %s ids in %s chunks', len(ids), len(chunks))
+
+        results = []
+        for _, outcome in await self._run_concurrently(
+                fetch, chunks, max_workers):
+            if isinstance(outcome, Exception):
+                raise outcome
+            results.append(outcome)
+
+        return endpoints.merge_results_by_id(results)
+
+    async def _iter_pages(self, fetch, deadline, page, prefetch, concurrent,
+                          max_workers):
+        """Yield the results of a paginated call, page by page.
+
+        See :meth:`Client._iter_pages
+        <pyticketswitch.client.Client._iter_pages>`.
+
+        """
+        async def fetch_page(page_number):
+            with deadlines.using(deadline):
+                return await fetch(page_number)
+
+        results, meta = await fetch_page(page)
+        pages = collections.deque(meta.remaining_pages())
+
+        if concurrent:
+            prefetch = len(pages)
+
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def bounded_fetch(page_number):
+            async with semaphore:
+                return await fetch_page(page_number)
+
+        pending = collections.deque()
+        try:
+            while True:
+                while pages and len(pending) < prefetch:
+                    pending.append(asyncio.ensure_future(
+                        bounded_fetch(pages.popleft())))
+
+                for result in results:
+                    yield result
+
+                if not pending:
+                    if not pages:
+                        return
+                    pending.append(asyncio.ensure_future(
+                        bounded_fetch(pages.popleft())))
+
+                results, _ = await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run_concurrently(self, func, items, max_workers):
+        """Await a coroutine function for each item.
+
+        At most **max_workers** calls will be awaited at the same time.
+
+        Args:
+            func (callable): coroutine function that takes a single item.
+            items (list): the items to call the function with, without
+                duplicates.
+            max_workers (int): the maximum number of concurrent calls.
+
+        Returns:
+            list: ``(item, outcome)`` tuples in the order of the items, where
+            outcome is either the result of the call or the exception it
+            raised.
+
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(item):
+            async with semaphore:
+                return await func(item)
+
+        outcomes = await asyncio.gather(
+            *[call(item) for item in items],
+            return_exceptions=True
+        )
+        return list(zip(items, outcomes))
+
+    async def get_send_methods(self, performance_id, **kwargs):
+        """Fetch available delivery methods for a given performance
+
+        See :meth:`Client.get_send_methods
+        <pyticketswitch.client.Client.get_send_methods>`.
+
+        """
+        return await self.execute(
+            endpoints.get_send_methods(
+                performance_id,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    async def get_discounts(self, performance_id, ticket_type_code,
+                            price_band_code, **kwargs):
+        """Fetch available discounts for a ticket_type/price band combination
+
+        Accepts the same arguments as :meth:`Client.get_discounts
+        <pyticketswitch.client.Client.get_discounts>`.
+
+        """
+        return await self.execute(endpoints.get_discounts(
+            performance_id, ticket_type_code, price_band_code,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    async def get_trolley(self, **kwargs):
+        """Retrieve the contents of a trolley from the API.
+
+        Accepts the same arguments as :meth:`Client.get_trolley
+        <pyticketswitch.client.Client.get_trolley>`.
+
+        """
+        return await self.execute(endpoints.get_trolley(
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs))
+
+    async def get_upsells(self, **kwargs):
+        """Retrieve a list of upsell events related to a trolley from the API.
+
+        Accepts the same arguments as :meth:`Client.get_upsells
+        <pyticketswitch.client.Client.get_upsells>`.
+
+        """
+        return await self.execute(endpoints.get_upsells(
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs))
+
+    async def get_addons(self, **kwargs):
+        """Retrieve a list of add-on events from the API.
+
+        Accepts the same arguments as :meth:`Client.get_addons
+        <pyticketswitch.client.Client.get_addons>`.
+
+        """
+        return await self.execute(endpoints.get_addons(
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs))
+
+    async def make_reservation(self, raise_on_unavailable_order=False,
+                               **kwargs):
+        """Attempt to reserve all the items in the given trolley
+
+        Accepts the same arguments as :meth:`Client.make_reservation
+        <pyticketswitch.client.Client.make_reservation>`.
+
+        """
+        call = endpoints.make_reservation(
+            raise_on_unavailable_order=raise_on_unavailable_order,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs)
+        call.parser = lambda response: self.process_reservation_response(
+            response, raise_on_unavailable_order)
+        return await self.execute(call)
+
+    async def release_reservation(self, transaction_uuid, **kwargs):
+        """Release an existing reservation.
+
+        See :meth:`Client.release_reservation
+        <pyticketswitch.client.Client.release_reservation>`.
+
+        """
+        return await self.execute(
+            endpoints.release_reservation(transaction_uuid, **kwargs))
+
+    async def get_reservation(self, transaction_uuid,
+                              raise_on_unavailable_order=False, **kwargs):
+        """Retrieve a previously made reservation response, verbatim.
+
+        See :meth:`Client.get_reservation
+        <pyticketswitch.client.Client.get_reservation>`.
+
+        """
+        call = endpoints.get_reservation(
+            transaction_uuid,
+            raise_on_unavailable_order=raise_on_unavailable_order,
+            lazy=self.lazy_models, keep_raw=self.keep_raw, **kwargs)
+        call.parser = lambda response: self.process_reservation_response(
+            response, raise_on_unavailable_order)
+        return await self.execute(call)
+
+    async def get_status(self, **kwargs):
+        """Get the status of reservation, purchase or transaction.
+
+        See :meth:`Client.get_status <pyticketswitch.client.Client.get_status>`.
+
+        """
+        return await self.execute(endpoints.get_status(
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs))
+
+    async def make_purchase(self, transaction_uuid, customer, **kwargs):
+        """Purchase tickets for an existing reservation.
+
+        Accepts the same arguments as :meth:`Client.make_purchase
+        <pyticketswitch.client.Client.make_purchase>`.
+
+        """
+        call = endpoints.make_purchase(
+            transaction_uuid, customer, lazy=self.lazy_models,
+            keep_raw=self.keep_raw, **kwargs)
+        call.parser = self.process_purchase_response
+        return await self.execute(call)
+
+    async def get_purchase(self, transaction_uuid, **kwargs):
+        """Retrieve a previously made purchase response, verbatim.
+
+        See :meth:`Client.get_purchase
+        <pyticketswitch.client.Client.get_purchase>`.
+
+        """
+        call = endpoints.get_purchase(
+            transaction_uuid, lazy=self.lazy_models, keep_raw=self.keep_raw,
+            **kwargs)
+        call.parser = self.process_purchase_response
+        return await self.execute(call)
+
+    async def next_callout(self, this_token, next_token, returned_data,
+                           **kwargs):
+        """Gets the next callout in a callout chain.
+
+        See :meth:`Client.next_callout
+        <pyticketswitch.client.Client.next_callout>`.
+
+        """
+        call = endpoints.next_callout(
+            this_token, next_token, returned_data, lazy=self.lazy_models,
+            keep_raw=self.keep_raw, **kwargs)
+        call.parser = self.process_purchase_response
+        return await self.execute(call)
+
+    async def cancel_purchase(self, transaction_uuid, **kwargs):
+        """Attempt cancellation of item numbers from the transaction.
+
+        Accepts the same arguments as :meth:`Client.cancel_purchase
+        <pyticketswitch.client.Client.cancel_purchase>`.
+
+        """
+        return await self.execute(
+            endpoints.cancel_purchase(
+                transaction_uuid, lazy=self.lazy_models,
+                keep_raw=self.keep_raw,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
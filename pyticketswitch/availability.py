@@ -1,9 +1,62 @@
-import datetime
+from pyticketswitch import utils
 from pyticketswitch.mixins import JSONMixin
 from pyticketswitch.currency import CurrencyMeta
 from pyticketswitch.misc import MONTH_NUMBERS
 
 
+_CACHE_SIZE = 1024
+
+_MONTH_MASKS = {}
+_WEEKDAYS = {}
+
+
+def _parse_date(date_str):
+    try:
+        return utils.yyyymmdd_to_date(date_str)
+    except ValueError:
+        return None
+
+
+def _calendar_masks(available_dates):
+    # the same months recur across the details of a response, so their
+    # masks are converted once. The cache holds tuples so that each details
+    # object gets its own dicts built from them.
+    calendar_masks = {}
+    for year, month_masks in available_dates.items():
+        if not year.startswith('year_'):
+            continue
+
+        key = tuple(month_masks.items())
+        months = _MONTH_MASKS.get(key)
+        if months is None:
+            months = tuple(
+                (MONTH_NUMBERS[month[:3]], mask)
+                for month, mask in month_masks.items()
+            )
+            if len(_MONTH_MASKS) >= _CACHE_SIZE:
+                _MONTH_MASKS.clear()
+            _MONTH_MASKS[key] = months
+
+        calendar_masks[int(year[5:])] = dict(months)
+    return calendar_masks
+
+
+def _on_weekday(weekday_mask, day):
+    # the api uses sunday as day 0, python uses monday
+    adjusted_day = day + 1 if day < 6 else 0
+    return bool(weekday_mask >> adjusted_day & 1)
+
+
+def _weekday_list(weekday_mask):
+    weekdays = _WEEKDAYS.get(weekday_mask)
+    if weekdays is None:
+        weekdays = tuple(_on_weekday(weekday_mask, day) for day in range(7))
+        if len(_WEEKDAYS) >= _CACHE_SIZE:
+            _WEEKDAYS.clear()
+        _WEEKDAYS[weekday_mask] = weekdays
+    return list(weekdays)
+
+
 class AvailabilityMeta(CurrencyMeta):
     """Meta data about an availability response
 
@@ -100,6 +153,13 @@ class AvailabilityDetails(JSONMixin, object):
 
     """
 
+    __slots__ = ('ticket_type', 'ticket_type_description', 'price_band',
+                 'price_band_description', 'seatprice', 'surcharge',
+                 'full_seatprice', 'full_surcharge', 'percentage_saving',
+                 'absolute_saving', 'currency', 'first_date', 'last_date',
+                 '_calendar_masks', '_weekday_mask', 'valid_quantities',
+                 'cached_number_available', 'weekday_list')
+
     def __init__(self, ticket_type=None, price_band=None,
                  ticket_type_description=None, price_band_description=None,
                  seatprice=None, surcharge=None, full_seatprice=None,
@@ -169,33 +229,16 @@ class AvailabilityDetails(JSONMixin, object):
 
                     available_dates = raw_details.get('available_dates', {})
                     if 'first_yyyymmdd' in available_dates:
-                        try:
-                            first = datetime.datetime.strptime(
-                                available_dates['first_yyyymmdd'],
-                                '%Y%m%d'
-                            )
-                            kwargs['first_date'] = first.date()
-                        except ValueError:
-                            pass
+                        first = _parse_date(available_dates['first_yyyymmdd'])
+                        if first is not None:
+                            kwargs['first_date'] = first
 
                     if 'last_yyyymmdd' in available_dates:
-                        try:
-                            last = datetime.datetime.strptime(
-                                available_dates['last_yyyymmdd'],
-                                '%Y%m%d'
-                            )
-                            kwargs['last_date'] = last.date()
-                        except ValueError:
-                            pass
-
-                    kwargs['calendar_masks'] = {
-                        int(year[5:]): {
-                            MONTH_NUMBERS[month[:3]]: mask
-                            for month, mask in month_masks.items()
-                        }
-                        for year, month_masks in available_dates.items()
-                        if year.startswith('year_')
-                    }
+                        last = _parse_date(available_dates['last_yyyymmdd'])
+                        if last is not None:
+                            kwargs['last_date'] = last
+
+                    kwargs['calendar_masks'] = _calendar_masks(available_dates)
 
                     if 'available_weekdays_bitmask' in raw_details:
                         kwargs['weekday_mask'] = raw_details['available_weekdays_bitmask']
@@ -209,10 +252,8 @@ class AvailabilityDetails(JSONMixin, object):
                     avail_details = AvailabilityDetails(**kwargs)
 
                     if avail_details._weekday_mask:
-                        weekday_list = []
-                        for day in range(0, 7):
-                            weekday_list.append(avail_details.on_weekday(day))
-                        avail_details.weekday_list = weekday_list
+                        avail_details.weekday_list = _weekday_list(
+                            avail_details._weekday_mask)
                     details.append(avail_details)
 
         return sorted(details, key=lambda x: (x.ticket_type_description, x.combined_price()))
@@ -275,9 +316,7 @@ class AvailabilityDetails(JSONMixin, object):
 
         """
 
-        adjusted_day = day + 1 if day < 6 else 0
-
-        return bool(self._weekday_mask >> adjusted_day & 1)
+        return _on_weekday(self._weekday_mask, day)
 
     def combined_price(self):
         return self.seatprice + self.surcharge
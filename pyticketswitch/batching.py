@@ -0,0 +1,246 @@
+"""Batching of single ID lookups into requests for many IDs.
+
+Looking up events or performances one at a time, for example once per row of
+a template, makes a request per ID. The loaders in this module collect those
+lookups and fetch them together with a single call to
+:meth:`get_events <pyticketswitch.client.Client.get_events>` or
+:meth:`get_performances <pyticketswitch.client.Client.get_performances>`.
+
+Lookups can be collected explicitly with a batch::
+
+    >>> with client.batch() as batch:
+    ...     lookups = [batch.get_event(event_id) for event_id in event_ids]
+    >>> events = [lookup.result()[0] for lookup in lookups]
+
+or, when the client is created with a **batch_window**, every call to
+:meth:`get_event <pyticketswitch.client.Client.get_event>` and
+:meth:`get_performance <pyticketswitch.client.Client.get_performance>` waits
+that many seconds for other threads to look up IDs too::
+
+    >>> client = Client('demo', 'demopass', batch_window=0.01)
+
+"""
+import threading
+from concurrent.futures import TimeoutError
+
+
+def kwargs_key(kwargs):
+    """Generate a hashable key for a set of keyword arguments
+
+    Lookups are only batched together when they were made with the same
+    keyword arguments.
+
+    Args:
+        kwargs (dict): keyword arguments.
+
+    Returns:
+        tuple: a hashable key.
+
+    """
+    return tuple(sorted((key, repr(value)) for key, value in kwargs.items()))
+
+
+class Lookup(object):
+    """The pending result of looking up a single ID
+
+    Attributes:
+        id (str): the ID being looked up.
+
+    """
+
+    def __init__(self, loader, id_):
+        self.id = id_
+        self._loader = loader
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+
+    def done(self):
+        """Indicates that the lookup has finished
+
+        Returns:
+            bool: :obj:`True` when the result is available.
+
+        """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """Get the result of the lookup
+
+        Lookups made in a batch that hasn't been sent yet are sent straight
+        away.
+
+        Args:
+            timeout (float): the maximum number of seconds to wait.
+
+        Returns:
+            object, meta: the object with the ID, or :obj:`None` when it
+            doesn't exist, and the meta data from the response.
+
+        Raises:
+            Exception: whatever the request for the batch raised.
+            concurrent.futures.TimeoutError: when the result isn't available
+                after **timeout** seconds.
+
+        """
+        if not self.done() and self._loader.window is None:
+            self._loader.dispatch()
+
+        if not self._done.wait(timeout):
+            raise TimeoutError(
+                'lookup of {} did not finish in time'.format(self.id))
+
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def set_result(self, result):
+        self._result = result
+        self._done.set()
+
+    def set_error(self, error):
+        self._error = error
+        self._done.set()
+
+
+class Loader(object):
+    """Collects single ID lookups and fetches them all at once
+
+    Args:
+        fetch (callable): function that takes a list of IDs and keyword
+            arguments and returns a dict of objects indexed by ID and the
+            meta data, like :meth:`get_events
+            <pyticketswitch.client.Client.get_events>`.
+        window (float): seconds to wait for more lookups after the first one
+            before fetching them. When :obj:`None` lookups are only fetched
+            when :meth:`dispatch` is called or a result is needed.
+
+    Attributes:
+        batches (int): the number of requests made for batches of lookups.
+        lookups (int): the number of lookups made.
+
+    """
+
+    def __init__(self, fetch, window=None):
+        self.fetch = fetch
+        self.window = window
+        self.batches = 0
+        self.lookups = 0
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def load(self, id_, **kwargs):
+        """Look up an ID in the next batch
+
+        Args:
+            id_ (str): the ID to look up.
+            **kwargs: keyword arguments to fetch the ID with.
+
+        Returns:
+            :class:`Lookup`: the pending result.
+
+        """
+        lookup = Lookup(self, id_)
+        key = kwargs_key(kwargs)
+
+        with self._lock:
+            self.lookups += 1
+            _, lookups = self._pending.setdefault(key, (kwargs, []))
+            lookups.append(lookup)
+
+            if self.window is not None and self._timer is None:
+                self._timer = threading.Timer(self.window, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+
+        return lookup
+
+    def dispatch(self):
+        """Fetch all the pending lookups
+
+        One request is made for each distinct set of keyword arguments.
+
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for kwargs, lookups in pending.values():
+            self._fetch_batch(kwargs, lookups)
+
+    def _fetch_batch(self, kwargs, lookups):
+        ids = []
+        for lookup in lookups:
+            if lookup.id not in ids:
+                ids.append(lookup.id)
+        self.batches += 1
+
+        try:
+            objects, meta = self.fetch(ids, **kwargs)
+        except Exception as error:
+            for lookup in lookups:
+                lookup.set_error(error)
+            return
+
+        for lookup in lookups:
+            lookup.set_result((objects.get(lookup.id), meta))
+
+
+class Batch(object):
+    """Collects lookups made through it and fetches them in batches
+
+    Use it as a context manager, pending lookups are fetched on exit.
+    Created by :meth:`Client.batch <pyticketswitch.client.Client.batch>`.
+
+    Args:
+        client (:class:`Client <pyticketswitch.client.Client>`): the client
+            to fetch the lookups with.
+
+    """
+
+    def __init__(self, client):
+        self.events = Loader(client.get_events)
+        self.performances = Loader(client.get_performances)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.dispatch()
+
+    def get_event(self, event_id, **kwargs):
+        """Look up an event in this batch
+
+        Args:
+            event_id (str): ID of the event to retrieve.
+            **kwargs: see :meth:`Client.get_events
+                <pyticketswitch.client.Client.get_events>`.
+
+        Returns:
+            :class:`Lookup`: the pending event and meta data.
+
+        """
+        return self.events.load(event_id, **kwargs)
+
+    def get_performance(self, performance_id, **kwargs):
+        """Look up a performance in this batch
+
+        Args:
+            performance_id (str): ID of the performance to retrieve.
+            **kwargs: see :meth:`Client.get_performances
+                <pyticketswitch.client.Client.get_performances>`.
+
+        Returns:
+            :class:`Lookup`: the pending performance and meta data.
+
+        """
+        return self.performances.load(performance_id, **kwargs)
+
+    def dispatch(self):
+        """Fetch all the pending lookups"""
+        self.events.dispatch()
+        self.performances.dispatch()
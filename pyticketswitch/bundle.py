@@ -46,12 +46,19 @@ class Bundle(JSONMixin, object):
         self.purchase_result = purchase_result
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Bundle object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a bundle.
+            lazy (bool): parse the sub objects of the events and
+                performances in the orders when they are first read, see
+                :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the events in
+                the orders, see :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
 
         Returns:
             :class:`Bundle <pyticketswitch.bundle.Bundle>`: a new
@@ -69,7 +76,10 @@ class Bundle(JSONMixin, object):
 
         raw_orders = data.get('order')
         if raw_orders:
-            orders = [Order.from_api_data(order) for order in raw_orders]
+            orders = [
+                Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
+                for order in raw_orders
+            ]
             kwargs.update(orders=orders)
 
         # Below we are explicital checking for not None because we want to
@@ -0,0 +1,201 @@
+"""An in-process cache for responses from the read only endpoints.
+
+Give a :class:`TTLCache` to the client to avoid going back to the API for
+data it has requested recently::
+
+    >>> from pyticketswitch.cache import TTLCache
+    >>> client = Client('demo', 'demopass', cache=TTLCache(maxsize=500))
+    >>> event, meta = client.get_event('6IF')  # fetched from the API
+    >>> event, meta = client.get_event('6IF')  # served from the cache
+
+Only the decoded response is cached, every call still returns freshly
+constructed objects.
+
+"""
+import collections
+import threading
+
+import six
+
+from pyticketswitch import utils
+
+
+#: Number of seconds responses from each endpoint are cached for by default.
+#: Endpoints that are not listed here are never cached.
+DEFAULT_TTLS = {
+    'events.v1': 60,
+    'events_by_id.v1': 60,
+    'performances.v1': 60,
+    'performances_by_id.v1': 60,
+    'months.v1': 60,
+    'send_methods.v1': 60,
+    'availability.v1': 10,
+}
+
+DEFAULT_MAXSIZE = 1024
+
+#: Parameters that don't change the response and are left out of cache keys.
+IGNORED_PARAMS = ('tsw_session_track_id',)
+
+
+CacheStats = collections.namedtuple(
+    'CacheStats', ['hits', 'misses', 'evictions', 'currsize', 'maxsize'])
+
+
+def make_key(endpoint, params, sub_user=None, language=None,
+             use_decimal=False):
+    """Generate a cache key for a request
+
+    Parameter values are compared as the strings that are sent to the API,
+    so ``{'page_no': 2}`` and ``{'page_no': '2'}`` share the same key.
+
+    Args:
+        endpoint (str): the API endpoint.
+        params (dict): the request parameters.
+        sub_user (str): the sub user making the request.
+        language (str): the language the response is requested in.
+        use_decimal (bool): whether prices are parsed as decimals.
+
+    Returns:
+        tuple: a hashable key.
+
+    """
+    normalised = tuple(sorted(
+        (key, six.text_type(value))
+        for key, value in params.items()
+        if value is not None and key not in IGNORED_PARAMS
+    ))
+    return (endpoint, normalised, sub_user, language, bool(use_decimal))
+
+
+class TTLCache(object):
+    """A thread safe least recently used cache with per endpoint expiry
+
+    Args:
+        maxsize (int): the maximum number of responses to keep. When full the
+            least recently used response is evicted. Defaults to 1024.
+        ttls (dict): seconds to cache responses for, indexed by endpoint.
+            Merged with :data:`DEFAULT_TTLS`, set an endpoint to ``0`` to
+            stop caching it.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        hits (int): number of lookups that found a fresh response.
+        misses (int): number of lookups that didn't.
+        evictions (int): number of responses dropped to make room for new
+            ones.
+
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttls=None, clock=None):
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.clock = clock or utils.monotonic
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def is_cacheable(self, endpoint):
+        """Indicates that responses from the endpoint can be cached
+
+        Args:
+            endpoint (str): the API endpoint.
+
+        Returns:
+            bool: :obj:`True` when the endpoint has a positive TTL.
+
+        """
+        return bool(self.ttls.get(endpoint))
+
+    def get(self, key):
+        """Look up a cached response
+
+        Args:
+            key (tuple): a key generated by :func:`make_key`.
+
+        Returns:
+            the cached response or :obj:`None` when there is no fresh
+            response for the key.
+
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > self.clock():
+                    self._touch(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def get_stale(self, key):
+        """Look up a cached response, even if it has expired
+
+        Expired responses are kept until they are evicted, so that they can
+        be served when the API can't be reached.
+
+        Args:
+            key (tuple): a key generated by :func:`make_key`.
+
+        Returns:
+            the cached response or :obj:`None` when there is no response for
+            the key.
+
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            return entry[1]
+
+    def set(self, key, value):
+        """Add a response to the cache
+
+        Args:
+            key (tuple): a key generated by :func:`make_key`.
+            value: the response to cache.
+
+        """
+        ttl = self.ttls.get(key[0])
+        if not ttl or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (self.clock() + ttl, value)
+            self._touch(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all responses from the cache"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Get the cache statistics
+
+        Returns:
+            :class:`CacheStats`: hits, misses, evictions, current size and
+            maximum size of the cache.
+
+        """
+        return CacheStats(
+            self.hits, self.misses, self.evictions, len(self._data),
+            self.maxsize)
+
+    def _touch(self, key):
+        # mark the key as the most recently used
+        if hasattr(self._data, 'move_to_end'):
+            self._data.move_to_end(key)
+        else:  # pragma: no cover
+            self._data[key] = self._data.pop(key)
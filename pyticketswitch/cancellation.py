@@ -10,15 +10,19 @@ class CancellationResult(JSONMixin):
         self.trolley = trolley
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         kwargs = {
             "cancelled_item_numbers": data.get("cancelled_item_numbers", []),
-            "trolley": Trolley.from_api_data(data),
+            "trolley": Trolley.from_api_data(
+                data, lazy=lazy, keep_raw=keep_raw),
         }
 
         raw_must_also_cancel = data.get("must_also_cancel")
         if raw_must_also_cancel:
-            must_also_cancel = [Order.from_api_data(order) for order in raw_must_also_cancel]
+            must_also_cancel = [
+                Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
+                for order in raw_must_also_cancel
+            ]
             kwargs.update(must_also_cancel=must_also_cancel)
 
         return cls(**kwargs)
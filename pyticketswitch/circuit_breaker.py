@@ -0,0 +1,342 @@
+"""A circuit breaker for the backend ticketing systems.
+
+Every event is sold through a backend system, identified by its
+``source_code``. When one of those systems goes down or is overloaded, calls
+for its events are slow and fail, while calls for every other event are fine.
+Give a :class:`CircuitBreaker` to the client to stop making calls to a
+backend that is known to be failing::
+
+    >>> from pyticketswitch.circuit_breaker import CircuitBreaker
+    >>> client = Client('demo', 'demopass', circuit_breaker=CircuitBreaker())
+
+The breaker opens for a backend as soon as a response says it is down, broken
+or throttling us, or after several calls in a row fail. While it is open,
+calls for that backend's events raise :class:`CircuitOpenError
+<pyticketswitch.exceptions.CircuitOpenError>` straight away, or return a
+stale response when the client has a cache that still holds one. After
+**recovery_timeout** seconds a single trial call is let through, and the
+breaker closes again if it succeeds.
+
+The backend of a call is only known once a response has told us the
+``source_code`` for the event. The event listing and lookup responses tell
+us the backend of every event in them, and performance IDs start with the
+ID of their event, so one response covers every performance of an event.
+
+Calls for several events, such as the event listing and lookups, can span
+several backends. They are never failed fast, and their failures and
+backend flags are not attributed to any backend, because the response
+doesn't say which of the backends was in trouble.
+
+"""
+import logging
+import threading
+
+from pyticketswitch import exceptions, utils
+
+
+logger = logging.getLogger(__name__)
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30
+
+#: response flags that indicate the backend system is in trouble.
+BACKEND_FLAGS = (
+    'backend_is_down',
+    'backend_is_broken',
+    'backend_throttle_failed',
+)
+
+
+def get_event_sources(response):
+    """Get the backend systems of the events in a response
+
+    Args:
+        response (dict): the decoded response of an event listing or lookup.
+
+    Returns:
+        list: ``(event_id, source_code)`` tuples for the events that have
+        both.
+
+    """
+    raw_events = []
+
+    results = response.get('results')
+    if isinstance(results, dict):
+        raw_events.extend(results.get('event') or [])
+
+    for raw_event in (response.get('events_by_id') or {}).values():
+        raw_events.append(raw_event.get('event') or {})
+
+    return [
+        (raw_event.get('event_id'), raw_event.get('source_code'))
+        for raw_event in raw_events
+        if raw_event.get('event_id') and raw_event.get('source_code')
+    ]
+
+
+def get_event_id(call):
+    """Get the ID of the event an API call is about
+
+    Args:
+        call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the call.
+
+    Returns:
+        str: the event ID or :obj:`None` when the call isn't about a single
+        event.
+
+    """
+    event_id = call.params.get('event_id')
+    if event_id:
+        return event_id
+
+    performance_id = call.params.get('perf_id')
+    if performance_id:
+        return performance_id.split('-')[0]
+
+    return None
+
+
+class _Circuit(object):
+    """The state of the circuit for a single backend."""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+
+
+class CircuitBreaker(object):
+    """Stops calls to backend systems that are failing
+
+    Args:
+        failure_threshold (int): the number of failed calls in a row after
+            which the breaker opens. Defaults to 5.
+        recovery_timeout (float): seconds to wait after opening before letting
+            a trial call through. Defaults to 30.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        rejected (int): the number of calls failed fast while open.
+
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout=DEFAULT_RECOVERY_TIMEOUT, clock=None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock or utils.monotonic
+        self.rejected = 0
+        self._circuits = {}
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def learn(self, event_id, source_code):
+        """Remember the backend system that an event is sold through
+
+        Args:
+            event_id (str): the event ID.
+            source_code (str): the code for the backend system.
+
+        """
+        with self._lock:
+            self._sources[event_id] = source_code
+
+    def get_source_code(self, call):
+        """Get the backend system that an API call will go to
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call.
+
+        Returns:
+            str: the source code, or :obj:`None` when it isn't known.
+
+        """
+        event_id = get_event_id(call)
+        if event_id is None:
+            return None
+        return self._sources.get(event_id)
+
+    def get_state(self, source_code):
+        """Get the state of the circuit for a backend system
+
+        Args:
+            source_code (str): the code for the backend system.
+
+        Returns:
+            str: one of ``closed``, ``open`` or ``half-open``.
+
+        """
+        circuit = self._circuits.get(source_code)
+        if circuit is None:
+            return CLOSED
+        return circuit.state
+
+    def before_call(self, source_code):
+        """Check that a call to a backend system may be made
+
+        Args:
+            source_code (str): the code for the backend system, calls to
+                unknown backends are always allowed.
+
+        Raises:
+            CircuitOpenError: when the circuit is open.
+
+        """
+        if source_code is None:
+            return
+
+        with self._lock:
+            circuit = self._circuits.get(source_code)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            # once the recovery timeout has passed let a single trial call
+            # through, and another one if that never reported back.
+            waited = self.clock() - circuit.opened_at
+            if circuit.state == OPEN and waited >= self.recovery_timeout:
+                circuit.state = HALF_OPEN
+                circuit.trial_in_progress = False
+
+            if circuit.state == HALF_OPEN:
+                if not circuit.trial_in_progress or \
+                        waited >= self.recovery_timeout:
+                    circuit.trial_in_progress = True
+                    circuit.opened_at = self.clock()
+                    return
+
+            self.rejected += 1
+
+        raise exceptions.CircuitOpenError(
+            'circuit for backend {} is open'.format(source_code),
+            source_code=source_code,
+        )
+
+    def record_response(self, call, response):
+        """Update the circuit from a successful response
+
+        Opens the circuit when the response says the backend system is down,
+        broken or throttling, and closes it otherwise. Also learns the
+        backend of every event listed in the response, see
+        :func:`get_event_sources`.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call that was made.
+            response (dict): the decoded response.
+
+        """
+        event_sources = get_event_sources(response)
+        if event_sources:
+            with self._lock:
+                self._sources.update(event_sources)
+
+        source_code = response.get('source_code')
+        event_id = get_event_id(call)
+        if source_code and event_id:
+            self.learn(event_id, source_code)
+        else:
+            source_code = self.get_source_code(call)
+
+        if source_code is None:
+            return
+
+        if any(response.get(flag) for flag in BACKEND_FLAGS):
+            self.trip(source_code)
+        else:
+            self.record_success(source_code)
+
+    def record_error(self, call, error, transient_errors=()):
+        """Update the circuit from a failed call
+
+        Only errors that suggest the backend is in trouble, such as timeouts
+        and server errors, count as failures. Other errors, such as a bad
+        parameter, are the caller's fault and say nothing about the backend,
+        so the circuit is left as it is. A trial call that fails that way
+        lets the next call be the trial.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call that was made.
+            error (Exception): the error raised by the call.
+            transient_errors (tuple): transport specific exception types
+                for dropped connections and timeouts.
+
+        """
+        source_code = self.get_source_code(call)
+        if source_code is None:
+            return
+
+        if isinstance(error, exceptions.InvalidResponseError):
+            failed = (error.status_code or 0) >= 500
+        else:
+            failed = isinstance(
+                error, (exceptions.BackendError,) + tuple(transient_errors))
+
+        if failed:
+            self.record_failure(source_code)
+            return
+
+        with self._lock:
+            circuit = self._circuits.get(source_code)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.trial_in_progress = False
+
+    def record_success(self, source_code):
+        """Close the circuit for a backend system
+
+        Args:
+            source_code (str): the code for the backend system.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(source_code)
+            if circuit is None:
+                return
+            if circuit.state != CLOSED:
+                logger.info(u'circuit for backend %s closed', source_code)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.trial_in_progress = False
+
+    def record_failure(self, source_code):
+        """Count a failed call to a backend system
+
+        The circuit opens once there have been **failure_threshold**
+        failures in a row, or straight away if a trial call fails.
+
+        Args:
+            source_code (str): the code for the backend system.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(source_code, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or \
+                    circuit.failures >= self.failure_threshold:
+                self._open(source_code, circuit)
+
+    def trip(self, source_code):
+        """Open the circuit for a backend system
+
+        Args:
+            source_code (str): the code for the backend system.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(source_code, _Circuit())
+            self._open(source_code, circuit)
+
+    def _open(self, source_code, circuit):
+        if circuit.state != OPEN:
+            logger.warning(u'circuit for backend %s opened', source_code)
+        circuit.state = OPEN
+        circuit.opened_at = self.clock()
+        circuit.trial_in_progress = False
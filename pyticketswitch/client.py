@@ -1,30 +1,31 @@
-import decimal
+import collections
+import functools
 import requests
 import logging
 import six
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
 import pyticketswitch
-from pyticketswitch import exceptions, utils
-from pyticketswitch.availability import AvailabilityMeta
-from pyticketswitch.callout import Callout
-from pyticketswitch.cancellation import CancellationResult
-from pyticketswitch.currency import CurrencyMeta
-from pyticketswitch.discount import Discount
-from pyticketswitch.event import Event, EventMeta
-from pyticketswitch.month import Month
-from pyticketswitch.performance import Performance, PerformanceMeta
-from pyticketswitch.reservation import Reservation
-from pyticketswitch.send_method import SendMethod
-from pyticketswitch.status import Status
-from pyticketswitch.ticket_type import TicketType
-from pyticketswitch.trolley import Trolley
-from pyticketswitch.user import User
+from pyticketswitch import (
+    cache as response_cache, deadline as deadlines, decoding, endpoints,
+    exceptions, streaming, utils)
+from pyticketswitch.batching import Batch, Loader
+from pyticketswitch.coalescing import SingleFlight
+from pyticketswitch.endpoints import GET, POST
+from pyticketswitch.event import Event
+from pyticketswitch.mixins import check_keep_raw
 
 
 logger = logging.getLogger(__name__)
 
-POST = 'post'
-GET = 'get'
 DEFAULT_ROOT_URL = "https://api.ticketswitch.com"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_ID_CHUNK_SIZE = 100
+DEFAULT_PAGE_LENGTH = 50
 
 
 class Client(object):
@@ -50,13 +51,91 @@ class Client(object):
         tracking_id (:obj:`str`, optional): a tracking ID to use with requests
         use_decimal (bool): parse JSON numbers as decimal. Default is `False`
             but this use is deprecated and decimals are recommended.
+        keep_alive (bool): when :obj:`True` the client keeps a pool of
+            persistent connections that is shared by every thread using the
+            client, instead of opening a new connection for every request.
+            Call :meth:`close <pyticketswitch.client.Client.close>` (or use
+            the client as a context manager) to release the connections.
+            Defaults to :obj:`False`.
+        pool_connections (int): the number of per host connection pools to
+            cache when **keep_alive** is enabled. Defaults to 10.
+        pool_maxsize (int): the maximum number of connections kept open to
+            a single host when **keep_alive** is enabled. This should be at
+            least the number of threads that will share the client.
+            Defaults to 10.
+        id_chunk_size (int): the maximum number of IDs to send in a single
+            request from :meth:`get_events
+            <pyticketswitch.client.Client.get_events>` and
+            :meth:`get_performances
+            <pyticketswitch.client.Client.get_performances>`. Longer lists of
+            IDs are split up and fetched in parallel. :obj:`None` disables
+            the splitting. Defaults to 100.
+        cache (:class:`TTLCache <pyticketswitch.cache.TTLCache>`): cache
+            responses from the read only endpoints. Defaults to :obj:`None`,
+            which disables caching.
+        coalesce (bool): when :obj:`True` identical read only requests made
+            at the same time share a single request to the API. Defaults to
+            :obj:`False`.
+        batch_window (float): when set, :meth:`get_event
+            <pyticketswitch.client.Client.get_event>` and
+            :meth:`get_performance
+            <pyticketswitch.client.Client.get_performance>` wait this many
+            seconds for lookups from other threads and fetch them all with
+            one request. Defaults to :obj:`None`, which disables batching.
+        retry (:class:`RetryPolicy <pyticketswitch.retry.RetryPolicy>`):
+            retry idempotent requests that fail for transient reasons.
+            Defaults to :obj:`None`, which disables retries.
+        circuit_breaker (:class:`CircuitBreaker
+            <pyticketswitch.circuit_breaker.CircuitBreaker>`): fail fast on
+            calls to backend systems that are down or failing. Defaults to
+            :obj:`None`.
+        rate_limiter (:class:`RateLimiter
+            <pyticketswitch.rate_limit.RateLimiter>`): limit the rate of
+            requests per endpoint and sub user, adapting to throttling by the
+            API. Defaults to :obj:`None`.
+        hedge (:class:`HedgePolicy <pyticketswitch.hedging.HedgePolicy>`):
+            send a second request for slow read only calls and use the
+            response that comes back first. Defaults to :obj:`None`.
+        concurrency_limiter (:class:`ConcurrencyLimiter
+            <pyticketswitch.concurrency.ConcurrencyLimiter>`): limit the
+            number of requests in flight at once, share one between clients
+            to give them a single budget. Defaults to :obj:`None`.
+        timeout (float): seconds to wait for each request, when there is a
+            :meth:`deadline <pyticketswitch.client.Client.deadline>` the time
+            left before it is used when shorter. Defaults to :obj:`None`, for
+            no timeout.
+        lazy_models (bool): when :obj:`True` the pricing, content, media,
+            reviews, availability details and component events of events
+            and performances are parsed the first time they are read rather
+            than when the response is parsed, which is much cheaper when
+            only a few of them are used. Applies to the same events as
+            **keep_raw**, and to performances. Defaults to :obj:`False`.
+        keep_raw (bool, str): how events keep the API data they were created
+            from as their **raw** attribute. :obj:`True`, the default, keeps
+            it as it is, :obj:`False` drops it so **raw** is :obj:`None`, and
+            ``'compact'`` keeps a serialised copy that takes about a sixth of
+            the memory and is decoded each time **raw** is read. Any other
+            value raises :exc:`ValueError`.
+            :class:`Event <pyticketswitch.event.Event>` is the only model
+            with a **raw** attribute. The setting applies to every event
+            the client returns: those from the event listing, lookup, upsell
+            and add-on calls, their component, add-on and upsell events, and
+            the events in the orders of trolleys, reservations, statuses,
+            purchases and cancellations.
         **kwargs: Additional arbitrary key word arguments to keep with the
             object.
 
     """
 
     def __init__(self, user, password, url=DEFAULT_ROOT_URL, sub_user=None,
-                 language=None, tracking_id=None, use_decimal=False, **kwargs):
+                 language=None, tracking_id=None, use_decimal=False,
+                 keep_alive=False, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 id_chunk_size=DEFAULT_ID_CHUNK_SIZE, cache=None,
+                 coalesce=False, batch_window=None, retry=None,
+                 circuit_breaker=None, rate_limiter=None, hedge=None,
+                 concurrency_limiter=None, timeout=None, lazy_models=False,
+                 keep_raw=True, **kwargs):
         self.user = user
         self.password = password
         self.url = url
@@ -64,8 +143,40 @@ class Client(object):
         self.language = language
         self.tracking_id = tracking_id
         self.use_decimal = use_decimal
+        self.keep_alive = keep_alive
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.id_chunk_size = id_chunk_size
+        self.cache = cache
+        self.single_flight = self.make_single_flight() if coalesce else None
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.concurrency_limiter = concurrency_limiter
+        self.timeout = timeout
+        self.lazy_models = lazy_models
+        check_keep_raw(keep_raw)
+        self.keep_raw = keep_raw
+        self.batch_window = batch_window
+        self.event_loader = None
+        self.performance_loader = None
+        if batch_window is not None:
+            self.event_loader = self.make_loader(self.get_events)
+            self.performance_loader = self.make_loader(self.get_performances)
         self.kwargs = kwargs
 
+        self._adapter = None
+        self._adapter_lock = threading.Lock()
+        self._hedge_executor = None
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def get_url(self, end_point):
         """Get the url for a given endpoint
 
@@ -172,6 +283,42 @@ class Client(object):
             return {"tsw_session_track_id": tracking_id}
         return {}
 
+    def get_adapter(self):
+        """Get the transport adapter shared by all pooled sessions
+
+        The adapter owns the connection pool, and is created on first use.
+        It is shared between every thread using this client, so connections
+        opened by one thread can be reused by another.
+
+        Returns:
+            :class:`requests.adapters.HTTPAdapter`: the shared adapter.
+
+        """
+        with self._adapter_lock:
+            if self._adapter is None:
+                self._adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                )
+            return self._adapter
+
+    def get_hedge_executor(self):
+        """Get the thread pool that hedged requests are made on
+
+        The pool is created on first use and shared by every hedged call.
+        It has two threads for each pooled connection, enough for the first
+        and the second request of **pool_maxsize** concurrent calls.
+
+        Returns:
+            :class:`concurrent.futures.ThreadPoolExecutor`: the shared pool.
+
+        """
+        with self._adapter_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * max(1, self.pool_maxsize))
+            return self._hedge_executor
+
     def get_session(self):
         """Get the requests.Session instance to use to make HTTP requests
 
@@ -179,28 +326,65 @@ class Client(object):
         replicates the default behaviour of the requests library:
         https://github.com/kennethreitz/requests/blob/ead8fba84b12e7496c65272a07de47d553aa0ca0/requests/api.py#L57-L58
 
-        A common modification to this class would be to overload this method to
-        provide a single session instance across all calls to take advantage of
-        keep-alive.
+        When the client was created with ``keep_alive=True`` each thread gets
+        its own long lived session, and all of those sessions share a single
+        connection pool (see
+        :meth:`get_adapter <pyticketswitch.client.Client.get_adapter>`), so
+        connections are kept alive and reused across calls and threads.
 
-        .. note:: remember to also overload
+        .. note:: if you overload this method to provide your own persistent
+                  session remember to also overload
                   :meth:`cleanup_session <pyticketswitch.client.Client.cleanup_session>`
                   as well or you connections/session might be unexpectedly killed.
         """
-        return requests.Session()
+        if not self.keep_alive:
+            return requests.Session()
+
+        adapter = self.get_adapter()
+        session = getattr(self._local, 'session', None)
+        if session is None or session.get_adapter(self.url) is not adapter:
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._local.session = session
+        return session
 
     def cleanup_session(self, session):
         """Cleans up sessions so that we don't leave open sockets.
 
-        If you want to add support for persistent connections, then you should
-        noop this method so it does nothing.
+        When the client was created with ``keep_alive=True`` this does nothing,
+        the connections are released by
+        :meth:`close <pyticketswitch.client.Client.close>` instead.
 
         Args:
             session (:class:`requests.Session`): the http session to clean up.
         """
+        if self.keep_alive:
+            return
+
         logger.debug('requests session cleaning up')
         session.close()
 
+    def close(self):
+        """Close any persistent connections held by the client.
+
+        Also shuts down the thread pool used for hedged requests, without
+        waiting for slow requests that have already been dropped.
+
+        The client can still be used after it has been closed, a new
+        connection pool will be created by the next request.
+        """
+        with self._adapter_lock:
+            adapter, self._adapter = self._adapter, None
+            executor, self._hedge_executor = self._hedge_executor, None
+
+        if adapter is not None:
+            logger.debug('closing pooled connections')
+            adapter.close()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
     def make_request(self, endpoint, params, method=GET, headers={}, timeout=None):
         """Makes actual requests to the API
 
@@ -241,54 +425,505 @@ class Client(object):
         else:
             response = session.get(url, auth=auth, params=params, headers=raw_headers, timeout=timeout)
 
-        logger.debug(six.u(response.content))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(six.u(response.content))
 
         self.cleanup_session(session)
 
-        parse_float = decimal.Decimal if self.use_decimal else float
+        contents = endpoints.decode_response(
+            endpoint,
+            response.status_code,
+            lambda: decoding.loads(response.content, self.use_decimal),
+        )
 
-        try:
-            contents = response.json(parse_float=parse_float)
-        except ValueError:
-            raise exceptions.InvalidResponseError(
-                ("Unable to parse json data from {} response with status "
-                 "code `{}`").format(
-                    endpoint,
-                    response.status_code,
-                )
-            )
+        return endpoints.check_response(
+            endpoint, response.status_code, contents, response)
 
-        if 'error_code' in contents:
+    def make_streaming_request(self, endpoint, params, path, parse_item,
+                               parse_rest, headers={}, timeout=None,
+                               chunk_size=streaming.DEFAULT_CHUNK_SIZE):
+        """Makes a GET request to the API and parses the response as it is
+        downloaded
 
-            if contents['error_code'] == 3:
-                raise exceptions.AuthenticationError(
-                    contents['error_desc'],
-                    contents['error_code'],
-                    response,
-                )
+        Args:
+            endpoint (str): target API endpoint
+            params (dict): parameters to provide to requests
+            path (tuple): the keys leading to the list or dict of items in
+                the response.
+            parse_item (callable): takes a decoded item and returns the
+                object, or :obj:`None` to skip it.
+            parse_rest (callable): takes the rest of the decoded response,
+                once every item has been read, and returns the meta data.
+            headers (dict): headers to include with the request
+            timeout (int): timeout to include with the request. Defaults to
+                ``None``.
+            chunk_size (int): the number of bytes to read at a time.
 
-            if response.status_code == 410:
-                raise exceptions.CallbackGoneError(
-                    contents['error_desc'],
-                    contents['error_code'],
-                    response,
-                )
+        Returns:
+            :class:`ResultStream <pyticketswitch.streaming.ResultStream>`:
+            iterate over it for the objects.
 
-            raise exceptions.APIError(
-                contents['error_desc'],
-                contents['error_code'],
-                response,
-            )
+        Raises:
+            AuthenticationError: When authentication details provided are
+                invalid
+            InvalidResponseError: When the status code of the response is not
+                200
+            APIError: When any other explict errors are returned from the API
 
-        if response.status_code != 200:
-            raise exceptions.InvalidResponseError(
-                "got status code `{}` from {}".format(
-                    response.status_code,
-                    endpoint,
-                )
+        """
+        url = self.get_url(endpoint)
+        params.update(self.get_extra_params())
+        if not params.get('tsw_session_track_id'):
+            params.update(self.get_tracking_params())
+
+        logger.debug(u'url: %s; endpoint: %s; params: %s', self.url, endpoint, params)
+
+        session = self.get_session()
+        response = session.get(
+            url, auth=self.get_auth(), params=params,
+            headers=self.get_headers(headers), timeout=timeout, stream=True)
+
+        def finish(rest):
+            contents = endpoints.decode_response(
+                endpoint,
+                response.status_code,
+                lambda: decoding.loads(rest, self.use_decimal),
             )
+            endpoints.check_response(
+                endpoint, response.status_code, contents, response)
+            return parse_rest(contents)
+
+        def close():
+            response.close()
+            self.cleanup_session(session)
+
+        return streaming.ResultStream(
+            response.iter_content(chunk_size), path, parse_item, finish,
+            use_decimal=self.use_decimal, close=close)
+
+    def stream(self, call, path, parse_item):
+        """Make the request described by an API call and parse the items of
+        its response as they are downloaded
+
+        The request bypasses the cache, coalescing, retries, hedging, circuit
+        breaker and rate limiter.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+            path (tuple): the keys leading to the list or dict of items in
+                the response.
+            parse_item (callable): takes a decoded item and returns the
+                object, or :obj:`None` to skip it.
+
+        Returns:
+            :class:`ResultStream <pyticketswitch.streaming.ResultStream>`:
+            iterate over it for the objects, its **meta** is the meta data
+            the call returns.
+
+        """
+        return self.make_streaming_request(
+            call.endpoint, call.params, path, parse_item,
+            lambda contents: call.parse(contents)[1],
+            **self.get_request_kwargs())
+
+    def execute(self, call):
+        """Make the request described by an API call and parse the response
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            the result of the call, as returned by
+            :meth:`APICall.parse <pyticketswitch.endpoints.APICall.parse>`.
+
+        """
+        cache_key = self.get_cache_key(call)
+        if cache_key is not None:
+            response = self.cache.get(cache_key)
+            if response is not None:
+                return call.parse(response)
+
+        coalescing_key = self.get_coalescing_key(call)
+        try:
+            if coalescing_key is not None:
+                response = self.single_flight.do(
+                    coalescing_key, lambda: self.send_through_circuit(call))
+            else:
+                response = self.send_through_circuit(call)
+        except exceptions.CircuitOpenError:
+            response = self.get_stale_response(cache_key)
+            if response is None:
+                raise
+            return call.parse(response)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+
+        return call.parse(response)
+
+    def send_through_circuit(self, call):
+        """Make the request unless the circuit for its backend is open
+
+        Without a **circuit_breaker** this is the same as
+        :meth:`send_with_retry <pyticketswitch.client.Client.send_with_retry>`.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the decoded response.
+
+        Raises:
+            CircuitOpenError: when the circuit for the call's backend system
+                is open.
+
+        """
+        if self.circuit_breaker is None:
+            return self.send_with_retry(call)
+
+        self.circuit_breaker.before_call(
+            self.circuit_breaker.get_source_code(call))
+
+        try:
+            response = self.send_with_retry(call)
+        except Exception as error:
+            self.circuit_breaker.record_error(
+                call, error, transient_errors=self.get_transient_errors())
+            raise
+
+        self.circuit_breaker.record_response(call, response)
+        return response
+
+    def get_stale_response(self, cache_key):
+        """Get an expired response from the cache
+
+        Args:
+            cache_key (tuple): the key returned by :meth:`get_cache_key
+                <pyticketswitch.client.Client.get_cache_key>`.
+
+        Returns:
+            dict: the response, or :obj:`None` when there isn't one.
+
+        """
+        if cache_key is None:
+            return None
+        return self.cache.get_stale(cache_key)
+
+    def send(self, call):
+        """Make the request described by an API call
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the decoded response.
+
+        Raises:
+            DeadlineExceededError: when the current deadline has passed.
+
+        """
+        kwargs = self.get_request_kwargs()
+        if call.method == POST:
+            return self.make_request(
+                call.endpoint, call.params, method=POST, **kwargs)
+        return self.make_request(call.endpoint, call.params, **kwargs)
+
+    def get_request_kwargs(self):
+        """Get extra keyword arguments for :meth:`make_request
+        <pyticketswitch.client.Client.make_request>`
+
+        Returns:
+            dict: the timeout for the request, when there is one.
+
+        Raises:
+            DeadlineExceededError: when the current deadline has passed.
+
+        """
+        timeout = deadlines.get_timeout(self.timeout)
+        if timeout is None:
+            return {}
+        return {'timeout': timeout}
+
+    def deadline(self, seconds):
+        """Bound the time taken by all the calls made in a block
+
+        Every request made inside the block is given the time that is left
+        as its timeout, and once the time is up no more requests are made::
+
+            >>> with client.deadline(10):
+            ...     trolley, meta = client.get_trolley(...)
+            ...     reservation, meta = client.make_reservation(...)
+
+        Args:
+            seconds (float): the time allowed for the whole block.
+
+        Returns:
+            :class:`Deadline <pyticketswitch.deadline.Deadline>`: a context
+            manager.
+
+        """
+        return deadlines.Deadline(seconds)
+
+    def send_with_retry(self, call):
+        """Make the request described by an API call, retrying on failure
+
+        Requests are only retried when the client has a **retry** policy and
+        it allows it, see :class:`RetryPolicy
+        <pyticketswitch.retry.RetryPolicy>`.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the decoded response.
+
+        """
+        if self.retry is None:
+            return self.send_hedged(call)
+
+        started = self.retry.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self.send_hedged(call)
+            except Exception as error:
+                delay = self.retry.get_delay(
+                    call, error, attempt, started,
+                    transient_errors=self.get_transient_errors())
+                if delay is None or not deadlines.allows(delay):
+                    raise
+            time.sleep(delay)
+
+    def send_hedged(self, call):
+        """Make the request, and a second one if the first is slow
+
+        Without a **hedge** policy, or for calls it doesn't allow, this is
+        the same as :meth:`send_rate_limited
+        <pyticketswitch.client.Client.send_rate_limited>`. The slower request
+        can't be interrupted, it runs to completion on a thread from
+        :meth:`get_hedge_executor
+        <pyticketswitch.client.Client.get_hedge_executor>` and its response
+        is dropped.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the first successful response.
+
+        Raises:
+            Exception: the error from the first request when neither request
+                succeeded.
+
+        """
+        if self.hedge is None or not self.hedge.is_hedgeable(call):
+            return self.send_rate_limited(call)
+
+        def attempt():
+            started = self.hedge.clock()
+            response = self.send_rate_limited(call)
+            self.hedge.record(call.endpoint, self.hedge.clock() - started)
+            return response
+
+        delay = self.hedge.get_delay(call.endpoint)
+        if delay is None or not deadlines.allows(delay):
+            return attempt()
+
+        attempt = deadlines.bind(attempt)
+        executor = self.get_hedge_executor()
+        futures = [executor.submit(attempt)]
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            self.hedge.record_hedge()
+            futures.append(executor.submit(attempt))
+
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for index, future in enumerate(futures):
+                if future not in done:
+                    continue
+                if future.exception() is None:
+                    if index:
+                        self.hedge.record_win()
+                    return future.result()
+                if error is None:
+                    error = future.exception()
+        raise error
+
+    def send_rate_limited(self, call):
+        """Make the request once the rate limiter allows it
+
+        Without a **rate_limiter** this is the same as :meth:`send_in_slot
+        <pyticketswitch.client.Client.send_in_slot>`.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the decoded response.
+
+        """
+        if self.rate_limiter is None:
+            return self.send_in_slot(call)
+
+        delay = self.rate_limiter.acquire(call.endpoint, self.sub_user)
+        if delay > 0:
+            if not deadlines.allows(delay):
+                raise exceptions.DeadlineExceededError(
+                    'deadline passes before {} can be sent'.format(
+                        call.endpoint))
+            time.sleep(delay)
+
+        try:
+            response = self.send_in_slot(call)
+        except Exception as error:
+            self.rate_limiter.record_error(call.endpoint, self.sub_user, error)
+            raise
+
+        self.rate_limiter.record_response(
+            call.endpoint, self.sub_user, response)
+        return response
+
+    def send_in_slot(self, call):
+        """Make the request once the concurrency limiter has a free slot
+
+        Without a **concurrency_limiter** this is the same as :meth:`send
+        <pyticketswitch.client.Client.send>`.
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            dict: the decoded response.
+
+        Raises:
+            ClientOverloadedError: when too many requests are already waiting
+                for a slot.
+            DeadlineExceededError: when the current deadline passes before a
+                slot is free.
 
-        return contents
+        """
+        if self.concurrency_limiter is None:
+            return self.send(call)
+
+        with self.concurrency_limiter.slot(
+                call.endpoint, timeout=deadlines.get_timeout()):
+            return self.send(call)
+
+    def get_transient_errors(self):
+        """Get the transport errors that are worth retrying
+
+        Returns:
+            tuple: exception types raised for dropped connections and
+            timeouts.
+
+        """
+        return (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        )
+
+    def make_single_flight(self):
+        """Create the object used to coalesce identical requests
+
+        Returns:
+            :class:`SingleFlight <pyticketswitch.coalescing.SingleFlight>`
+
+        """
+        return SingleFlight()
+
+    def make_loader(self, fetch):
+        """Create an object that batches up single ID lookups
+
+        Args:
+            fetch (callable): the method that fetches many IDs at once.
+
+        Returns:
+            :class:`Loader <pyticketswitch.batching.Loader>`
+
+        """
+        return Loader(fetch, window=self.batch_window)
+
+    def batch(self):
+        """Collect event and performance lookups to fetch them together
+
+        Lookups made through the returned batch are fetched with one request
+        per type when the batch is exited, or as soon as one of their results
+        is needed::
+
+            >>> with client.batch() as batch:
+            ...     lookups = [batch.get_event(event_id) for event_id in ids]
+            >>> event, meta = lookups[0].result()
+
+        Returns:
+            :class:`Batch <pyticketswitch.batching.Batch>`: the batch.
+
+        """
+        return Batch(self)
+
+    def get_request_key(self, call):
+        """Get a key that identifies the response to a read only API call
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            tuple: the key, or :obj:`None` when the call is not read only.
+
+        """
+        if call.method != GET:
+            return None
+
+        if call.endpoint not in endpoints.READ_ONLY_ENDPOINTS:
+            return None
+
+        return response_cache.make_key(
+            call.endpoint, call.params, sub_user=self.sub_user,
+            language=self.language, use_decimal=self.use_decimal)
+
+    def get_coalescing_key(self, call):
+        """Get the key to coalesce identical concurrent API calls with
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            tuple: the key, or :obj:`None` when coalescing is disabled or
+            the call is not read only.
+
+        """
+        if self.single_flight is None:
+            return None
+        return self.get_request_key(call)
+
+    def get_cache_key(self, call):
+        """Get the key to cache the response to an API call with
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call to make.
+
+        Returns:
+            tuple: the cache key, or :obj:`None` when there is no cache or the
+            response can't be cached.
+
+        """
+        if self.cache is None or not self.cache.is_cacheable(call.endpoint):
+            return None
+        return self.get_request_key(call)
 
     def test(self):
         """Test the connection
@@ -307,11 +942,8 @@ class Client(object):
         .. _`/f13/test.v1`: http://docs.ingresso.co.uk/#test
 
         """
-        response = self.make_request('test.v1', {})
 
-        user = User.from_api_data(response)
-
-        return user
+        return self.execute(endpoints.test())
 
     def add_optional_kwargs(self, params, availability=False,
                             availability_with_performances=False,
@@ -376,66 +1008,19 @@ class Client(object):
                 request.
         """
 
-        if extra_info:
-            params.update(req_extra_info=True)
-
-        if reviews:
-            params.update(req_reviews=True)
-
-        if media:
-            params.update({
-                'req_media_triplet_one': True,
-                'req_media_triplet_two': True,
-                'req_media_triplet_three': True,
-                'req_media_triplet_four': True,
-                'req_media_triplet_five': True,
-                'req_media_seating_plan': True,
-                'req_media_square': True,
-                'req_media_landscape': True,
-                'req_media_marquee': True,
-                'req_video_iframe': True,
-            })
-
-        if cost_range:
-            params.update(req_cost_range=True)
-
-        if best_value_offer:
-            params.update(req_cost_range_best_value_offer=True,
-                          req_cost_range=True)
-
-        if max_saving_offer:
-            params.update(req_cost_range_max_saving_offer=True,
-                          req_cost_range=True)
-
-        if min_cost_offer:
-            params.update(req_cost_range_min_cost_offer=True,
-                          req_cost_range=True)
-
-        if top_price_offer:
-            params.update(req_cost_range_top_price_offer=True,
-                          req_cost_range=True)
-
-        if no_singles_data:
-            params.update(req_cost_range_no_singles_data=True,
-                          req_cost_range=True)
-
-        if cost_range_details:
-            params.update(req_cost_range_details=True)
-
-        if availability:
-            params.update(req_avail_details=True)
-
-        if availability_with_performances:
-            params.update(req_avail_details=True,
-                          req_avail_details_with_perfs=True)
-
         if tracking_id:
             params.update(self.get_tracking_params(
                 custom_tracking_id=tracking_id))
 
-        if source_info:
-            params.update(req_src_info=True)
-        params.update(kwargs)
+        endpoints.add_optional_kwargs(
+            params, availability=availability,
+            availability_with_performances=availability_with_performances,
+            extra_info=extra_info, reviews=reviews, media=media,
+            cost_range=cost_range, best_value_offer=best_value_offer,
+            max_saving_offer=max_saving_offer, min_cost_offer=min_cost_offer,
+            top_price_offer=top_price_offer, no_singles_data=no_singles_data,
+            cost_range_details=cost_range_details, source_info=source_info,
+            **kwargs)
 
     def list_events(self, keywords=None, start_date=None, end_date=None,
                     country_code=None, city_code=None, latitude=None,
@@ -502,67 +1087,110 @@ class Client(object):
 
         """
 
-        params = {}
+        call = endpoints.list_events(
+            keywords=keywords, start_date=start_date, end_date=end_date,
+            country_code=country_code, city_code=city_code,
+            latitude=latitude, longitude=longitude, radius=radius,
+            include_dead=include_dead, sort_order=sort_order, page=page,
+            page_length=page_length, lazy=self.lazy_models,
+            keep_raw=self.keep_raw,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
 
-        if keywords:
-            params.update(keywords=','.join(keywords))
+    def iter_events(self, page=0, page_length=DEFAULT_PAGE_LENGTH, prefetch=1,
+                    concurrent=False, max_workers=DEFAULT_MAX_WORKERS,
+                    **kwargs):
+        """Iterate over all the events matching the given parameters
 
-        if start_date or end_date:
-            params.update(date_range=utils.date_range_str(start_date, end_date))
+        Pages through `/f13/events.v1`_, yielding the events of each page as
+        soon as it has been parsed while the following pages are fetched in
+        the background::
 
-        if country_code:
-            params.update(country_code=country_code)
+            >>> for event in client.iter_events(city_code='london-uk'):
+            ...     print(event.description)
 
-        if city_code:
-            params.update(city_code=city_code)
+        Args:
+            page (int): the page to start from.
+            page_length (int): how many events are requested per page.
+                Defaults to 50.
+            prefetch (int): how many pages to fetch ahead of the page being
+                iterated over. Defaults to 1.
+            concurrent (bool): when :obj:`True` all the remaining pages are
+                requested as soon as the first page tells us how many there
+                are, instead of **prefetch** pages at a time. Defaults to
+                :obj:`False`.
+            max_workers (int): the maximum number of pages to request at the
+                same time. Defaults to 10.
+            **kwargs: accepts the same arguments as :meth:`list_events
+                <pyticketswitch.client.Client.list_events>`.
 
-        if all([latitude, longitude, radius]):
-            params.update(circle='{lat}:{lon}:{rad}'.format(
-                lat=latitude,
-                lon=longitude,
-                rad=radius,
-            ))
-        elif any([latitude, longitude, radius]):
-            raise exceptions.InvalidGeoParameters(
-                'Geo data must include latitude, longitude, and radius',
-            )
+        Yields:
+            :class:`Event <pyticketswitch.event.Event>`: the events in the
+            order the API returns them.
 
-        if include_dead:
-            params.update(include_dead=True)
+        Raises:
+            InvalidResponse: when a response is in an unexpected format
 
-        if sort_order:
-            params.update(sort_order=sort_order)
+        .. _`/f13/events.v1`: http://docs.ingresso.co.uk/#events-list
 
-        if page > 0:
-            params.update(page_no=page)
-        if page_length > 0:
-            params.update(page_len=page_length)
+        """
 
-        self.add_optional_kwargs(params, **kwargs)
+        def fetch(page_number):
+            return self.list_events(
+                page=page_number, page_length=page_length, **kwargs)
 
-        response = self.make_request('events.v1', params)
+        return self._iter_pages(
+            fetch, deadlines.get_current(), page, prefetch, concurrent,
+            max_workers)
 
-        if 'results' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no results key in json response"
-            )
+    def stream_events(self, **kwargs):
+        """List events, parsing them as the response is downloaded
 
-        result = response.get('results', {})
-        raw_events = result.get('event', [])
-        events = [
-            Event.from_api_data(data)
-            for data in raw_events
-        ]
+        Wraps `/f13/events.v1`_
 
-        meta = EventMeta.from_api_data(response)
-        return events, meta
+        Each event is yielded as soon as it has arrived, so large pages can
+        be processed without holding the whole response in memory::
 
-    def get_events(self, event_ids,
-                   with_addons=False, with_upsells=False, **kwargs):
-        """Get events with the given id's
+            >>> stream = client.stream_events(page_length=1000)
+            >>> for event in stream:
+            ...     print(event.description)
+            >>> stream.meta.total_results
+
+        Args:
+            **kwargs: accepts the same arguments as :meth:`list_events
+                <pyticketswitch.client.Client.list_events>`.
+
+        Returns:
+            :class:`ResultStream <pyticketswitch.streaming.ResultStream>`:
+            iterate over it for the :class:`Events
+            <pyticketswitch.event.Event>`, its **meta** is set to the
+            :class:`EventMeta <pyticketswitch.event.EventMeta>` once they have
+            all been read.
+
+        Raises:
+            InvalidResponse: when the response is in an unexpected format
+
+        .. _`/f13/events.v1`: http://docs.ingresso.co.uk/#events-list
+
+        """
+        return self.stream(
+            endpoints.list_events(
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs),
+            endpoints.EVENTS_PATH,
+            functools.partial(
+                Event.from_api_data, lazy=self.lazy_models,
+                keep_raw=self.keep_raw))
+
+    def stream_events_by_id(self, event_ids, with_addons=False,
+                            with_upsells=False, **kwargs):
+        """Get events with the given id's, parsing them as the response is
+        downloaded
 
         Wraps `/f13/events_by_id.v1`_
 
+        Unlike :meth:`get_events <pyticketswitch.client.Client.get_events>`
+        the IDs are all requested at once.
+
         Args:
             event_ids (list): list of event IDs
             with_addons (bool): include add-on events
@@ -571,9 +1199,11 @@ class Client(object):
                 for more info.
 
         Returns:
-            dict, :class:`EventMeta <pyticketswitch.event.EventMeta>`:
-            :class:`Events <pyticketswitch.event.Event>` indexed by event
-            ID and meta information for those events.
+            :class:`ResultStream <pyticketswitch.streaming.ResultStream>`:
+            iterate over it for the :class:`Events
+            <pyticketswitch.event.Event>` that exist, its **meta** is set to
+            the :class:`EventMeta <pyticketswitch.event.EventMeta>` once they
+            have all been read.
 
         Raises:
             InvalidResponse: when the response is in an unexpected format
@@ -581,35 +1211,55 @@ class Client(object):
         .. _`/f13/events_by_id.v1`: http://docs.ingresso.co.uk/#events-by-id
 
         """
-        params = {}
+        call = endpoints.get_events(
+            event_ids, with_addons=with_addons, with_upsells=with_upsells,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.stream(
+            call, endpoints.EVENTS_BY_ID_PATH,
+            functools.partial(
+                endpoints.parse_event_by_id, lazy=self.lazy_models,
+                keep_raw=self.keep_raw))
+
+    def get_events(self, event_ids, with_addons=False, with_upsells=False,
+                   chunk_size=None, max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Get events with the given id's
 
-        if event_ids:
-            params.update(event_id_list=','.join(event_ids))
+        Wraps `/f13/events_by_id.v1`_
 
-        self.add_optional_kwargs(params, **kwargs)
+        Long lists of IDs are split into chunks that are requested in parallel,
+        and the results are merged together.
 
-        if with_addons:
-            params.update(add_add_ons=with_addons)
+        Args:
+            event_ids (list): list of event IDs
+            with_addons (bool): include add-on events
+            with_upsells (bool): include upsell events
+            chunk_size (int): the maximum number of IDs to request at once.
+                Defaults to the client's **id_chunk_size**.
+            max_workers (int): the maximum number of chunks to request at the
+                same time. Defaults to 10.
+            **kwargs: see :meth:`add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
+                for more info.
 
-        if with_upsells:
-            params.update(add_upsells=with_upsells)
+        Returns:
+            dict, :class:`EventMeta <pyticketswitch.event.EventMeta>`:
+            :class:`Events <pyticketswitch.event.Event>` indexed by event
+            ID and meta information for those events.
 
-        response = self.make_request('events_by_id.v1', params)
+        Raises:
+            InvalidResponse: when the response is in an unexpected format
 
-        if 'events_by_id' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no events_by_id key in json response"
-            )
+        .. _`/f13/events_by_id.v1`: http://docs.ingresso.co.uk/#events-by-id
 
-        events_by_id = response.get('events_by_id', {})
-        events = {
-            event_id: Event.from_events_by_id_api_data(raw_event)
-            for event_id, raw_event in events_by_id.items()
-            if raw_event.get('event')
-        }
+        """
 
-        meta = EventMeta.from_api_data(response)
-        return events, meta
+        def fetch(ids):
+            call = endpoints.get_events(
+                ids, with_addons=with_addons, with_upsells=with_upsells,
+                lazy=self.lazy_models, keep_raw=self.keep_raw,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+            return self.execute(call)
+
+        return self._fetch_in_chunks(fetch, event_ids, chunk_size, max_workers)
 
     def get_event(self, event_id, **kwargs):
         """Get a specific event by id
@@ -636,6 +1286,9 @@ class Client(object):
             will return :obj:`None` if the event does not exist.
 
         """
+        if self.event_loader is not None:
+            return self.event_loader.load(event_id, **kwargs).result()
+
         events, meta = self.get_events([event_id], **kwargs)
         return events.get(event_id), meta
 
@@ -658,26 +1311,10 @@ class Client(object):
         .. _`/f13/months.v1`: http://docs.ingresso.co.uk/#months
 
         """
-        params = {'event_id': event_id}
-
-        self.add_optional_kwargs(params, **kwargs)
-
-        response = self.make_request('months.v1', params)
-
-        if 'results' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no results key in json response"
-            )
-
-        result = response.get('results', {})
-        raw_months = result.get('month', [])
-
-        months = [
-            Month.from_api_data(data)
-            for data in raw_months
-        ]
 
-        return months
+        return self.execute(endpoints.get_months(
+            event_id, add_optional_kwargs=self.add_optional_kwargs,
+            **kwargs))
 
     def list_performances(self, event_id, start_date=None, end_date=None,
                           page_length=0, page=0, **kwargs):
@@ -708,45 +1345,73 @@ class Client(object):
 
         .. _`/f13/performances.v1`: http://docs.ingresso.co.uk/#performances-list
         """
-        params = {'event_id': event_id}
 
-        if page > 0:
-            params.update(page_no=page)
+        call = endpoints.list_performances(
+            event_id, start_date=start_date, end_date=end_date,
+            page_length=page_length, page=page, lazy=self.lazy_models,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
 
-        if page_length > 0:
-            params.update(page_len=page_length)
+    def iter_performances(self, event_id, page=0,
+                          page_length=DEFAULT_PAGE_LENGTH, prefetch=1,
+                          concurrent=False, max_workers=DEFAULT_MAX_WORKERS,
+                          **kwargs):
+        """Iterate over all the performances for a specified event
 
-        if start_date or end_date:
-            params.update(date_range=utils.date_range_str(start_date, end_date))
+        Pages through `/f13/performances.v1`_, yielding the performances of
+        each page as soon as it has been parsed while the following pages are
+        fetched in the background.
 
-        self.add_optional_kwargs(params, **kwargs)
+        Args:
+            event_id (str): identifier for the event.
+            page (int): the page to start from.
+            page_length (int): how many performances are requested per page.
+                Defaults to 50.
+            prefetch (int): how many pages to fetch ahead of the page being
+                iterated over. Defaults to 1.
+            concurrent (bool): when :obj:`True` all the remaining pages are
+                requested as soon as the first page tells us how many there
+                are, instead of **prefetch** pages at a time. Defaults to
+                :obj:`False`.
+            max_workers (int): the maximum number of pages to request at the
+                same time. Defaults to 10.
+            **kwargs: accepts the same arguments as :meth:`list_performances
+                <pyticketswitch.client.Client.list_performances>`.
 
-        response = self.make_request('performances.v1', params)
+        Yields:
+            :class:`Performance <pyticketswitch.performance.Performance>`:
+            the performances in the order the API returns them.
 
-        if 'results' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no results key in json response"
-            )
+        Raises:
+            InvalidResponse: when a response is in an unexpected format
 
-        result = response.get('results', {})
+        .. _`/f13/performances.v1`: http://docs.ingresso.co.uk/#performances-list
 
-        raw_performances = result.get('performance', [])
-        performances = [
-            Performance.from_api_data(data)
-            for data in raw_performances
-        ]
+        """
 
-        meta = PerformanceMeta.from_api_data(response)
+        def fetch(page_number):
+            return self.list_performances(
+                event_id, page=page_number, page_length=page_length, **kwargs)
 
-        return performances, meta
+        return self._iter_pages(
+            fetch, deadlines.get_current(), page, prefetch, concurrent,
+            max_workers)
 
-    def get_performances(self, performance_ids, **kwargs):
+    def get_performances(self, performance_ids, chunk_size=None,
+                         max_workers=DEFAULT_MAX_WORKERS, **kwargs):
         """Get performances with the given ID's
 
         Wraps `/f13/performances_by_id.v1`_
 
+        Long lists of IDs are split into chunks that are requested in parallel,
+        and the results are merged together.
+
         Args:
             performance_ids (list): list of performance IDs to fetch.
+            chunk_size (int): the maximum number of IDs to request at once.
+                Defaults to the client's **id_chunk_size**.
+            max_workers (int): the maximum number of chunks to request at the
+                same time. Defaults to 10.
             **kwargs: see :meth:`add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
                 for more info.
 
@@ -763,28 +1428,14 @@ class Client(object):
 
         """
 
-        params = {
-            'perf_id_list': ','.join(performance_ids),
-        }
-
-        self.add_optional_kwargs(params, **kwargs)
-
-        response = self.make_request('performances_by_id.v1', params)
-
-        if 'performances_by_id' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no performances_by_id key in json response"
-            )
-
-        raw_performances = response.get('performances_by_id', {})
-        performances = {
-            performance_id: Performance.from_api_data(data)
-            for performance_id, data in raw_performances.items()
-        }
+        def fetch(ids):
+            call = endpoints.get_performances(
+                ids, lazy=self.lazy_models,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+            return self.execute(call)
 
-        meta = PerformanceMeta.from_api_data(response)
-
-        return performances, meta
+        return self._fetch_in_chunks(
+            fetch, performance_ids, chunk_size, max_workers)
 
     def get_performance(self, performance_id, **kwargs):
         """Get a specific performance by id
@@ -811,6 +1462,10 @@ class Client(object):
             will return :obj:`None` if the performance does not exist.
 
         """
+        if self.performance_loader is not None:
+            return self.performance_loader.load(
+                performance_id, **kwargs).result()
+
         performances, meta = self.get_performances([performance_id], **kwargs)
         return performances.get(performance_id), meta
 
@@ -855,42 +1510,176 @@ class Client(object):
 
         .. _`/f13/availability.v1`: http://docs.ingresso.co.uk/#availability
         """
-        params = {'perf_id': performance_id}
 
-        if number_of_seats:
-            params.update(no_of_seats=number_of_seats)
+        call = endpoints.get_availability(
+            performance_id, number_of_seats=number_of_seats,
+            discounts=discounts, example_seats=example_seats,
+            seat_blocks=seat_blocks, user_commission=user_commission,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
 
-        if discounts:
-            params.update(add_discounts=True)
+    def get_availability_many(self, performance_ids,
+                              max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """Fetch availability for several performances at once
 
-        if example_seats:
-            params.update(add_example_seats=True)
+        Makes one `/f13/availability.v1`_ call per performance, spread over a
+        pool of at most **max_workers** threads. A failure to fetch one
+        performance does not affect the others, instead the exception is
+        returned alongside the successful results.
 
-        if seat_blocks:
-            params.update(add_seat_blocks=True)
+        .. note:: when the client was created with ``keep_alive=True`` make
+                  sure **pool_maxsize** is at least **max_workers**, otherwise
+                  the extra connections will be discarded after each call.
 
-        if user_commission:
-            params.update(req_predicted_commission=True)
+        Args:
+            performance_ids (list): identifiers of the target performances.
+            max_workers (int): the maximum number of requests to make at the
+                same time. Defaults to 10.
+            **kwargs: see :meth:`get_availability <pyticketswitch.client.Client.get_availability>`
+                for more info.
 
-        self.add_optional_kwargs(params, **kwargs)
+        Returns:
+            dict, dict: the results of :meth:`get_availability
+            <pyticketswitch.client.Client.get_availability>` indexed by
+            performance ID, and the exceptions raised while fetching any
+            performances that failed, also indexed by performance ID.
 
-        response = self.make_request('availability.v1', params)
+        .. _`/f13/availability.v1`: http://docs.ingresso.co.uk/#availability
+        """
+        def fetch(performance_id):
+            return self.get_availability(performance_id, **kwargs)
+
+        results = {}
+        errors = {}
+        for performance_id, future in self._run_concurrently(
+                fetch, endpoints.unique_ids(performance_ids), max_workers):
+            error = future.exception()
+            if error is not None:
+                logger.debug(u'failed to fetch availability for %s: %r',
+                             performance_id, error)
+                errors[performance_id] = error
+            else:
+                results[performance_id] = future.result()
+
+        return results, errors
+
+    def _fetch_in_chunks(self, fetch, ids, chunk_size, max_workers):
+        """Fetch objects by ID, a chunk of IDs at a time.
 
-        if 'availability' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no availability key in json response"
-            )
+        Args:
+            fetch (callable): function that takes a list of IDs and returns a
+                ``(dict, meta)`` tuple.
+            ids (list): all the IDs to fetch.
+            chunk_size (int): the maximum number of IDs to pass to **fetch**.
+                When :obj:`None` the client's **id_chunk_size** is used.
+            max_workers (int): the maximum number of chunks to fetch at the
+                same time.
 
-        meta = AvailabilityMeta.from_api_data(response)
+        Returns:
+            dict, meta: the merged results of all the chunks.
 
-        raw_availability = response.get('availability', {})
+        """
+        if chunk_size is None:
+            chunk_size = self.id_chunk_size
 
-        availability = [
-            TicketType.from_api_data(data)
-            for data in raw_availability.get('ticket_type', [])
+        if not chunk_size or len(ids) <= chunk_size:
+            return fetch(ids)
+
+        chunks = endpoints.chunk_ids(ids, chunk_size)
+        logger.debug(u'fetching %s ids in %s chunks', len(ids), len(chunks))
+
+        results = [
+            future.result()
+            for _, future in self._run_concurrently(fetch, chunks, max_workers)
         ]
+        return endpoints.merge_results_by_id(results)
+
+    def _iter_pages(self, fetch, deadline, page, prefetch, concurrent,
+                    max_workers):
+        """Yield the results of a paginated call, page by page.
+
+        The first page is fetched straight away so that the meta data can
+        tell us which pages remain, those are then fetched on a pool of
+        threads while the results of the earlier pages are being consumed.
+
+        Args:
+            fetch (callable): function that takes a page number and returns
+                a ``(list, meta)`` tuple.
+            deadline (:class:`Deadline <pyticketswitch.deadline.Deadline>`):
+                the deadline that was current when the iterator was created,
+                it applies to every page however late it is fetched.
+            page (int): the first page to fetch.
+            prefetch (int): how many pages to keep in flight.
+            concurrent (bool): request every remaining page at once.
+            max_workers (int): the maximum number of threads to use.
 
-        return availability, meta
+        """
+        def fetch_page(page_number):
+            with deadlines.using(deadline):
+                return fetch(page_number)
+
+        results, meta = fetch_page(page)
+        pages = collections.deque(meta.remaining_pages())
+
+        if concurrent:
+            prefetch = len(pages)
+
+        pending = collections.deque()
+        executor = None
+        if pages:
+            workers = max(1, min(max_workers, prefetch))
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        try:
+            while True:
+                while pages and len(pending) < prefetch:
+                    pending.append(
+                        executor.submit(fetch_page, pages.popleft()))
+
+                for result in results:
+                    yield result
+
+                if not pending:
+                    if not pages:
+                        return
+                    pending.append(
+                        executor.submit(fetch_page, pages.popleft()))
+
+                results, _ = pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _run_concurrently(self, func, items, max_workers):
+        """Call a function once for each item on a pool of threads.
+
+        Args:
+            func (callable): function that takes a single item.
+            items (list): the items to call the function with, without
+                duplicates, see :func:`endpoints.unique_ids
+                <pyticketswitch.endpoints.unique_ids>`.
+            max_workers (int): the maximum number of threads to use.
+
+        Returns:
+            list: tuples of the item and the completed
+            :class:`Future <concurrent.futures.Future>` of the function call,
+            in the same order as the items.
+
+        """
+        if not items:
+            return []
+
+        func = deadlines.bind(func)
+        workers = max(1, min(max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (item, executor.submit(func, item))
+                for item in items
+            ]
+
+        return futures
 
     def get_send_methods(self, performance_id, **kwargs):
         """Fetch available delivery methods for a given performance
@@ -912,26 +1701,11 @@ class Client(object):
 
         .. _`/f13/send_methods.v1`: http://docs.ingresso.co.uk/#send-methods
         """
-        params = {'perf_id': performance_id}
-        self.add_optional_kwargs(params, **kwargs)
-
-        response = self.make_request('send_methods.v1', params)
-
-        if 'send_methods' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no send_methods key in json response"
-            )
-
-        raw_send_methods = response.get('send_methods', {})
 
-        send_methods = [
-            SendMethod.from_api_data(data)
-            for data in raw_send_methods.get('send_method', [])
-        ]
-
-        meta = CurrencyMeta.from_api_data(response)
-
-        return send_methods, meta
+        return self.execute(
+            endpoints.get_send_methods(
+                performance_id,
+                add_optional_kwargs=self.add_optional_kwargs, **kwargs))
 
     def get_discounts(self, performance_id, ticket_type_code, price_band_code,
                       user_commission=False, **kwargs):
@@ -958,31 +1732,12 @@ class Client(object):
 
         .. _`/f13/discounts.v1`: http://docs.ingresso.co.uk/#discounts
         """
-        params = {
-            'perf_id': performance_id,
-            'ticket_type_code': ticket_type_code,
-            'price_band_code': price_band_code,
-            'req_predicted_commission': user_commission,
-        }
-        self.add_optional_kwargs(params, **kwargs)
-
-        response = self.make_request('discounts.v1', params)
-
-        if 'discounts' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no discounts key in json response"
-            )
-
-        raw_discounts = response.get('discounts', {})
 
-        discounts = [
-            Discount.from_api_data(data)
-            for data in raw_discounts.get('discount', [])
-        ]
-
-        meta = CurrencyMeta.from_api_data(response)
-
-        return discounts, meta
+        call = endpoints.get_discounts(
+            performance_id, ticket_type_code, price_band_code,
+            user_commission=user_commission,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
 
     def _trolley_params(self, token=None, number_of_seats=None, discounts=None,
                         seats=None, send_codes=None, ticket_type_code=None,
@@ -1024,62 +1779,13 @@ class Client(object):
 
         """
 
-        params = {}
-
-        if token:
-            params.update(trolley_token=token)
-
-        if performance_id:
-            params.update(perf_id=performance_id)
-
-        # TODO: check if 0 is a legit number to be passing in here.
-        # for the moment I'm assuming that it isn't
-        if number_of_seats:
-            params.update(no_of_seats=number_of_seats)
-
-        if ticket_type_code:
-            params.update(ticket_type_code=ticket_type_code)
-
-        if price_band_code:
-            params.update(price_band_code=price_band_code)
-
-        if item_numbers_to_remove and not token:
-            raise exceptions.InvalidParametersError(
-                'got item_numbers_to_remove but no token specified'
-            )
-        if item_numbers_to_remove:
-            params.update(
-                remove_items_list=','.join(
-                    [str(item) for item in item_numbers_to_remove]
-                )
-            )
-
-        if seats:
-            params.update({
-                'seat{}'.format(i): seat
-                for i, seat in enumerate(seats)
-            })
-
-        if discounts:
-            params.update({
-                'disc{}'.format(i): discount
-                for i, discount in enumerate(discounts)
-            })
-
-        if send_codes and not isinstance(send_codes, dict):
-            raise exceptions.InvalidParametersError(
-                'send_codes should be a dictionary in the format of `{source_code: send_code}`'
-            )
-
-        if send_codes:
-            params.update({
-                '{}_send_code'.format(source_code): send_code
-                for source_code, send_code in send_codes.items()
-            })
-
-        self.add_optional_kwargs(params, **kwargs)
-
-        return params
+        return endpoints.trolley_params(
+            token=token, number_of_seats=number_of_seats, discounts=discounts,
+            seats=seats, send_codes=send_codes,
+            ticket_type_code=ticket_type_code, performance_id=performance_id,
+            price_band_code=price_band_code,
+            item_numbers_to_remove=item_numbers_to_remove,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
 
     def get_trolley(self, token=None, number_of_seats=None, discounts=None,
                     seats=None, send_codes=None, ticket_type_code=None,
@@ -1131,24 +1837,16 @@ class Client(object):
 
         """
 
-        params = self._trolley_params(
+        call = endpoints.get_trolley(
             token=token, number_of_seats=number_of_seats, discounts=discounts,
             seats=seats, send_codes=send_codes,
             ticket_type_code=ticket_type_code, performance_id=performance_id,
             price_band_code=price_band_code,
-            item_numbers_to_remove=item_numbers_to_remove, **kwargs)
-
-        response = self.make_request('trolley.v1', params)
-
-        trolley = Trolley.from_api_data(response)
-        meta = CurrencyMeta.from_api_data(response)
-
-        if raise_on_unavailable_order:
-            if trolley and trolley.input_contained_unavailable_order:
-                raise exceptions.OrderUnavailableError(
-                    "inputs contained unavailable order")
-
-        return trolley, meta
+            item_numbers_to_remove=item_numbers_to_remove,
+            raise_on_unavailable_order=raise_on_unavailable_order,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs)
+        return self.execute(call)
 
     def get_upsells(self, token=None, number_of_seats=None, discounts=None,
                     seats=None, send_codes=None, ticket_type_code=None,
@@ -1197,31 +1895,15 @@ class Client(object):
         .. _`/f13/upsells.v1`: http://docs.ingresso.co.uk/#related-events
         """
 
-        params = self._trolley_params(
+        call = endpoints.get_upsells(
             token=token, number_of_seats=number_of_seats, discounts=discounts,
             seats=seats, send_codes=send_codes,
             ticket_type_code=ticket_type_code, performance_id=performance_id,
             price_band_code=price_band_code,
-            item_numbers_to_remove=item_numbers_to_remove, **kwargs)
-
-        response = self.make_request('upsells.v1', params)
-
-        if 'results' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no results key in JSON response"
-            )
-
-        results = response.get('results', {})
-
-        raw_upsell_events = results.get('event', [])
-        upsell_events = [
-            Event.from_api_data(data)
-            for data in raw_upsell_events
-        ]
-
-        upsell_meta = EventMeta.from_api_data(response)
-
-        return (upsell_events, upsell_meta)
+            item_numbers_to_remove=item_numbers_to_remove,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs)
+        return self.execute(call)
 
     def get_addons(self, token=None, number_of_seats=None, discounts=None,
                    seats=None, send_codes=None, ticket_type_code=None,
@@ -1264,31 +1946,15 @@ class Client(object):
         .. _`/f13/add_ons.v1`: http://docs.ingresso.co.uk/#add-ons
         """
 
-        params = self._trolley_params(
+        call = endpoints.get_addons(
             token=token, number_of_seats=number_of_seats, discounts=discounts,
             seats=seats, send_codes=send_codes,
             ticket_type_code=ticket_type_code, performance_id=performance_id,
             price_band_code=price_band_code,
-            item_numbers_to_remove=item_numbers_to_remove, **kwargs)
-
-        response = self.make_request('add_ons.v1', params)
-
-        if 'results' not in response:
-            raise exceptions.InvalidResponseError(
-                "got no results key in json response"
-            )
-
-        add_on_results = response.get('results', {})
-
-        raw_add_on_events = add_on_results.get('event', [])
-        add_on_events = [
-            Event.from_api_data(data)
-            for data in raw_add_on_events
-        ]
-
-        add_on_meta = EventMeta.from_api_data(response)
-
-        return (add_on_events, add_on_meta)
+            item_numbers_to_remove=item_numbers_to_remove,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs)
+        return self.execute(call)
 
     def make_reservation(self, token=None, number_of_seats=None, discounts=None,
                          seats=None, send_codes=None, ticket_type_code=None,
@@ -1352,17 +2018,18 @@ class Client(object):
 
         """
 
-        params = self._trolley_params(
+        call = endpoints.make_reservation(
             token=token, number_of_seats=number_of_seats, discounts=discounts,
             seats=seats, send_codes=send_codes,
             ticket_type_code=ticket_type_code, performance_id=performance_id,
             price_band_code=price_band_code,
-            item_numbers_to_remove=item_numbers_to_remove, **kwargs)
-
-        response = self.make_request('reserve.v1', params, method=POST)
-
-        return self.process_reservation_response(response,
-                                                 raise_on_unavailable_order)
+            item_numbers_to_remove=item_numbers_to_remove,
+            raise_on_unavailable_order=raise_on_unavailable_order,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            trolley_params=self._trolley_params, **kwargs)
+        call.parser = lambda response: self.process_reservation_response(
+            response, raise_on_unavailable_order)
+        return self.execute(call)
 
     def release_reservation(self, transaction_uuid, **kwargs):
         """Release an existing reservation.
@@ -1382,11 +2049,8 @@ class Client(object):
 
         """
 
-        params = {'transaction_uuid': transaction_uuid}
-        kwargs.update(params)
-        response = self.make_request('release.v1', kwargs, method=POST)
-
-        return response.get('released_ok', False)
+        return self.execute(
+            endpoints.release_reservation(transaction_uuid, **kwargs))
 
     def get_reservation(self, transaction_uuid,
                         raise_on_unavailable_order=False, **kwargs):
@@ -1425,12 +2089,14 @@ class Client(object):
         .. _`/f13/reserve_page_archive.v1`: http://docs.ingresso.co.uk/#reserve_page_archive
 
         """
-        params = {"transaction_uuid": transaction_uuid}
-        response = self.make_request('reserve_page_archive.v1', params,
-                                     method=GET)
 
-        return self.process_reservation_response(response,
-                                                 raise_on_unavailable_order)
+        call = endpoints.get_reservation(
+            transaction_uuid,
+            raise_on_unavailable_order=raise_on_unavailable_order,
+            lazy=self.lazy_models, keep_raw=self.keep_raw, **kwargs)
+        call.parser = lambda response: self.process_reservation_response(
+            response, raise_on_unavailable_order)
+        return self.execute(call)
 
     def get_status(self, transaction_uuid=None, transaction_id=None,
                    customer=False, external_sale_page=False, **kwargs):
@@ -1462,27 +2128,13 @@ class Client(object):
         .. _`/f13/status.v1`: http://docs.ingresso.co.uk/#status
 
         """
-        params = {}
 
-        if customer:
-            params.update(add_customer=True)
-
-        if external_sale_page:
-            params.update(add_external_sale_page=True)
-
-        self.add_optional_kwargs(params, **kwargs)
-
-        if transaction_id:
-            params.update(transaction_id=transaction_id)
-            response = self.make_request('trans_id_status.v1', params)
-        else:
-            params.update(transaction_uuid=transaction_uuid)
-            response = self.make_request('status.v1', params)
-
-        status = Status.from_api_data(response)
-        meta = CurrencyMeta.from_api_data(response)
-
-        return status, meta
+        call = endpoints.get_status(
+            transaction_uuid=transaction_uuid, transaction_id=transaction_id,
+            customer=customer, external_sale_page=external_sale_page,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
 
     def make_purchase(self, transaction_uuid, customer, payment_method=None,
                       send_confirmation_email=True, agent_reference=None, **kwargs):
@@ -1527,27 +2179,13 @@ class Client(object):
 
         """
 
-        params = {'transaction_uuid': transaction_uuid}
-
-        if send_confirmation_email:
-            params.update(send_confirmation_email=True)
-
-        customer_params = customer.as_api_parameters()
-
-        if customer_params:
-            params.update(customer_params)
-
-        if payment_method:
-            params.update(payment_method.as_api_parameters())
-
-        if agent_reference:
-            params.update(agent_reference=agent_reference)
-
-        params.update(kwargs)
-
-        response = self.make_request('purchase.v1', params, method=POST)
-
-        return self.process_purchase_response(response)
+        call = endpoints.make_purchase(
+            transaction_uuid, customer, payment_method=payment_method,
+            send_confirmation_email=send_confirmation_email,
+            agent_reference=agent_reference, lazy=self.lazy_models,
+            keep_raw=self.keep_raw, **kwargs)
+        call.parser = self.process_purchase_response
+        return self.execute(call)
 
     def get_purchase(self, transaction_uuid, **kwargs):
         """
@@ -1584,11 +2222,12 @@ class Client(object):
         .. _`/f13/purchase_page_archive.v1`: http://docs.ingresso.co.uk/#purchase_page_archive
 
         """
-        params = {"transaction_uuid": transaction_uuid}
-        response = self.make_request('purchase_page_archive.v1', params,
-                                     method=GET)
 
-        return self.process_purchase_response(response)
+        call = endpoints.get_purchase(
+            transaction_uuid, lazy=self.lazy_models, keep_raw=self.keep_raw,
+            **kwargs)
+        call.parser = self.process_purchase_response
+        return self.execute(call)
 
     def next_callout(self, this_token, next_token, returned_data, **kwargs):
         """Gets the next callout in a callout chain.
@@ -1620,53 +2259,54 @@ class Client(object):
 
         """
 
-        endpoint = "callback.v1/this.{}/next.{}".format(this_token, next_token)
-
-        params = returned_data
-        params.update(kwargs)
-
-        response = self.make_request(endpoint, params, method=POST)
-
-        callout_data = response.get('callout')
-
-        if callout_data:
-            status = None
-            callout = Callout.from_api_data(callout_data)
-        else:
-            callout = None
-            status = Status.from_api_data(response)
-
-        meta = CurrencyMeta.from_api_data(response)
-
-        return status, callout, meta
+        call = endpoints.next_callout(
+            this_token, next_token, returned_data, lazy=self.lazy_models,
+            keep_raw=self.keep_raw, **kwargs)
+        call.parser = self.process_purchase_response
+        return self.execute(call)
 
     def process_reservation_response(self, response,
                                      raise_on_unavailable_order):
-        reservation = Reservation.from_api_data(response)
-        meta = CurrencyMeta.from_api_data(response)
+        """Parse the response of a reservation call
+
+        Used by :meth:`make_reservation` and :meth:`get_reservation`.
 
-        if raise_on_unavailable_order:
-            if reservation and reservation.input_contained_unavailable_order:
-                raise exceptions.OrderUnavailableError(
-                    "inputs contained unavailable order",
-                    reservation=reservation,
-                    meta=meta)
+        Args:
+            response (dict): the decoded response.
+            raise_on_unavailable_order (bool): raise an
+                :class:`OrderUnavailableError
+                <pyticketswitch.exceptions.OrderUnavailableError>` when the
+                reservation contained unavailable orders.
 
-        return reservation, meta
+        Returns:
+            :class:`Reservation <pyticketswitch.reservation.Reservation>`,
+            :class:`CurrencyMeta <pyticketswitch.currency.CurrencyMeta>`:
+            the reservation and its meta data.
+
+        """
+        return endpoints.parse_reservation(response,
+                                           raise_on_unavailable_order,
+                                           lazy=self.lazy_models,
+                                           keep_raw=self.keep_raw)
 
     def process_purchase_response(self, response):
-        callout_data = response.get('callout')
+        """Parse the response of a purchase call
 
-        if callout_data:
-            status = None
-            callout = Callout.from_api_data(callout_data)
-        else:
-            callout = None
-            status = Status.from_api_data(response)
+        Used by :meth:`make_purchase`, :meth:`get_purchase` and
+        :meth:`next_callout`.
 
-        meta = CurrencyMeta.from_api_data(response)
+        Args:
+            response (dict): the decoded response.
+
+        Returns:
+            :class:`Status <pyticketswitch.status.Status>`,
+            :class:`Callout <pyticketswitch.callout.Callout>`,
+            :class:`CurrencyMeta <pyticketswitch.currency.CurrencyMeta>`:
+            the status or callout of the transaction and the meta data.
 
-        return status, callout, meta
+        """
+        return endpoints.parse_purchase(
+            response, lazy=self.lazy_models, keep_raw=self.keep_raw)
 
     def cancel_purchase(self, transaction_uuid, cancel_items_list=None, **kwargs):
         """Attempt cancellation of item numbers from the transaction, specified in
@@ -1689,17 +2329,9 @@ class Client(object):
         .. _`/f13/cancel.v1`: http://docs.ingresso.co.uk/#cancel
 
         """
-        params = {
-            "transaction_uuid": transaction_uuid,
-        }
-        if cancel_items_list:
-            params.update(cancel_items_list=",".join(map(str, cancel_items_list)))
-
-        self.add_optional_kwargs(params, **kwargs)
-
-        response = self.make_request('cancel.v1', params, method=POST)
-
-        result = CancellationResult.from_api_data(response)
-        meta = CurrencyMeta.from_api_data(response)
 
-        return result, meta
+        call = endpoints.cancel_purchase(
+            transaction_uuid, cancel_items_list=cancel_items_list,
+            lazy=self.lazy_models, keep_raw=self.keep_raw,
+            add_optional_kwargs=self.add_optional_kwargs, **kwargs)
+        return self.execute(call)
@@ -0,0 +1,94 @@
+"""Coalescing of identical concurrent requests.
+
+When several threads make the same read only request at the same time only
+the first one, the leader, goes to the API. The others wait for it to finish
+and then share its response, or the exception it raised. Enable it on the
+client with ``coalesce=True``::
+
+    >>> client = Client('demo', 'demopass', coalesce=True)
+
+Each caller still parses the shared response into its own objects. A caller
+that is waiting gives up when its own :mod:`deadline
+<pyticketswitch.deadline>` passes, the leader carries on for the others.
+
+"""
+import threading
+
+from pyticketswitch import deadline as deadlines
+
+
+class _Flight(object):
+    """A request that is in progress."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Makes sure only one call per key is in progress at a time
+
+    Attributes:
+        calls (int): the number of calls that were made.
+        shared (int): the number of calls that waited for, and shared the
+            result of, a call that was already in progress.
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._flights)
+
+    def do(self, key, func):
+        """Call a function unless a call with the same key is in progress
+
+        Args:
+            key: a hashable key identifying the call.
+            func (callable): function that takes no arguments.
+
+        Returns:
+            the result of **func**, or of the call already in progress.
+
+        Raises:
+            DeadlineExceededError: when the current deadline passed while
+                waiting for the call already in progress.
+            Exception: whatever **func**, or the call already in progress,
+                raised.
+
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            deadline = deadlines.get_current()
+            if deadline is None:
+                flight.done.wait()
+            while not flight.done.is_set():
+                flight.done.wait(deadline.check())
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return flight.result
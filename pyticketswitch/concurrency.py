@@ -0,0 +1,193 @@
+"""A limit on the number of requests in flight at once.
+
+Give a :class:`ConcurrencyLimiter` to the client to bound the number of
+requests it makes at the same time. Share one limiter between all the
+clients in a process to give them a single budget::
+
+    >>> from pyticketswitch.concurrency import ConcurrencyLimiter
+    >>> limiter = ConcurrencyLimiter(limit=20, endpoint_limits={
+    ...     'availability.v1': 5,
+    ... })
+    >>> catalogue = Client('demo', 'demopass', concurrency_limiter=limiter)
+    >>> checkout = Client('demo', 'demopass', concurrency_limiter=limiter)
+
+Requests over the limit wait in a first come, first served queue, so a
+worker pool refreshing the catalogue can't open an unbounded number of
+connections. Waiters for an endpoint that is at its own limit don't hold up
+requests to other endpoints. When **max_waiting** is set, requests that find
+the queue full raise :class:`ClientOverloadedError
+<pyticketswitch.exceptions.ClientOverloadedError>` instead of waiting. The
+time spent waiting is recorded, see :meth:`ConcurrencyLimiter.stats`.
+
+The limiter blocks the calling thread, the :class:`AsyncClient
+<pyticketswitch.async_client.AsyncClient>` takes an
+:class:`AsyncConcurrencyLimiter
+<pyticketswitch.async_client.AsyncConcurrencyLimiter>` instead.
+
+"""
+import collections
+import contextlib
+import threading
+
+from pyticketswitch import exceptions, utils
+
+
+DEFAULT_LIMIT = 10
+
+
+ConcurrencyStats = collections.namedtuple('ConcurrencyStats', [
+    'active', 'waiting', 'acquired', 'rejected', 'total_wait', 'max_wait',
+])
+
+
+class ConcurrencyLimiter(object):
+    """A thread safe limit on the number of requests in flight
+
+    Args:
+        limit (int): the maximum number of requests in flight. Defaults to
+            10.
+        endpoint_limits (dict): lower limits for particular endpoints,
+            indexed by endpoint.
+        max_waiting (int): the maximum number of requests that can wait for
+            a slot, further requests are rejected straight away. Defaults to
+            :obj:`None`, for no maximum.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        acquired (int): the number of slots that have been given out.
+        rejected (int): the number of requests turned away because the queue
+            was full or they ran out of time.
+        total_wait (float): the total seconds requests have spent waiting.
+        max_wait (float): the longest a request has waited.
+
+    """
+
+    def __init__(self, limit=DEFAULT_LIMIT, endpoint_limits=None,
+                 max_waiting=None, clock=None):
+        self.limit = limit
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.max_waiting = max_waiting
+        self.clock = clock or utils.monotonic
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._active = 0
+        self._active_by_endpoint = collections.Counter()
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+
+    def stats(self):
+        """Get the limiter statistics
+
+        Returns:
+            :class:`ConcurrencyStats`: requests in flight, requests waiting,
+            slots given out, requests rejected, and the total and longest
+            time spent waiting.
+
+        """
+        with self._condition:
+            return ConcurrencyStats(
+                self._active, len(self._queue), self.acquired, self.rejected,
+                self.total_wait, self.max_wait)
+
+    def acquire(self, endpoint, timeout=None):
+        """Wait for a slot to make a request in
+
+        Args:
+            endpoint (str): the API endpoint the request is for.
+            timeout (float): the maximum seconds to wait. Defaults to
+                :obj:`None`, to wait for as long as it takes.
+
+        Returns:
+            float: the seconds spent waiting.
+
+        Raises:
+            ClientOverloadedError: when the queue is full.
+            DeadlineExceededError: when no slot became free in time.
+
+        """
+        started = self.clock()
+        ticket = (object(), endpoint)
+
+        with self._condition:
+            if self._can_run(endpoint) and not self._queue:
+                return self._take(endpoint, started)
+
+            if self.max_waiting is not None and \
+                    len(self._queue) >= self.max_waiting:
+                self.rejected += 1
+                raise exceptions.ClientOverloadedError(
+                    'too many requests waiting to be sent')
+
+            self._queue.append(ticket)
+            try:
+                while self._next_runnable() is not ticket:
+                    remaining = None
+                    if timeout is not None:
+                        remaining = timeout - (self.clock() - started)
+                        if remaining <= 0:
+                            self.rejected += 1
+                            raise exceptions.DeadlineExceededError(
+                                'no free slot to send {} in time'.format(
+                                    endpoint))
+                    self._condition.wait(remaining)
+            finally:
+                self._queue.remove(ticket)
+                # a waiter behind us may be able to go now
+                self._condition.notify_all()
+
+            return self._take(endpoint, started)
+
+    def release(self, endpoint):
+        """Give back a slot once a request has finished
+
+        Args:
+            endpoint (str): the API endpoint the request was for.
+
+        """
+        with self._condition:
+            self._active -= 1
+            self._active_by_endpoint[endpoint] -= 1
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, endpoint, timeout=None):
+        """Hold a slot for the duration of a block
+
+        Args:
+            endpoint (str): the API endpoint the request is for.
+            timeout (float): the maximum seconds to wait.
+
+        """
+        self.acquire(endpoint, timeout=timeout)
+        try:
+            yield
+        finally:
+            self.release(endpoint)
+
+    def _can_run(self, endpoint):
+        if self._active >= self.limit:
+            return False
+        endpoint_limit = self.endpoint_limits.get(endpoint)
+        if endpoint_limit is None:
+            return True
+        return self._active_by_endpoint[endpoint] < endpoint_limit
+
+    def _next_runnable(self):
+        # the first waiter that there is capacity for, waiters for busy
+        # endpoints don't hold up requests to other endpoints.
+        for ticket in self._queue:
+            if self._can_run(ticket[1]):
+                return ticket
+        return None
+
+    def _take(self, endpoint, started):
+        waited = self.clock() - started
+        self._active += 1
+        self._active_by_endpoint[endpoint] += 1
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
@@ -32,6 +32,11 @@ class CostRange(JSONMixin, object):
 
     """
 
+    __slots__ = ('valid_quantities', 'max_seatprice', 'max_surcharge',
+                 'min_seatprice', 'min_surcharge', 'currency',
+                 'best_value_offer', 'max_saving_offer', 'min_cost_offer',
+                 'top_price_offer')
+
     def __init__(self, valid_quantities=None, max_surcharge=None, max_seatprice=None,
                  min_surcharge=None, min_seatprice=None, allows_singles=True,
                  currency=None, best_value_offer=None, max_saving_offer=None,
@@ -49,12 +54,14 @@ class CostRange(JSONMixin, object):
         self.top_price_offer = top_price_offer
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, allows_singles=None):
         """Creates a new CostRange object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a cost range.
+            allows_singles (bool): overrides the ``singles`` flag in
+                **data**.
 
         Returns:
             :class:`CostRange <pyticketswitch.cost_range.CostRange>`: a new
@@ -74,7 +81,9 @@ class CostRange(JSONMixin, object):
             'min_seatprice': min_seatprice,
             'max_surcharge': max_surcharge,
             'max_seatprice': max_seatprice,
-            'allows_singles': data.get('singles', True),
+            'allows_singles': (
+                data.get('singles', True) if allows_singles is None
+                else allows_singles),
             'currency': data.get('range_currency_code'),
         }
 
@@ -100,6 +109,31 @@ class CostRange(JSONMixin, object):
 
         return cls(**kwargs)
 
+    @classmethod
+    def from_cost_range_data(cls, data, singles=True):
+        """Creates a CostRange from the API data of the object it prices.
+
+        The data is only read, responses can be shared with other callers
+        by the cache.
+
+        Args:
+            data (dict): the part of the response from a ticketswitch API call
+                that concerns an event, performance or price band.
+            singles (bool): :obj:`False` for the cost range when not leaving
+                single seats, from **no_singles_cost_range**.
+
+        Returns:
+            :class:`CostRange <pyticketswitch.cost_range.CostRange>`: the
+            cost range, or :obj:`None` when **data** doesn't have one.
+
+        """
+        api_cost_range = data.get('cost_range', {})
+        if not singles:
+            api_cost_range = api_cost_range.get('no_singles_cost_range', {})
+        if not api_cost_range:
+            return None
+        return cls.from_api_data(api_cost_range, allows_singles=singles)
+
     def has_offer(self):
         return any([
             self.best_value_offer,
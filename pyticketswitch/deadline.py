@@ -0,0 +1,216 @@
+"""Deadlines that bound the time taken by a whole flow of calls.
+
+Wrap a sequence of calls in a deadline and every request made inside it is
+given the time that is left as its timeout. Once the time is up no more
+requests are made and :class:`DeadlineExceededError
+<pyticketswitch.exceptions.DeadlineExceededError>` is raised::
+
+    >>> with client.deadline(10):
+    ...     availability, meta = client.get_availability('6IF-B1H')
+    ...     trolley, meta = client.get_trolley(performance_id='6IF-B1H', ...)
+    ...     reservation, meta = client.make_reservation(token=trolley.token)
+
+Deadlines can be nested, an inner deadline never extends an outer one. The
+current deadline is kept per thread, and per task with asyncio on pythons
+that have :mod:`contextvars`.
+
+"""
+import contextlib
+import threading
+
+from pyticketswitch import exceptions, utils
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover
+    contextvars = None
+
+
+if contextvars is not None:
+    _current = contextvars.ContextVar('pyticketswitch_deadline', default=None)
+
+    def get_current():
+        """Get the deadline that applies to the code that is running
+
+        Returns:
+            :class:`Deadline`: the deadline or :obj:`None` when there isn't
+            one.
+
+        """
+        return _current.get()
+
+    def _set_current(deadline):
+        previous = _current.get()
+        _current.set(deadline)
+        return previous
+
+else:  # pragma: no cover
+    _local = threading.local()
+
+    def get_current():
+        """Get the deadline that applies to the code that is running
+
+        Returns:
+            :class:`Deadline`: the deadline or :obj:`None` when there isn't
+            one.
+
+        """
+        return getattr(_local, 'deadline', None)
+
+    def _set_current(deadline):
+        previous = get_current()
+        _local.deadline = deadline
+        return previous
+
+
+def get_timeout(timeout=None):
+    """Get the timeout for a request made now
+
+    Args:
+        timeout (float): the timeout the request would have without a
+            deadline.
+
+    Returns:
+        float: the smaller of **timeout** and the time left before the
+        current deadline, or :obj:`None` for no timeout.
+
+    Raises:
+        DeadlineExceededError: when the current deadline has passed.
+
+    """
+    deadline = get_current()
+    if deadline is None:
+        return timeout
+
+    remaining = deadline.check()
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+def allows(seconds):
+    """Indicates that there is time to wait before doing more work
+
+    Args:
+        seconds (float): the time to wait.
+
+    Returns:
+        bool: :obj:`True` when there is no current deadline or it is further
+        away than **seconds**.
+
+    """
+    deadline = get_current()
+    return deadline is None or deadline.remaining() > seconds
+
+
+@contextlib.contextmanager
+def using(deadline):
+    """Make a deadline current for a block of code
+
+    Unlike entering the :class:`Deadline` itself this doesn't change it, so
+    a deadline captured earlier can be applied to work done later.
+
+    Args:
+        deadline (:class:`Deadline`): the deadline, or :obj:`None` for no
+            deadline.
+
+    """
+    previous = _set_current(deadline)
+    try:
+        yield deadline
+    finally:
+        _set_current(previous)
+
+
+def bind(func):
+    """Apply the current deadline to a function called on another thread
+
+    Args:
+        func (callable): the function.
+
+    Returns:
+        callable: a function that runs **func** under the deadline that is
+        current now.
+
+    """
+    deadline = get_current()
+    if deadline is None:
+        return func
+
+    def bound(*args, **kwargs):
+        with using(deadline):
+            return func(*args, **kwargs)
+
+    return bound
+
+
+class Deadline(object):
+    """A point in time by which some work must be done
+
+    Use it as a context manager to apply it to all the requests made inside
+    the block.
+
+    Args:
+        seconds (float): the time allowed, from now.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        expires (float): the time, from **clock**, at which the deadline
+            passes.
+
+    """
+
+    def __init__(self, seconds, clock=None):
+        self.clock = clock or utils.monotonic
+        self.seconds = seconds
+        self.expires = self.clock() + seconds
+        self._previous = None
+
+    def __enter__(self):
+        outer = get_current()
+        if outer is not None and outer.expires < self.expires:
+            self.expires = outer.expires
+        self._previous = _set_current(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _set_current(self._previous)
+        self._previous = None
+
+    def __repr__(self):
+        return u'<Deadline {:.3f}s remaining>'.format(self.remaining())
+
+    def remaining(self):
+        """Get the time left
+
+        Returns:
+            float: seconds until the deadline, negative once it has passed.
+
+        """
+        return self.expires - self.clock()
+
+    def expired(self):
+        """Indicates that the deadline has passed
+
+        Returns:
+            bool: :obj:`True` when there is no time left.
+
+        """
+        return self.remaining() <= 0
+
+    def check(self):
+        """Make sure there is time left
+
+        Returns:
+            float: seconds until the deadline.
+
+        Raises:
+            DeadlineExceededError: when the deadline has passed.
+
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise exceptions.DeadlineExceededError(
+                'deadline of {}s exceeded'.format(self.seconds))
+        return remaining
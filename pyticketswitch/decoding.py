@@ -0,0 +1,70 @@
+"""Decoding of JSON response bodies.
+
+Responses are decoded straight from the bytes of the body, skipping the
+character set detection that :meth:`requests.Response.json` runs first, as
+the API always responds with UTF-8.
+
+When `orjson <https://github.com/ijl/orjson>`_ or `ujson
+<https://github.com/ultrajson/ultrajson>`_ is installed it is used to decode
+responses, which is several times faster than the standard library for
+large ``events.v1`` and ``availability.v1`` responses. Install the optional
+dependency with ``pip install pyticketswitch[fast_json]``. Neither can create
+:class:`decimal.Decimal` prices, so clients with ``use_decimal`` always use
+the standard library.
+
+"""
+import decimal
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def get_backend():
+    """Get the name of the library used to decode responses
+
+    Returns:
+        str: ``orjson``, ``ujson`` or ``json``.
+
+    """
+    if orjson is not None:
+        return 'orjson'
+    if ujson is not None:
+        return 'ujson'
+    return 'json'
+
+
+def loads(content, use_decimal=False):
+    """Decode a JSON response body
+
+    Args:
+        content (bytes): the body of the response.
+        use_decimal (bool): parse numbers with a fractional part as
+            :class:`decimal.Decimal` rather than :obj:`float`.
+
+    Returns:
+        the decoded body.
+
+    Raises:
+        ValueError: when the body is not valid JSON.
+
+    """
+    if not use_decimal:
+        if orjson is not None:
+            return orjson.loads(content)
+        if ujson is not None:
+            return ujson.loads(content)
+
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+
+    if use_decimal:
+        return json.loads(content, parse_float=decimal.Decimal)
+    return json.loads(content)
@@ -23,6 +23,10 @@ class Discount(SeatPricingMixin, JSONMixin, object):
             code cannot be specified for.
     """
 
+    __slots__ = ('code', 'description', 'price_band_code', 'is_offer',
+                 'availability', 'percentage_saving', 'absolute_saving',
+                 'gross_commission', 'user_commission', 'disallowed_seat_nos')
+
     def __init__(self, code, description=None, price_band_code=None,
                  availability=None, is_offer=False, percentage_saving=0,
                  absolute_saving=0, gross_commission=None, user_commission=None,
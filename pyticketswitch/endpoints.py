@@ -0,0 +1,1156 @@
+"""Transport independent descriptions of the f13 API endpoints.
+
+Each public function in this module takes the same arguments as the
+equivalent :class:`Client <pyticketswitch.client.Client>` method and returns
+an :class:`APICall <pyticketswitch.endpoints.APICall>` that describes the
+request to make and knows how to turn the decoded response into
+pyticketswitch objects. Nothing in here does any I/O, so the same
+implementation is shared by the synchronous and asynchronous clients and by
+anything else that wants to send requests in its own way::
+
+    >>> call = endpoints.get_availability('6IF-B1H', seat_blocks=True)
+    >>> call.endpoint, call.params
+    ('availability.v1', {'perf_id': '6IF-B1H', 'add_seat_blocks': True})
+    >>> availability, meta = call.parse(my_transport(call))
+
+The functions that take optional arguments accept an **add_optional_kwargs**
+callable, and the trolley and reservation functions a **trolley_params**
+callable, used to turn the arguments into request parameters. They default to
+:func:`add_optional_kwargs` and :func:`trolley_params`, the clients pass in
+their own :meth:`Client.add_optional_kwargs
+<pyticketswitch.client.Client.add_optional_kwargs>` and
+:meth:`Client._trolley_params
+<pyticketswitch.client.Client._trolley_params>` so subclasses can override
+them.
+
+"""
+from pyticketswitch import exceptions, utils
+from pyticketswitch.availability import AvailabilityMeta
+from pyticketswitch.callout import Callout
+from pyticketswitch.cancellation import CancellationResult
+from pyticketswitch.currency import CurrencyMeta
+from pyticketswitch.discount import Discount
+from pyticketswitch.event import Event, EventMeta
+from pyticketswitch.month import Month
+from pyticketswitch.performance import Performance, PerformanceMeta
+from pyticketswitch.reservation import Reservation
+from pyticketswitch.send_method import SendMethod
+from pyticketswitch.status import Status
+from pyticketswitch.ticket_type import TicketType
+from pyticketswitch.trolley import Trolley
+from pyticketswitch.user import User
+
+
+POST = 'post'
+GET = 'get'
+
+#: Keys leading to the events in ``events.v1`` responses.
+EVENTS_PATH = ('results', 'event')
+
+#: Keys leading to the events in ``events_by_id.v1`` responses.
+EVENTS_BY_ID_PATH = ('events_by_id',)
+
+#: Endpoints that only read data, making the same request to one of these
+#: twice has the same effect as making it once.
+READ_ONLY_ENDPOINTS = frozenset([
+    'test.v1',
+    'events.v1',
+    'events_by_id.v1',
+    'months.v1',
+    'performances.v1',
+    'performances_by_id.v1',
+    'availability.v1',
+    'send_methods.v1',
+    'discounts.v1',
+    'upsells.v1',
+    'add_ons.v1',
+])
+
+
+class APICall(object):
+    """Describes a single request to the API.
+
+    Attributes:
+        endpoint (str): target API endpoint, for example ``events.v1``.
+        params (dict): parameters to send with the request.
+        method (str): HTTP method to make the request with, either ``get``
+            or ``post``.
+        parser (callable): function that takes the decoded response and
+            returns the result of the call. When :obj:`None` the decoded
+            response is returned as is.
+
+    """
+
+    def __init__(self, endpoint, params, method=GET, parser=None):
+        self.endpoint = endpoint
+        self.params = params
+        self.method = method
+        self.parser = parser
+
+    def parse(self, response):
+        """Convert the decoded response into the result of the call.
+
+        Args:
+            response (dict): the body of the response after deserialising
+                from JSON.
+
+        Returns:
+            the result of the call, see the equivalent
+            :class:`Client <pyticketswitch.client.Client>` method.
+
+        Raises:
+            InvalidResponseError: when the response is in an unexpected format.
+
+        """
+        if self.parser is None:
+            return response
+        return self.parser(response)
+
+    def __repr__(self):
+        return u'<APICall {} {}>'.format(self.method, self.endpoint)
+
+
+def decode_response(endpoint, status_code, decode):
+    """Decode the body of a response
+
+    Args:
+        endpoint (str): target API endpoint.
+        status_code (int): HTTP status code of the response.
+        decode (callable): function that takes no arguments and returns the
+            deserialised body of the response.
+
+    Returns:
+        dict: the deserialised body of the response.
+
+    Raises:
+        InvalidResponseError: when the body is not valid JSON.
+
+    """
+    try:
+        return decode()
+    except ValueError:
+        raise exceptions.InvalidResponseError(
+            ("Unable to parse json data from {} response with status "
+             "code `{}`").format(
+                endpoint,
+                status_code,
+            ),
+            status_code=status_code,
+        )
+
+
+def check_response(endpoint, status_code, contents, response=None):
+    """Raise the appropriate exception for unsuccessful responses
+
+    Args:
+        endpoint (str): target API endpoint.
+        status_code (int): HTTP status code of the response.
+        contents (dict): the deserialised body of the response.
+        response: the raw response object from the transport, this is
+            attached to any raised :class:`APIError
+            <pyticketswitch.exceptions.APIError>`.
+
+    Returns:
+        dict: the deserialised body of the response.
+
+    Raises:
+        AuthenticationError: When authentication details provided are
+            invalid
+        CallbackGoneError: When the callout has already been completed
+        InvalidResponseError: When the status code of the response is not
+            200
+        APIError: When any other explict errors are returned from the API
+
+    """
+    if 'error_code' in contents:
+
+        if contents['error_code'] == 3:
+            raise exceptions.AuthenticationError(
+                contents['error_desc'],
+                contents['error_code'],
+                response,
+            )
+
+        if status_code == 410:
+            raise exceptions.CallbackGoneError(
+                contents['error_desc'],
+                contents['error_code'],
+                response,
+            )
+
+        raise exceptions.APIError(
+            contents['error_desc'],
+            contents['error_code'],
+            response,
+        )
+
+    if status_code != 200:
+        raise exceptions.InvalidResponseError(
+            "got status code `{}` from {}".format(
+                status_code,
+                endpoint,
+            ),
+            status_code=status_code,
+        )
+
+    return contents
+
+
+def unique_ids(ids):
+    """Remove duplicate IDs, keeping the order of the rest
+
+    Args:
+        ids (list): the IDs.
+
+    Returns:
+        list: the IDs without duplicates.
+
+    """
+    unique = []
+    seen = set()
+    for id_ in ids:
+        if id_ not in seen:
+            seen.add(id_)
+            unique.append(id_)
+    return unique
+
+
+def chunk_ids(ids, chunk_size):
+    """Split a list of IDs into chunks small enough for a single request
+
+    Duplicate IDs are removed, otherwise the order of the IDs is kept.
+
+    Args:
+        ids (list): the IDs to split.
+        chunk_size (int): the maximum number of IDs in each chunk. When
+            :obj:`None` or zero all the IDs are put in a single chunk.
+
+    Returns:
+        list: lists of IDs.
+
+    """
+    ids = unique_ids(ids)
+
+    if not ids:
+        return []
+
+    if not chunk_size:
+        return [ids]
+
+    return [
+        ids[i:i + chunk_size]
+        for i in range(0, len(ids), chunk_size)
+    ]
+
+
+def merge_results_by_id(results):
+    """Combine the results of several by ID calls into one
+
+    Args:
+        results (list): ``(dict, meta)`` tuples as returned by the parsers of
+            :func:`get_events <pyticketswitch.endpoints.get_events>` or
+            :func:`get_performances <pyticketswitch.endpoints.get_performances>`.
+
+    Returns:
+        dict, meta: all the objects indexed by ID and the meta data of the
+        first result, with the currencies of the others added to it.
+
+    """
+    merged = {}
+    meta = None
+
+    for objects, result_meta in results:
+        merged.update(objects)
+
+        if meta is None:
+            meta = result_meta
+            continue
+
+        meta.currencies.update(result_meta.currencies)
+        if not meta.default_currency_code:
+            meta.default_currency_code = result_meta.default_currency_code
+        if not meta.desired_currency_code:
+            meta.desired_currency_code = result_meta.desired_currency_code
+
+    return merged, meta
+
+
+def _require_key(response, key, name='json'):
+    if key not in response:
+        raise exceptions.InvalidResponseError(
+            "got no {} key in {} response".format(key, name)
+        )
+
+
+def add_optional_kwargs(params, availability=False,
+                        availability_with_performances=False,
+                        extra_info=False, reviews=False, media=False,
+                        cost_range=False, best_value_offer=False,
+                        max_saving_offer=False, min_cost_offer=False,
+                        top_price_offer=False, no_singles_data=False,
+                        cost_range_details=False, source_info=False,
+                        tracking_id=None, **kwargs):
+    """Adds additional arguments to the request parameters.
+
+    See :meth:`Client.add_optional_kwargs
+    <pyticketswitch.client.Client.add_optional_kwargs>` for details of the
+    arguments.
+
+    """
+    if extra_info:
+        params.update(req_extra_info=True)
+
+    if reviews:
+        params.update(req_reviews=True)
+
+    if media:
+        params.update({
+            'req_media_triplet_one': True,
+            'req_media_triplet_two': True,
+            'req_media_triplet_three': True,
+            'req_media_triplet_four': True,
+            'req_media_triplet_five': True,
+            'req_media_seating_plan': True,
+            'req_media_square': True,
+            'req_media_landscape': True,
+            'req_media_marquee': True,
+            'req_video_iframe': True,
+        })
+
+    if cost_range:
+        params.update(req_cost_range=True)
+
+    if best_value_offer:
+        params.update(req_cost_range_best_value_offer=True,
+                      req_cost_range=True)
+
+    if max_saving_offer:
+        params.update(req_cost_range_max_saving_offer=True,
+                      req_cost_range=True)
+
+    if min_cost_offer:
+        params.update(req_cost_range_min_cost_offer=True,
+                      req_cost_range=True)
+
+    if top_price_offer:
+        params.update(req_cost_range_top_price_offer=True,
+                      req_cost_range=True)
+
+    if no_singles_data:
+        params.update(req_cost_range_no_singles_data=True,
+                      req_cost_range=True)
+
+    if cost_range_details:
+        params.update(req_cost_range_details=True)
+
+    if availability:
+        params.update(req_avail_details=True)
+
+    if availability_with_performances:
+        params.update(req_avail_details=True,
+                      req_avail_details_with_perfs=True)
+
+    if tracking_id:
+        params.update(tsw_session_track_id=tracking_id)
+
+    if source_info:
+        params.update(req_src_info=True)
+    params.update(kwargs)
+
+
+def trolley_params(token=None, number_of_seats=None, discounts=None,
+                   seats=None, send_codes=None, ticket_type_code=None,
+                   performance_id=None, price_band_code=None,
+                   item_numbers_to_remove=None,
+                   add_optional_kwargs=add_optional_kwargs,
+                   **kwargs):
+    """Handle arguments common to the trolley, reserve, upsell and add-on
+    endpoints.
+
+    These endpoints accept identical arguments and these resolve to
+    identical parameters.
+
+    Args:
+        token (string): trolley token from a previous trolley
+            call.
+        number_of_seats (int): number of seats to add to the
+            trolley.
+        discounts (list): list containing discount codes for each
+            requested seat.
+        seats (list): list of seat IDs.
+        send_codes (dict): send codes indexed on backend source
+            code.
+        ticket_type_code: (string): code of ticket type to add to
+            the trolley.
+        performance_id: (string): id of the performance to add to
+            the trolley.
+        price_band_code: (string): code of price band to add to
+            the trolley
+        item_numbers_to_remove: (list): list of item numbers to
+            remove from trolley.
+        **kwargs: arbitary additional raw keyword arguments to add the
+            parameters.
+
+    Returns:
+        dict: the request parameters.
+
+    Raises:
+        InvalidParametersError: when there is an issue with the provided
+            parameters.
+
+    """
+
+    params = {}
+
+    if token:
+        params.update(trolley_token=token)
+
+    if performance_id:
+        params.update(perf_id=performance_id)
+
+    # TODO: check if 0 is a legit number to be passing in here.
+    # for the moment I'm assuming that it isn't
+    if number_of_seats:
+        params.update(no_of_seats=number_of_seats)
+
+    if ticket_type_code:
+        params.update(ticket_type_code=ticket_type_code)
+
+    if price_band_code:
+        params.update(price_band_code=price_band_code)
+
+    if item_numbers_to_remove and not token:
+        raise exceptions.InvalidParametersError(
+            'got item_numbers_to_remove but no token specified'
+        )
+    if item_numbers_to_remove:
+        params.update(
+            remove_items_list=','.join(
+                [str(item) for item in item_numbers_to_remove]
+            )
+        )
+
+    if seats:
+        params.update({
+            'seat{}'.format(i): seat
+            for i, seat in enumerate(seats)
+        })
+
+    if discounts:
+        params.update({
+            'disc{}'.format(i): discount
+            for i, discount in enumerate(discounts)
+        })
+
+    if send_codes and not isinstance(send_codes, dict):
+        raise exceptions.InvalidParametersError(
+            'send_codes should be a dictionary in the format of `{source_code: send_code}`'
+        )
+
+    if send_codes:
+        params.update({
+            '{}_send_code'.format(source_code): send_code
+            for source_code, send_code in send_codes.items()
+        })
+
+    add_optional_kwargs(params, **kwargs)
+
+    return params
+
+
+def parse_user(response):
+    return User.from_api_data(response)
+
+
+def test():
+    """Describes a call to `/f13/test.v1`_
+
+    .. _`/f13/test.v1`: http://docs.ingresso.co.uk/#test
+
+    """
+    return APICall('test.v1', {}, parser=parse_user)
+
+
+def parse_events_list(response, lazy=False, keep_raw=True):
+    _require_key(response, 'results')
+
+    result = response.get('results', {})
+    raw_events = result.get('event', [])
+    events = [
+        Event.from_api_data(data, lazy=lazy, keep_raw=keep_raw)
+        for data in raw_events
+    ]
+
+    meta = EventMeta.from_api_data(response)
+    return events, meta
+
+
+def list_events(keywords=None, start_date=None, end_date=None,
+                country_code=None, city_code=None, latitude=None,
+                longitude=None, radius=None, include_dead=False,
+                sort_order=None, page=0, page_length=0, lazy=False,
+                keep_raw=True, add_optional_kwargs=add_optional_kwargs,
+                **kwargs):
+    """Describes a call to `/f13/events.v1`_
+
+    See :meth:`Client.list_events <pyticketswitch.client.Client.list_events>`.
+
+    .. _`/f13/events.v1`: http://docs.ingresso.co.uk/#events-list
+
+    """
+    params = {}
+
+    if keywords:
+        params.update(keywords=','.join(keywords))
+
+    if start_date or end_date:
+        params.update(date_range=utils.date_range_str(start_date, end_date))
+
+    if country_code:
+        params.update(country_code=country_code)
+
+    if city_code:
+        params.update(city_code=city_code)
+
+    if all([latitude, longitude, radius]):
+        params.update(circle='{lat}:{lon}:{rad}'.format(
+            lat=latitude,
+            lon=longitude,
+            rad=radius,
+        ))
+    elif any([latitude, longitude, radius]):
+        raise exceptions.InvalidGeoParameters(
+            'Geo data must include latitude, longitude, and radius',
+        )
+
+    if include_dead:
+        params.update(include_dead=True)
+
+    if sort_order:
+        params.update(sort_order=sort_order)
+
+    if page > 0:
+        params.update(page_no=page)
+    if page_length > 0:
+        params.update(page_len=page_length)
+
+    add_optional_kwargs(params, **kwargs)
+
+    def parser(response):
+        return parse_events_list(response, lazy, keep_raw)
+
+    return APICall('events.v1', params, parser=parser)
+
+
+def parse_event_by_id(raw_event, lazy=False, keep_raw=True):
+    """Parse a single event from an ``events_by_id.v1`` response
+
+    Args:
+        raw_event (dict): the data for one of the requested IDs.
+        lazy (bool): parse the sub objects of the event when they are first
+            read.
+        keep_raw (bool, str): how to keep the raw data of the event, see
+            :meth:`Event.from_api_data
+            <pyticketswitch.event.Event.from_api_data>`.
+
+    Returns:
+        :class:`Event <pyticketswitch.event.Event>`: the event, or
+        :obj:`None` when it doesn't exist.
+
+    """
+    if not raw_event.get('event'):
+        return None
+    return Event.from_events_by_id_api_data(
+        raw_event, lazy=lazy, keep_raw=keep_raw)
+
+
+def parse_events_by_id(response, lazy=False, keep_raw=True):
+    _require_key(response, 'events_by_id')
+
+    events_by_id = response.get('events_by_id', {})
+    events = {
+        event_id: parse_event_by_id(raw_event, lazy, keep_raw)
+        for event_id, raw_event in events_by_id.items()
+        if raw_event.get('event')
+    }
+
+    meta = EventMeta.from_api_data(response)
+    return events, meta
+
+
+def get_events(event_ids, with_addons=False, with_upsells=False, lazy=False,
+               keep_raw=True, add_optional_kwargs=add_optional_kwargs,
+               **kwargs):
+    """Describes a call to `/f13/events_by_id.v1`_
+
+    See :meth:`Client.get_events <pyticketswitch.client.Client.get_events>`.
+
+    .. _`/f13/events_by_id.v1`: http://docs.ingresso.co.uk/#events-by-id
+
+    """
+    params = {}
+
+    if event_ids:
+        params.update(event_id_list=','.join(event_ids))
+
+    add_optional_kwargs(params, **kwargs)
+
+    if with_addons:
+        params.update(add_add_ons=with_addons)
+
+    if with_upsells:
+        params.update(add_upsells=with_upsells)
+
+    def parser(response):
+        return parse_events_by_id(response, lazy, keep_raw)
+
+    return APICall('events_by_id.v1', params, parser=parser)
+
+
+def parse_months(response):
+    _require_key(response, 'results')
+
+    result = response.get('results', {})
+    raw_months = result.get('month', [])
+
+    return [
+        Month.from_api_data(data)
+        for data in raw_months
+    ]
+
+
+def get_months(event_id, add_optional_kwargs=add_optional_kwargs,
+               **kwargs):
+    """Describes a call to `/f13/months.v1`_
+
+    See :meth:`Client.get_months <pyticketswitch.client.Client.get_months>`.
+
+    .. _`/f13/months.v1`: http://docs.ingresso.co.uk/#months
+
+    """
+    params = {'event_id': event_id}
+
+    add_optional_kwargs(params, **kwargs)
+
+    return APICall('months.v1', params, parser=parse_months)
+
+
+def parse_performances_list(response, lazy=False):
+    _require_key(response, 'results')
+
+    result = response.get('results', {})
+
+    raw_performances = result.get('performance', [])
+    performances = [
+        Performance.from_api_data(data, lazy=lazy)
+        for data in raw_performances
+    ]
+
+    meta = PerformanceMeta.from_api_data(response)
+    return performances, meta
+
+
+def list_performances(event_id, start_date=None, end_date=None,
+                      page_length=0, page=0, lazy=False,
+                      add_optional_kwargs=add_optional_kwargs,
+                      **kwargs):
+    """Describes a call to `/f13/performances.v1`_
+
+    See :meth:`Client.list_performances
+    <pyticketswitch.client.Client.list_performances>`.
+
+    .. _`/f13/performances.v1`: http://docs.ingresso.co.uk/#performances-list
+
+    """
+    params = {'event_id': event_id}
+
+    if page > 0:
+        params.update(page_no=page)
+
+    if page_length > 0:
+        params.update(page_len=page_length)
+
+    if start_date or end_date:
+        params.update(date_range=utils.date_range_str(start_date, end_date))
+
+    add_optional_kwargs(params, **kwargs)
+
+    def parser(response):
+        return parse_performances_list(response, lazy)
+
+    return APICall('performances.v1', params, parser=parser)
+
+
+def parse_performances_by_id(response, lazy=False):
+    _require_key(response, 'performances_by_id')
+
+    raw_performances = response.get('performances_by_id', {})
+    performances = {
+        performance_id: Performance.from_api_data(data, lazy=lazy)
+        for performance_id, data in raw_performances.items()
+    }
+
+    meta = PerformanceMeta.from_api_data(response)
+    return performances, meta
+
+
+def get_performances(performance_ids, lazy=False,
+                     add_optional_kwargs=add_optional_kwargs,
+                     **kwargs):
+    """Describes a call to `/f13/performances_by_id.v1`_
+
+    See :meth:`Client.get_performances
+    <pyticketswitch.client.Client.get_performances>`.
+
+    .. _`/f13/performances_by_id.v1`: http://docs.ingresso.co.uk/#performances-by-id
+
+    """
+    params = {
+        'perf_id_list': ','.join(performance_ids),
+    }
+
+    add_optional_kwargs(params, **kwargs)
+
+    def parser(response):
+        return parse_performances_by_id(response, lazy)
+
+    return APICall('performances_by_id.v1', params, parser=parser)
+
+
+def parse_availability(response):
+    _require_key(response, 'availability')
+
+    meta = AvailabilityMeta.from_api_data(response)
+
+    raw_availability = response.get('availability', {})
+
+    availability = [
+        TicketType.from_api_data(data)
+        for data in raw_availability.get('ticket_type', [])
+    ]
+
+    return availability, meta
+
+
+def get_availability(performance_id, number_of_seats=None, discounts=False,
+                     example_seats=False, seat_blocks=False,
+                     user_commission=False,
+                     add_optional_kwargs=add_optional_kwargs,
+                     **kwargs):
+    """Describes a call to `/f13/availability.v1`_
+
+    See :meth:`Client.get_availability
+    <pyticketswitch.client.Client.get_availability>`.
+
+    .. _`/f13/availability.v1`: http://docs.ingresso.co.uk/#availability
+
+    """
+    params = {'perf_id': performance_id}
+
+    if number_of_seats:
+        params.update(no_of_seats=number_of_seats)
+
+    if discounts:
+        params.update(add_discounts=True)
+
+    if example_seats:
+        params.update(add_example_seats=True)
+
+    if seat_blocks:
+        params.update(add_seat_blocks=True)
+
+    if user_commission:
+        params.update(req_predicted_commission=True)
+
+    add_optional_kwargs(params, **kwargs)
+
+    return APICall('availability.v1', params, parser=parse_availability)
+
+
+def parse_send_methods(response):
+    _require_key(response, 'send_methods')
+
+    raw_send_methods = response.get('send_methods', {})
+
+    send_methods = [
+        SendMethod.from_api_data(data)
+        for data in raw_send_methods.get('send_method', [])
+    ]
+
+    meta = CurrencyMeta.from_api_data(response)
+
+    return send_methods, meta
+
+
+def get_send_methods(performance_id, add_optional_kwargs=add_optional_kwargs,
+                     **kwargs):
+    """Describes a call to `/f13/send_methods.v1`_
+
+    See :meth:`Client.get_send_methods
+    <pyticketswitch.client.Client.get_send_methods>`.
+
+    .. _`/f13/send_methods.v1`: http://docs.ingresso.co.uk/#send-methods
+
+    """
+    params = {'perf_id': performance_id}
+    add_optional_kwargs(params, **kwargs)
+
+    return APICall('send_methods.v1', params, parser=parse_send_methods)
+
+
+def parse_discounts(response):
+    _require_key(response, 'discounts')
+
+    raw_discounts = response.get('discounts', {})
+
+    discounts = [
+        Discount.from_api_data(data)
+        for data in raw_discounts.get('discount', [])
+    ]
+
+    meta = CurrencyMeta.from_api_data(response)
+
+    return discounts, meta
+
+
+def get_discounts(performance_id, ticket_type_code, price_band_code,
+                  user_commission=False,
+                  add_optional_kwargs=add_optional_kwargs,
+                  **kwargs):
+    """Describes a call to `/f13/discounts.v1`_
+
+    See :meth:`Client.get_discounts
+    <pyticketswitch.client.Client.get_discounts>`.
+
+    .. _`/f13/discounts.v1`: http://docs.ingresso.co.uk/#discounts
+
+    """
+    params = {
+        'perf_id': performance_id,
+        'ticket_type_code': ticket_type_code,
+        'price_band_code': price_band_code,
+        'req_predicted_commission': user_commission,
+    }
+    add_optional_kwargs(params, **kwargs)
+
+    return APICall('discounts.v1', params, parser=parse_discounts)
+
+
+def parse_trolley(response, raise_on_unavailable_order=False, lazy=False,
+                  keep_raw=True):
+    trolley = Trolley.from_api_data(response, lazy=lazy, keep_raw=keep_raw)
+    meta = CurrencyMeta.from_api_data(response)
+
+    if raise_on_unavailable_order:
+        if trolley and trolley.input_contained_unavailable_order:
+            raise exceptions.OrderUnavailableError(
+                "inputs contained unavailable order")
+
+    return trolley, meta
+
+
+def get_trolley(raise_on_unavailable_order=False, lazy=False, keep_raw=True,
+                trolley_params=trolley_params,
+                **kwargs):
+    """Describes a call to `/f13/trolley.v1`_
+
+    Accepts the same arguments as :meth:`Client.get_trolley
+    <pyticketswitch.client.Client.get_trolley>`.
+
+    .. _`/f13/trolley.v1`: http://docs.ingresso.co.uk/#trolley
+
+    """
+    params = trolley_params(**kwargs)
+
+    def parser(response):
+        return parse_trolley(
+            response, raise_on_unavailable_order, lazy, keep_raw)
+
+    return APICall('trolley.v1', params, parser=parser)
+
+
+def parse_upsells(response, lazy=False, keep_raw=True):
+    _require_key(response, 'results', name='JSON')
+
+    results = response.get('results', {})
+
+    raw_events = results.get('event', [])
+    events = [
+        Event.from_api_data(data, lazy=lazy, keep_raw=keep_raw)
+        for data in raw_events
+    ]
+
+    meta = EventMeta.from_api_data(response)
+
+    return events, meta
+
+
+def get_upsells(lazy=False, keep_raw=True, trolley_params=trolley_params,
+                **kwargs):
+    """Describes a call to `/f13/upsells.v1`_
+
+    Accepts the same arguments as :meth:`Client.get_upsells
+    <pyticketswitch.client.Client.get_upsells>`.
+
+    .. _`/f13/upsells.v1`: http://docs.ingresso.co.uk/#related-events
+
+    """
+    params = trolley_params(**kwargs)
+
+    def parser(response):
+        return parse_upsells(response, lazy, keep_raw)
+
+    return APICall('upsells.v1', params, parser=parser)
+
+
+def get_addons(lazy=False, keep_raw=True, trolley_params=trolley_params,
+               **kwargs):
+    """Describes a call to `/f13/add_ons.v1`_
+
+    Accepts the same arguments as :meth:`Client.get_addons
+    <pyticketswitch.client.Client.get_addons>`.
+
+    .. _`/f13/add_ons.v1`: http://docs.ingresso.co.uk/#add-ons
+
+    """
+    params = trolley_params(**kwargs)
+
+    def parser(response):
+        return parse_events_list(response, lazy, keep_raw)
+
+    return APICall('add_ons.v1', params, parser=parser)
+
+
+def parse_reservation(response, raise_on_unavailable_order=False,
+                      lazy=False, keep_raw=True):
+    reservation = Reservation.from_api_data(
+        response, lazy=lazy, keep_raw=keep_raw)
+    meta = CurrencyMeta.from_api_data(response)
+
+    if raise_on_unavailable_order:
+        if reservation and reservation.input_contained_unavailable_order:
+            raise exceptions.OrderUnavailableError(
+                "inputs contained unavailable order",
+                reservation=reservation,
+                meta=meta)
+
+    return reservation, meta
+
+
+def make_reservation(raise_on_unavailable_order=False, lazy=False,
+                     keep_raw=True, trolley_params=trolley_params,
+                     **kwargs):
+    """Describes a call to `/f13/reserve.v1`_
+
+    Accepts the same arguments as :meth:`Client.make_reservation
+    <pyticketswitch.client.Client.make_reservation>`.
+
+    .. _`/f13/reserve.v1`: http://docs.ingresso.co.uk/#reserve
+
+    """
+    params = trolley_params(**kwargs)
+
+    def parser(response):
+        return parse_reservation(
+            response, raise_on_unavailable_order, lazy, keep_raw)
+
+    return APICall('reserve.v1', params, method=POST, parser=parser)
+
+
+def parse_released(response):
+    return response.get('released_ok', False)
+
+
+def release_reservation(transaction_uuid, **kwargs):
+    """Describes a call to `/f13/release.v1`_
+
+    See :meth:`Client.release_reservation
+    <pyticketswitch.client.Client.release_reservation>`.
+
+    .. _`/f13/release.v1`: http://docs.ingresso.co.uk/#release
+
+    """
+    params = {'transaction_uuid': transaction_uuid}
+    kwargs.update(params)
+
+    return APICall('release.v1', kwargs, method=POST, parser=parse_released)
+
+
+def get_reservation(transaction_uuid, raise_on_unavailable_order=False,
+                    lazy=False, keep_raw=True, **kwargs):
+    """Describes a call to `/f13/reserve_page_archive.v1`_
+
+    See :meth:`Client.get_reservation
+    <pyticketswitch.client.Client.get_reservation>`.
+
+    .. _`/f13/reserve_page_archive.v1`: http://docs.ingresso.co.uk/#reserve_page_archive
+
+    """
+    params = {"transaction_uuid": transaction_uuid}
+
+    def parser(response):
+        return parse_reservation(
+            response, raise_on_unavailable_order, lazy, keep_raw)
+
+    return APICall('reserve_page_archive.v1', params, parser=parser)
+
+
+def parse_status(response, lazy=False, keep_raw=True):
+    status = Status.from_api_data(response, lazy=lazy, keep_raw=keep_raw)
+    meta = CurrencyMeta.from_api_data(response)
+
+    return status, meta
+
+
+def get_status(transaction_uuid=None, transaction_id=None, customer=False,
+               external_sale_page=False, lazy=False, keep_raw=True,
+               add_optional_kwargs=add_optional_kwargs,
+               **kwargs):
+    """Describes a call to `/f13/status.v1`_
+
+    See :meth:`Client.get_status <pyticketswitch.client.Client.get_status>`.
+
+    .. _`/f13/status.v1`: http://docs.ingresso.co.uk/#status
+
+    """
+    params = {}
+
+    if customer:
+        params.update(add_customer=True)
+
+    if external_sale_page:
+        params.update(add_external_sale_page=True)
+
+    add_optional_kwargs(params, **kwargs)
+
+    def parser(response):
+        return parse_status(response, lazy, keep_raw)
+
+    if transaction_id:
+        params.update(transaction_id=transaction_id)
+        return APICall('trans_id_status.v1', params, parser=parser)
+
+    params.update(transaction_uuid=transaction_uuid)
+    return APICall('status.v1', params, parser=parser)
+
+
+def parse_purchase(response, lazy=False, keep_raw=True):
+    callout_data = response.get('callout')
+
+    if callout_data:
+        status = None
+        callout = Callout.from_api_data(callout_data)
+    else:
+        callout = None
+        status = Status.from_api_data(
+            response, lazy=lazy, keep_raw=keep_raw)
+
+    meta = CurrencyMeta.from_api_data(response)
+
+    return status, callout, meta
+
+
+def make_purchase(transaction_uuid, customer, payment_method=None,
+                  send_confirmation_email=True, agent_reference=None,
+                  lazy=False, keep_raw=True, **kwargs):
+    """Describes a call to `/f13/purchase.v1`_
+
+    See :meth:`Client.make_purchase
+    <pyticketswitch.client.Client.make_purchase>`.
+
+    .. _`/f13/purchase.v1`: http://docs.ingresso.co.uk/#purchase
+
+    """
+    params = {'transaction_uuid': transaction_uuid}
+
+    if send_confirmation_email:
+        params.update(send_confirmation_email=True)
+
+    customer_params = customer.as_api_parameters()
+
+    if customer_params:
+        params.update(customer_params)
+
+    if payment_method:
+        params.update(payment_method.as_api_parameters())
+
+    if agent_reference:
+        params.update(agent_reference=agent_reference)
+
+    params.update(kwargs)
+
+    def parser(response):
+        return parse_purchase(response, lazy, keep_raw)
+
+    return APICall('purchase.v1', params, method=POST, parser=parser)
+
+
+def get_purchase(transaction_uuid, lazy=False, keep_raw=True, **kwargs):
+    """Describes a call to `/f13/purchase_page_archive.v1`_
+
+    See :meth:`Client.get_purchase
+    <pyticketswitch.client.Client.get_purchase>`.
+
+    .. _`/f13/purchase_page_archive.v1`: http://docs.ingresso.co.uk/#purchase_page_archive
+
+    """
+    params = {"transaction_uuid": transaction_uuid}
+
+    def parser(response):
+        return parse_purchase(response, lazy, keep_raw)
+
+    return APICall('purchase_page_archive.v1', params, parser=parser)
+
+
+def next_callout(this_token, next_token, returned_data, lazy=False,
+                 keep_raw=True, **kwargs):
+    """Describes a call to `/f13/callback.v1`_
+
+    See :meth:`Client.next_callout
+    <pyticketswitch.client.Client.next_callout>`.
+
+    .. _`/f13/callback.v1`: http://docs.ingresso.co.uk/#purchasing-with-redirect
+
+    """
+    endpoint = "callback.v1/this.{}/next.{}".format(this_token, next_token)
+
+    params = returned_data
+    params.update(kwargs)
+
+    def parser(response):
+        return parse_purchase(response, lazy, keep_raw)
+
+    return APICall(endpoint, params, method=POST, parser=parser)
+
+
+def parse_cancellation(response, lazy=False, keep_raw=True):
+    result = CancellationResult.from_api_data(
+        response, lazy=lazy, keep_raw=keep_raw)
+    meta = CurrencyMeta.from_api_data(response)
+
+    return result, meta
+
+
+def cancel_purchase(transaction_uuid, cancel_items_list=None, lazy=False,
+                    keep_raw=True, add_optional_kwargs=add_optional_kwargs,
+                    **kwargs):
+    """Describes a call to `/f13/cancel.v1`_
+
+    See :meth:`Client.cancel_purchase
+    <pyticketswitch.client.Client.cancel_purchase>`.
+
+    .. _`/f13/cancel.v1`: http://docs.ingresso.co.uk/#cancel
+
+    """
+    params = {
+        "transaction_uuid": transaction_uuid,
+    }
+    if cancel_items_list:
+        params.update(cancel_items_list=",".join(map(str, cancel_items_list)))
+
+    add_optional_kwargs(params, **kwargs)
+
+    def parser(response):
+        return parse_cancellation(response, lazy, keep_raw)
+
+    return APICall('cancel.v1', params, method=POST, parser=parser)
@@ -1,3 +1,5 @@
+import functools
+
 from pyticketswitch.exceptions import IntegrityError
 from pyticketswitch.cost_range import CostRange
 from pyticketswitch.ticket_type import TicketType
@@ -6,11 +8,80 @@ from pyticketswitch.media import Media
 from pyticketswitch.review import Review
 from pyticketswitch.availability import AvailabilityDetails
 from pyticketswitch.field import Field
-from pyticketswitch.mixins import JSONMixin, PaginationMixin
+from pyticketswitch.mixins import (JSONMixin, LazyAttribute, LazyMixin,
+                                   PaginationMixin, RawAttribute, retain_raw)
 from pyticketswitch.currency import CurrencyMeta
 
 
-class Event(JSONMixin, object):
+def _parse_cost_range_details(data):
+    api_cost_range_details = data.get('cost_range_details', {})
+    ticket_type_list = api_cost_range_details.get('ticket_type', [])
+    return [
+        TicketType.from_api_data(ticket_type)
+        for ticket_type in ticket_type_list
+    ]
+
+
+def _parse_content(data):
+    api_content = data.get('structured_info', {})
+    return {
+        key: Content.from_api_data(value)
+        for key, value in api_content.items()
+    }
+
+
+def _parse_fields(data):
+    return {
+        field.get('custom_field_name'): Field.from_api_data(field)
+        for field in data.get('custom_fields', {})
+    }
+
+
+def _parse_media(data):
+    media = {}
+    api_media = data.get('media', {})
+    for asset in api_media.get('media_asset', []):
+        new_media = Media.from_api_data(asset)
+        media[new_media.name] = new_media
+
+    api_video = data.get('video_iframe')
+    if api_video:
+        kwargs = {
+            'secure_complete_url': api_video.get('video_iframe_url_when_secure'),
+            'insecure_complete_url': api_video.get('video_iframe_url_when_insecure'),
+            'caption': api_video.get('video_iframe_caption'),
+            'caption_html': api_video.get('video_iframe_caption_html'),
+            'width': api_video.get('video_iframe_width'),
+            'height': api_video.get('video_iframe_height'),
+            'name': 'video',
+        }
+        new_video = Media.from_api_data(kwargs)
+        media['video'] = new_video
+
+    return media
+
+
+def _parse_reviews(data):
+    api_reviews = data.get('reviews', {})
+    return [
+        Review.from_api_data(api_review)
+        for api_review in api_reviews.get('review', [])
+    ]
+
+
+def _parse_availability_details(data):
+    return AvailabilityDetails.from_api_data(data.get('avail_details', {}))
+
+
+def _parse_component_events(data, lazy=False, keep_raw=True):
+    api_component_events = data.get('meta_event_component_events', {})
+    return [
+        Event.from_api_data(meta_event, lazy=lazy, keep_raw=keep_raw)
+        for meta_event in api_component_events.get('event', [])
+    ]
+
+
+class Event(LazyMixin, JSONMixin, object):
     """Describes a product in the ticketswitch system.
 
     Attributes:
@@ -87,7 +158,8 @@ class Event(JSONMixin, object):
         valid_quantities (list): list of valid quanities available for
             purchase. from cached data, only available when requested by
             **get_events** or **get_event**.
-        raw (dict): the raw data used to generate the object.
+        raw (dict): the raw data used to generate the object. :obj:`None`
+            when the event was created with ``keep_raw=False``.
         is_addon (bool): indicates that the event is an addon.
         is_auto_quantity_add_on (bool): Indicates whether add on quantity will
             be modified based on the number of ticket orders, if true number
@@ -101,8 +173,31 @@ class Event(JSONMixin, object):
             for internal use only.
         lingo_code (str): a code for the type of event, e.g. theatre or
             attraction. This is for internal use only.
+
+    Events created with ``lazy=True`` parse **cost_range**,
+    **no_singles_cost_range**, **cost_range_details**, **content**,
+    **fields**, **media**, **reviews**, **availability_details** and
+    **component_events** the first time they are read.
+
     """
 
+    cost_range = LazyAttribute('cost_range', CostRange.from_cost_range_data)
+    no_singles_cost_range = LazyAttribute(
+        'no_singles_cost_range',
+        functools.partial(CostRange.from_cost_range_data, singles=False))
+    cost_range_details = LazyAttribute(
+        'cost_range_details', _parse_cost_range_details)
+    content = LazyAttribute('content', _parse_content)
+    fields = LazyAttribute('fields', _parse_fields)
+    media = LazyAttribute('media', _parse_media)
+    reviews = LazyAttribute('reviews', _parse_reviews)
+    availability_details = LazyAttribute(
+        'availability_details', _parse_availability_details)
+    component_events = LazyAttribute(
+        'component_events', _parse_component_events,
+        options=('lazy', 'keep_raw'))
+    raw = RawAttribute('raw')
+
     def __init__(self, id_, status=None, event_type=None, source=None,
                  source_code=None, venue=None, description=None, postcode=None,
                  classes=None, filters=None, upsell_list=None, city=None,
@@ -189,12 +284,16 @@ class Event(JSONMixin, object):
         self.lingo_code = lingo_code
 
     @classmethod
-    def class_dict_from_api_data(cls, data):
+    def class_dict_from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a dict of Event data from a raw ticketswitch API call
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a event.
+            lazy (bool): leave out the attributes that are parsed on first
+                access by lazy events.
+            keep_raw (bool, str): how to keep the raw data, see
+                :meth:`from_api_data <pyticketswitch.event.Event.from_api_data>`.
 
         Returns:
             dict: a new dict populated with the data from the api for creating
@@ -212,72 +311,6 @@ class Event(JSONMixin, object):
         # the raw field 'has_no_perfs' is a negative flag, so I'm inverting it
         has_performances = not data.get('has_no_perfs', False)
 
-        api_cost_range = data.get('cost_range', {})
-        api_no_singles_cost_range = api_cost_range.get('no_singles_cost_range', {})
-        cost_range = None
-        no_singles_cost_range = None
-
-        if api_cost_range:
-            api_cost_range['singles'] = True
-            cost_range = CostRange.from_api_data(api_cost_range)
-
-        if api_no_singles_cost_range:
-            api_no_singles_cost_range['singles'] = False
-            no_singles_cost_range = CostRange.from_api_data(
-                api_no_singles_cost_range)
-
-        api_cost_range_details = data.get('cost_range_details', {})
-        ticket_type_list = api_cost_range_details.get('ticket_type', [])
-        cost_range_details = [
-            TicketType.from_api_data(ticket_type)
-            for ticket_type in ticket_type_list
-        ]
-
-        api_content = data.get('structured_info', {})
-        content = {
-            key: Content.from_api_data(value)
-            for key, value in api_content.items()
-        }
-
-        fields = {
-            field.get('custom_field_name'): Field.from_api_data(field)
-            for field in data.get('custom_fields', {})
-        }
-
-        media = {}
-        api_media = data.get('media', {})
-        for asset in api_media.get('media_asset', []):
-            new_media = Media.from_api_data(asset)
-            media[new_media.name] = new_media
-
-        api_video = data.get('video_iframe')
-        if api_video:
-            kwargs = {
-                'secure_complete_url': api_video.get('video_iframe_url_when_secure'),
-                'insecure_complete_url': api_video.get('video_iframe_url_when_insecure'),
-                'caption': api_video.get('video_iframe_caption'),
-                'caption_html': api_video.get('video_iframe_caption_html'),
-                'width': api_video.get('video_iframe_width'),
-                'height': api_video.get('video_iframe_height'),
-                'name': 'video',
-            }
-            new_video = Media.from_api_data(kwargs)
-            media['video'] = new_video
-
-        api_reviews = data.get('reviews', {})
-        reviews = [
-            Review.from_api_data(api_review)
-            for api_review in api_reviews.get('review', [])
-        ]
-
-        availability_details = AvailabilityDetails.from_api_data(
-            data.get('avail_details', {}))
-        api_component_events = data.get('meta_event_component_events', {})
-        component_events = [
-            Event.from_api_data(meta_event)
-            for meta_event in api_component_events.get('event', [])
-        ]
-
         lingo_code = None
         raw_lingo_data = data.get('lingo_data')
         if raw_lingo_data:
@@ -295,7 +328,6 @@ class Event(JSONMixin, object):
             'classes': data.get('classes'),
             #TODO: don't actually know what filters look like yet...
             'filters': data.get('custom_filter', []),
-            'fields': fields,
 
             'postcode': data.get('postcode'),
             'city': data.get('city_desc'),
@@ -318,10 +350,6 @@ class Event(JSONMixin, object):
 
             'upsell_list': data.get('event_upsell_list', {}).get('event_id', []),
 
-            'cost_range': cost_range,
-            'no_singles_cost_range': no_singles_cost_range,
-            'cost_range_details': cost_range_details,
-
             # extra info
             'event_info_html': data.get('event_info_html'),
             'event_info': data.get('event_info'),
@@ -329,16 +357,10 @@ class Event(JSONMixin, object):
             'venue_addr': data.get('venue_addr'),
             'venue_info': data.get('venue_info'),
             'venue_info_html': data.get('venue_info_html'),
-            'content': content,
 
-            'media': media,
-            'reviews': reviews,
             'critic_review_percent': data.get('critic_review_percent'),
 
-            'availability_details': availability_details,
-            'component_events': component_events,
             'valid_quantities': data.get('valid_quantities'),
-            'raw': data,
 
             'is_add_on': data.get('is_add_on', False),
             'is_auto_quantity_add_on': data.get('is_auto_quantity_add_on', False),
@@ -348,15 +370,32 @@ class Event(JSONMixin, object):
             'lingo_code': lingo_code,
         }
 
+        if not lazy:
+            for name in cls.lazy_attributes():
+                kwargs[name] = getattr(cls, name).load(
+                    data, {'keep_raw': keep_raw})
+
+        kwargs.update(raw=retain_raw(data, keep_raw))
+
         return kwargs
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Event object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a event.
+            lazy (bool): parse the pricing, content, media, reviews,
+                availability details and component events when they are
+                first read rather than up front.
+            keep_raw (bool, str): :obj:`True` keeps **data** as the
+                event's **raw** attribute, :obj:`False` drops it and
+                ``'compact'`` keeps a serialised copy that is decoded each
+                time **raw** is read. Lazy events hold on to **data** until
+                all of their lazy attributes have been read regardless.
+                Component events are created with the same **lazy** and
+                **keep_raw**.
 
         Returns:
             :class:`Event <pyticketswitch.event.Event>`: a new
@@ -365,16 +404,26 @@ class Event(JSONMixin, object):
 
         """
 
-        kwargs = cls.class_dict_from_api_data(data)
-        return cls(**kwargs)
+        kwargs = cls.class_dict_from_api_data(
+            data, lazy=lazy, keep_raw=keep_raw)
+        event = cls(**kwargs)
+        if lazy:
+            event.defer(data, lazy=lazy, keep_raw=keep_raw)
+        return event
 
     @classmethod
-    def from_events_by_id_api_data(cls, data):
+    def from_events_by_id_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Event object from API data from the events_by_id call.
 
         Args:
             data (dict): the part of the response from the ticketswitch
                 `events_by_id` API call containing events and other data.
+            lazy (bool): parse the sub objects of the events when they are
+                first read, see :meth:`from_api_data
+                <pyticketswitch.event.Event.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the events,
+                see :meth:`from_api_data
+                <pyticketswitch.event.Event.from_api_data>`.
 
         Returns:
             :class:`Event <pyticketswitch.event.Event>`: a new
@@ -383,18 +432,22 @@ class Event(JSONMixin, object):
 
         """
 
-        kwargs = cls.class_dict_from_api_data(data.get('event'))
+        raw_event = data.get('event')
+        kwargs = cls.class_dict_from_api_data(
+            raw_event, lazy=lazy, keep_raw=keep_raw)
 
         if data.get('add_ons'):
             addons=[
-                Event.from_api_data(raw_addon)
+                Event.from_api_data(
+                    raw_addon, lazy=lazy, keep_raw=keep_raw)
                 for raw_addon in data.get('add_ons')
             ]
             kwargs.update(addon_events=addons)
 
         if data.get('upsells'):
             upsells=[
-                Event.from_api_data(raw_upsell)
+                Event.from_api_data(
+                    raw_upsell, lazy=lazy, keep_raw=keep_raw)
                 for raw_upsell in data.get('upsells')
             ]
             kwargs.update(upsell_events=upsells)
@@ -402,7 +455,10 @@ class Event(JSONMixin, object):
         if data.get('venue_is_enforced') is not None:
             kwargs.update(venue_is_enforced=data.get('venue_is_enforced'))
 
-        return cls(**kwargs)
+        event = cls(**kwargs)
+        if lazy:
+            event.defer(raw_event, lazy=lazy, keep_raw=keep_raw)
+        return event
 
     def __repr__(self):
         return u'<Event {}:{}>'.format(
@@ -19,13 +19,23 @@ class InvalidParametersError(PyticketswitchError):
 
 
 class InvalidResponseError(PyticketswitchError):
-    pass
+    def __init__(self, msg, status_code=None, *args, **kwargs):
+        super(InvalidResponseError, self).__init__(msg, *args, **kwargs)
+        self.status_code = status_code
 
 
 class InvalidGeoParameters(PyticketswitchError):
     pass
 
 
+class DeadlineExceededError(PyticketswitchError):
+    pass
+
+
+class ClientOverloadedError(PyticketswitchError):
+    pass
+
+
 class IntegrityError(PyticketswitchError):
 
     def __init__(self, message, data, *args):
@@ -49,6 +59,12 @@ class BackendThrottleError(BackendError):
     pass
 
 
+class CircuitOpenError(BackendDownError):
+    def __init__(self, msg, source_code=None, *args, **kwargs):
+        super(CircuitOpenError, self).__init__(msg, *args, **kwargs)
+        self.source_code = source_code
+
+
 class CallbackGoneError(APIError):
     pass
 
@@ -0,0 +1,143 @@
+"""Hedged requests to cut the tail latency of read only calls.
+
+A few slow backend systems can dominate the slowest responses from the API.
+Give a :class:`HedgePolicy` to the client to send a second, identical,
+request when the first one hasn't answered within the time that most
+requests to the same endpoint take, and use whichever response comes back
+first::
+
+    >>> from pyticketswitch.hedging import HedgePolicy
+    >>> client = Client('demo', 'demopass', hedge=HedgePolicy(percentile=95))
+
+The wait before hedging is the **percentile** of the recent response times
+for the endpoint, so only around one in twenty requests is hedged at the
+95th percentile. Until enough responses have been timed the fixed **delay**
+is used, or nothing is hedged when it isn't set.
+
+Only ``GET`` requests to the read only endpoints are hedged. The
+:class:`AsyncClient <pyticketswitch.async_client.AsyncClient>` cancels the
+slower request, the threaded :class:`Client
+<pyticketswitch.client.Client>` can't interrupt a request in progress so it
+stops waiting for it and drops its response.
+
+"""
+import collections
+import math
+import threading
+
+from pyticketswitch import utils
+from pyticketswitch.endpoints import GET, READ_ONLY_ENDPOINTS
+
+
+DEFAULT_PERCENTILE = 95
+DEFAULT_MIN_DELAY = 0.01
+DEFAULT_WINDOW = 200
+DEFAULT_MIN_SAMPLES = 20
+
+
+class HedgePolicy(object):
+    """Decides if and when a second request should be sent
+
+    Args:
+        percentile (float): the percentile of recent response times to wait
+            for before hedging. Defaults to 95. :obj:`None` always waits for
+            the fixed **delay**.
+        delay (float): seconds to wait before hedging when there aren't
+            enough response times yet. Defaults to :obj:`None`, which
+            doesn't hedge until there are.
+        min_delay (float): the minimum seconds to wait before hedging.
+            Defaults to 0.01.
+        endpoints (set): endpoints that can be hedged. Defaults to
+            :data:`READ_ONLY_ENDPOINTS
+            <pyticketswitch.endpoints.READ_ONLY_ENDPOINTS>`.
+        window (int): the number of recent response times kept per endpoint.
+            Defaults to 200.
+        min_samples (int): the number of response times needed before the
+            percentile is used. Defaults to 20.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        hedged (int): the number of second requests that have been sent.
+        wins (int): the number of times the second request answered first.
+
+    """
+
+    def __init__(self, percentile=DEFAULT_PERCENTILE, delay=None,
+                 min_delay=DEFAULT_MIN_DELAY, endpoints=None,
+                 window=DEFAULT_WINDOW, min_samples=DEFAULT_MIN_SAMPLES,
+                 clock=None):
+        self.percentile = percentile
+        self.delay = delay
+        self.min_delay = min_delay
+        self.endpoints = frozenset(
+            READ_ONLY_ENDPOINTS if endpoints is None else endpoints)
+        self.window = window
+        self.min_samples = min_samples
+        self.clock = clock or utils.monotonic
+        self.hedged = 0
+        self.wins = 0
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def is_hedgeable(self, call):
+        """Indicates that a second request can be sent for the call
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call.
+
+        Returns:
+            bool: :obj:`True` for ``GET`` calls to one of the **endpoints**.
+
+        """
+        return call.method == GET and call.endpoint in self.endpoints
+
+    def record(self, endpoint, seconds):
+        """Remember how long a request took
+
+        Args:
+            endpoint (str): the API endpoint.
+            seconds (float): the time taken to get the response.
+
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = collections.deque(
+                    maxlen=self.window)
+            samples.append(seconds)
+
+    def record_hedge(self):
+        """Count a second request that has been sent"""
+        with self._lock:
+            self.hedged += 1
+
+    def record_win(self):
+        """Count a second request that answered before the first one"""
+        with self._lock:
+            self.wins += 1
+
+    def get_delay(self, endpoint):
+        """Get the time to wait for a response before hedging
+
+        Args:
+            endpoint (str): the API endpoint.
+
+        Returns:
+            float: seconds to wait, or :obj:`None` when the request shouldn't
+            be hedged.
+
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+
+        if self.percentile is None or len(samples) < self.min_samples:
+            delay = self.delay
+        else:
+            rank = int(math.ceil(self.percentile / 100.0 * len(samples)))
+            delay = samples[max(0, rank - 1)]
+
+        if delay is None:
+            return None
+        return max(self.min_delay, delay)
@@ -1,39 +1,79 @@
 import datetime
 import decimal
 import json
+import pickle
 
 from pyticketswitch import utils
 
 
-class JSONMixin(object):
-    """Adds json encoding functionality to objects."""
+_MISSING = object()
 
-    def __jsondict__(self, hide_none=True, hide_empty=True):
+_SLOTS = {}
+
+_LAZY_ATTRIBUTES = {}
+
+
+def _slot_names(cls):
+    names = _SLOTS.get(cls)
+    if names is None:
+        names = _SLOTS[cls] = [
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())
+            if name not in ('__dict__', '__weakref__')
+        ]
+    return names
+
+
+def _attribute_items(obj):
+    items = [
+        (name, getattr(obj, name, _MISSING))
+        for name in _slot_names(type(obj))
+    ]
+    items = [(name, value) for name, value in items if value is not _MISSING]
+    items.extend(getattr(obj, '__dict__', {}).items())
+    return items
+
+
+def _sanitise(obj, hide_none=True, hide_empty=True):
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+
+    if hasattr(obj, '__jsondict__'):
+        return obj.__jsondict__(hide_none=hide_none, hide_empty=hide_empty)
+
+    if isinstance(obj, list):
+        return [_sanitise(item, hide_none, hide_empty) for item in obj]
 
-        def sanitise(obj):
-            if isinstance(obj, datetime.datetime):
-                return obj.isoformat()
+    if isinstance(obj, dict):
+        return {
+            key: _sanitise(value, hide_none, hide_empty)
+            for key, value in obj.items()
+        }
 
-            if isinstance(obj, datetime.date):
-                return obj.isoformat()
+    return obj
 
-            if isinstance(obj, decimal.Decimal):
-                return float(obj)
 
-            if hasattr(obj, '__jsondict__'):
-                return obj.__jsondict__(hide_none=hide_none, hide_empty=hide_empty)
+class JSONMixin(object):
+    """Adds json encoding functionality to objects.
 
-            if isinstance(obj, list):
-                return [sanitise(item) for item in obj]
+    Attributes held in ``__slots__`` are serialised along with those in the
+    object's ``__dict__``.
 
-            if isinstance(obj, dict):
-                return {key: sanitise(value) for key, value in obj.items()}
+    """
 
-            return obj
+    __slots__ = ()
 
+    def __jsondict__(self, hide_none=True, hide_empty=True):
         return {
-            key: sanitise(obj)
-            for key, obj in self.__dict__.items()
+            key: _sanitise(obj, hide_none, hide_empty)
+            for key, obj in _attribute_items(self)
 
             # when hiding None's and the object is None, skip the object
             if not (hide_none and obj is None)
@@ -92,6 +132,246 @@ class JSONMixin(object):
         )
 
 
+class LazyAttribute(object):
+    """An attribute that can be parsed from the API data on first access
+
+    Objects created with ``lazy=True`` hold on to the API data for their
+    lazy attributes instead of parsing it up front, see
+    :meth:`LazyMixin.defer`. Reading the attribute parses the data, and the
+    result is stored on the object so it's only parsed once. When several
+    threads read it at the same time they all get the first value stored.
+
+    Args:
+        name (str): the name of the attribute.
+        parse (callable): takes the API data the object was created from and
+            returns the value of the attribute.
+        options (tuple): names of the keyword arguments given to
+            :meth:`LazyMixin.defer` that are passed on to **parse**.
+
+    """
+
+    def __init__(self, name, parse, options=()):
+        self.name = name
+        self.parse = parse
+        self.options = options
+
+    def load(self, data, options=None):
+        """Parse the value of the attribute from the API data
+
+        Args:
+            data (dict): the API data the object was created from.
+            options (dict): keyword arguments for **parse**, only the ones
+                named in **options** are passed on.
+
+        Returns:
+            the value of the attribute.
+
+        """
+        kwargs = {}
+        if options:
+            kwargs = dict(
+                (name, options[name])
+                for name in self.options if name in options
+            )
+        return self.parse(data, **kwargs)
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        values = obj.__dict__
+        # the deferred data and options are a tuple that is only ever
+        # replaced or dropped, never changed, so copies of the object and
+        # other threads always see all of it
+        deferred = values.get('_deferred')
+        if deferred is not None and self.name not in values:
+            data, options = deferred
+            values.setdefault(self.name, self.load(data, options))
+            if all(name in values for name in obj.lazy_attributes()):
+                values.pop('_deferred', None)
+
+        try:
+            return values[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+class LazyMixin(object):
+    """Adds lazily parsed attributes to an object
+
+    Attributes that are expensive to parse and often not read are declared on
+    the class as :class:`LazyAttribute
+    <pyticketswitch.mixins.LazyAttribute>`. They behave as normal attributes
+    until :meth:`defer` is called. Classes with ``__slots__`` must include
+    ``__dict__`` in them, the lazy attributes and the data they are parsed
+    from are kept there.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def lazy_attributes(cls):
+        """Get the names of the lazy attributes of the class
+
+        Returns:
+            list: the names of the attributes.
+
+        """
+        names = _LAZY_ATTRIBUTES.get(cls)
+        if names is None:
+            names = _LAZY_ATTRIBUTES[cls] = [
+                name for name in dir(cls)
+                if isinstance(getattr(cls, name, None), LazyAttribute)
+            ]
+        return names
+
+    def defer(self, data, **options):
+        """Parse the lazy attributes from the API data when they're first read
+
+        Any values already set for the lazy attributes are discarded.
+
+        Args:
+            data (dict): the API data the object was created from.
+            **options: keyword arguments for the lazy attributes that take
+                them, see :class:`LazyAttribute
+                <pyticketswitch.mixins.LazyAttribute>`.
+
+        """
+        for name in self.lazy_attributes():
+            self.__dict__.pop(name, None)
+        self.__dict__['_deferred'] = (data, options)
+
+    def is_deferred(self, name):
+        """Indicates that an attribute hasn't been parsed yet
+
+        Args:
+            name (str): the name of the attribute.
+
+        Returns:
+            bool: :obj:`True` when the attribute will be parsed when it's
+            next read.
+
+        """
+        values = self.__dict__
+        if '_deferred' not in values or name in values:
+            return False
+        return name in self.lazy_attributes()
+
+    def __jsondict__(self, hide_none=True, hide_empty=True):
+        for name in self.lazy_attributes():
+            if self.is_deferred(name):
+                getattr(self, name)
+        return super(LazyMixin, self).__jsondict__(
+            hide_none=hide_none, hide_empty=hide_empty)
+
+
+#: Values accepted for **keep_raw**, see :func:`retain_raw`.
+KEEP_RAW_OPTIONS = (True, False, 'compact')
+
+
+class CompactData(object):
+    """API data kept serialised to save memory
+
+    A pickled copy of the data takes about a sixth of the memory of the
+    decoded dictionaries and lists.
+
+    Args:
+        data: the data to keep.
+
+    """
+
+    def __init__(self, data):
+        self.pickled = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    def load(self):
+        """Get a copy of the data
+
+        Returns:
+            the data, decoded again each time this is called.
+
+        """
+        return pickle.loads(self.pickled)
+
+    def __jsondict__(self, hide_none=True, hide_empty=True):
+        return _sanitise(self.load(), hide_none, hide_empty)
+
+
+def check_keep_raw(keep_raw):
+    """Check a value for **keep_raw**
+
+    Args:
+        keep_raw: the value to check.
+
+    Raises:
+        ValueError: when **keep_raw** isn't one of :data:`KEEP_RAW_OPTIONS`.
+
+    """
+    if keep_raw not in KEEP_RAW_OPTIONS:
+        raise ValueError(
+            'keep_raw must be one of {}, not {!r}'.format(
+                KEEP_RAW_OPTIONS, keep_raw))
+
+
+def retain_raw(data, keep_raw=True):
+    """Get the raw API data to keep on an object
+
+    Args:
+        data (dict): the raw data used to generate the object.
+        keep_raw (bool, str): :obj:`True` to keep the data as it is,
+            :obj:`False` to drop it or ``'compact'`` to keep it as
+            :class:`CompactData <pyticketswitch.mixins.CompactData>`.
+
+    Returns:
+        the data to store, :obj:`None` when it's dropped.
+
+    Raises:
+        ValueError: when **keep_raw** isn't one of :data:`KEEP_RAW_OPTIONS`.
+
+    """
+    check_keep_raw(keep_raw)
+    if keep_raw == 'compact':
+        return CompactData(data)
+    if keep_raw:
+        return data
+    return None
+
+
+class RawAttribute(object):
+    """An attribute holding the raw API data an object was created from
+
+    When the data was kept as :class:`CompactData
+    <pyticketswitch.mixins.CompactData>` reading the attribute decodes a new
+    copy of it.
+
+    Args:
+        name (str): the name of the attribute.
+
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+        if isinstance(value, CompactData):
+            return value.load()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
 class PaginationMixin(object):
     """Adds pagination information to a responses meta data.
 
@@ -149,6 +429,20 @@ class PaginationMixin(object):
 
         return True
 
+    def remaining_pages(self):
+        """Page numbers of the pages after the current one
+
+        Returns:
+            list: the page numbers still to be fetched, empty when this is
+            the last page or the response is not paginated.
+
+        """
+        if self.page_number is None or not self.pages_remaining:
+            return []
+
+        first = self.page_number + 1
+        return list(range(first, first + self.pages_remaining))
+
 
 class SeatPricingMixin(object):
     """Adds seat pricing to an object
@@ -162,6 +456,9 @@ class SeatPricingMixin(object):
             seat/ticket when not on offer.
     """
 
+    __slots__ = ('seatprice', 'surcharge', 'non_offer_seatprice',
+                 'non_offer_surcharge')
+
     def __init__(self, seatprice=None, surcharge=None, non_offer_seatprice=None,
                  non_offer_surcharge=None, *args, **kwargs):
         super(SeatPricingMixin, self).__init__(*args, **kwargs)
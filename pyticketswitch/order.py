@@ -218,12 +218,18 @@ class Order(JSONMixin, object):
         self.external_management_url = external_management_url
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new **Order** object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a order.
+            lazy (bool): parse the sub objects of the event and performance
+                when they are first read, see :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the event, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`.
 
         Returns:
             :class:`Order <pyticketswitch.order.Order>`: a new
@@ -249,12 +255,14 @@ class Order(JSONMixin, object):
 
         raw_event = data.get('event')
         if raw_event:
-            event = Event.from_api_data(raw_event)
+            event = Event.from_api_data(
+                raw_event, lazy=lazy, keep_raw=keep_raw)
             kwargs.update(event=event)
 
         raw_performance = data.get('performance')
         if raw_performance:
-            performance = Performance.from_api_data(raw_performance)
+            performance = Performance.from_api_data(
+                raw_performance, lazy=lazy)
             kwargs.update(performance=performance)
 
         raw_ticket_orders = data.get('ticket_orders', {}).get('ticket_order')
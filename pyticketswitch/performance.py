@@ -1,11 +1,18 @@
+import functools
+
 from pyticketswitch import utils
 from pyticketswitch.cost_range import CostRange
 from pyticketswitch.availability import AvailabilityDetails
-from pyticketswitch.mixins import JSONMixin, PaginationMixin
+from pyticketswitch.mixins import (JSONMixin, LazyAttribute, LazyMixin,
+                                   PaginationMixin)
 from pyticketswitch.currency import CurrencyMeta
 
 
-class Performance(JSONMixin, object):
+def _parse_availability_details(data):
+    return AvailabilityDetails.from_api_data(data.get('avail_details', {}))
+
+
+class Performance(LazyMixin, JSONMixin, object):
     """Describes and occurance of an :class:`Event <pyticketswitch.event.Event>`.
 
     The performance will have either a **date_time** or a **name**.
@@ -40,8 +47,25 @@ class Performance(JSONMixin, object):
             summerised availability data for the performance. This data is
             cached from previous availability calls and may not be accurate.
 
+    Performances created with ``lazy=True`` parse **cost_range**,
+    **no_singles_cost_range** and **availability_details** the first time
+    they are read.
+
     """
 
+    # the lazy attributes are kept in __dict__
+    __slots__ = ('id', 'event_id', 'date_time', 'date_description',
+                 'time_description', 'has_pool_seats', 'is_limited',
+                 'cached_max_seats', 'is_ghost', 'name', 'running_time',
+                 '__dict__')
+
+    cost_range = LazyAttribute('cost_range', CostRange.from_cost_range_data)
+    no_singles_cost_range = LazyAttribute(
+        'no_singles_cost_range',
+        functools.partial(CostRange.from_cost_range_data, singles=False))
+    availability_details = LazyAttribute(
+        'availability_details', _parse_availability_details)
+
     def __init__(self, id_, event_id, date_time=None,
                  date_description=None, time_description=None, has_pool_seats=False,
                  is_limited=False, cached_max_seats=None, cost_range=None,
@@ -64,12 +88,14 @@ class Performance(JSONMixin, object):
         self.availability_details = availability_details
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False):
         """Creates a new **Performance** object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a performance.
+            lazy (bool): parse the pricing and availability details when they
+                are first read rather than up front.
 
         Returns:
             :class:`Performance <pyticketswitch.order.Performance>`: a new
@@ -87,23 +113,6 @@ class Performance(JSONMixin, object):
         date_desc = data.get('date_desc')
         time_desc = data.get('time_desc')
 
-        api_cost_range = data.get('cost_range', {})
-        api_no_singles_cost_range = api_cost_range.get('no_singles_cost_range', {})
-        cost_range = None
-        no_singles_cost_range = None
-
-        if api_cost_range:
-            api_cost_range['singles'] = True
-            cost_range = CostRange.from_api_data(api_cost_range)
-
-        if api_no_singles_cost_range:
-            api_no_singles_cost_range['singles'] = False
-            no_singles_cost_range = CostRange.from_api_data(
-                api_no_singles_cost_range)
-
-        availability_details = AvailabilityDetails.from_api_data(
-            data.get('avail_details', {}))
-
         kwargs = {
             'id_': id_,
             'event_id': event_id,
@@ -116,11 +125,16 @@ class Performance(JSONMixin, object):
             'is_limited': data.get('is_limited', False),
             'is_ghost': data.get('is_ghost', False),
             'cached_max_seats': data.get('cached_max_seats'),
-            'cost_range': cost_range,
-            'no_singles_cost_range': no_singles_cost_range,
-            'availability_details': availability_details,
         }
 
+        if lazy:
+            performance = cls(**kwargs)
+            performance.defer(data)
+            return performance
+
+        for name in cls.lazy_attributes():
+            kwargs[name] = getattr(cls, name).parse(data)
+
         return cls(**kwargs)
 
     def __repr__(self):
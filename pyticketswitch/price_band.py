@@ -48,6 +48,12 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
 
     """
 
+    __slots__ = ('code', 'description', 'cost_range',
+                 'allows_leaving_single_seats', 'no_singles_cost_range',
+                 'default_discount', 'example_seats', 'example_seats_are_real',
+                 'seat_blocks', 'user_commission', 'discounts', 'availability',
+                 'percentage_saving', 'absolute_saving', 'is_offer')
+
     def __init__(self, code, default_discount, description=None, cost_range=None,
                  no_singles_cost_range=None, example_seats=None,
                  example_seats_are_real=True, seat_blocks=None, user_commission=None,
@@ -90,19 +96,9 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
             populated with the data from the api.
 
         """
-        api_cost_range = data.get('cost_range', {})
-        api_no_singles_cost_range = api_cost_range.get('no_singles_cost_range', {})
-        cost_range = None
-        no_singles_cost_range = None
-
-        if api_cost_range:
-            api_cost_range['singles'] = True
-            cost_range = CostRange.from_api_data(api_cost_range)
-
-        if api_no_singles_cost_range:
-            api_no_singles_cost_range['singles'] = False
-            no_singles_cost_range = CostRange.from_api_data(
-                api_no_singles_cost_range)
+        cost_range = CostRange.from_cost_range_data(data)
+        no_singles_cost_range = CostRange.from_cost_range_data(
+            data, singles=False)
 
         discount = Discount.from_api_data(data)
 
@@ -130,22 +126,26 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
         seat_block_data = data.get('free_seat_blocks')
 
         if seat_block_data:
-            separators_by_row = seat_block_data.get('separators_by_row')
-            restricted_view_seats = seat_block_data.get('restricted_view_seats')
-            seats_by_text_message = seat_block_data.get('seats_by_text_message')
+            separators_by_row = seat_block_data.get('separators_by_row') or {}
             blocks_by_row = seat_block_data.get('blocks_by_row')
 
+            # index the seat map once rather than scanning it for every seat
+            restricted_view_seats = frozenset(
+                seat_block_data.get('restricted_view_seats') or ())
+            text_by_seat = SeatBlock.index_seat_text(
+                seat_block_data.get('seats_by_text_message'))
+
             seat_blocks = []
             if blocks_by_row:
                 for row_id, row in blocks_by_row.items():
+                    separator = separators_by_row.get(row_id)
                     for block in row:
-                        separator = separators_by_row.get(row_id)
                         seat_block = SeatBlock.from_api_data(
                             block=block,
                             row_id=row_id,
                             separator=separator,
                             restricted_view_seats=restricted_view_seats,
-                            seats_by_text_message=seats_by_text_message,
+                            text_by_seat=text_by_seat,
                         )
                         seat_blocks.append(seat_block)
 
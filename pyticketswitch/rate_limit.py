@@ -0,0 +1,228 @@
+"""Client side rate limiting that adapts to throttling by the API.
+
+Give a :class:`RateLimiter` to the client to spread its requests out::
+
+    >>> from pyticketswitch.rate_limit import RateLimiter
+    >>> limiter = RateLimiter(rate=20, rates={'availability.v1': 5})
+    >>> client = Client('demo', 'demopass', rate_limiter=limiter)
+
+Each endpoint and sub user gets its own token bucket. Requests wait for a
+token before they are sent, so a bulk job can't use up the capacity that
+interactive traffic sharing the same credentials needs.
+
+The rates adapt to the API with additive increase, multiplicative decrease:
+when a response says we were throttled (``backend_throttle_failed``, or a
+429 or 503 status) the rate for that bucket is cut by **decrease_factor**,
+and every successful response adds **increase** requests per second back,
+up to the configured rate.
+
+"""
+import logging
+import threading
+
+from pyticketswitch import exceptions, utils
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RATE = 10
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_INCREASE = 0.1
+
+#: HTTP status codes that mean the API wants us to slow down.
+THROTTLE_STATUSES = frozenset([429, 503])
+
+
+class TokenBucket(object):
+    """A token bucket that lets requests through at a steady rate
+
+    Args:
+        rate (float): tokens added per second.
+        capacity (float): the maximum number of tokens, and so the largest
+            burst of requests that can be sent at once.
+        clock (callable): returns the current time in seconds.
+
+    """
+
+    def __init__(self, rate, capacity, clock):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+
+    def reserve(self):
+        """Take a token from the bucket
+
+        Tokens can be borrowed from the future, callers that get one must
+        wait for it to be added before sending their request.
+
+        Returns:
+            float: seconds to wait before the token is available.
+
+        """
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+
+class RateLimiter(object):
+    """Limits the rate of requests per endpoint and sub user
+
+    Args:
+        rate (float): the default maximum requests per second for each
+            bucket. Defaults to 10.
+        rates (dict): maximum requests per second, indexed by endpoint, for
+            endpoints that need a different rate.
+        burst (float): how many requests can be sent at once after a quiet
+            period. Defaults to the rate.
+        min_rate (float): the rate is never cut below this. Defaults to 0.5.
+        decrease_factor (float): the rate is multiplied by this when the API
+            throttles us. Defaults to 0.5.
+        increase (float): requests per second added back to the rate after
+            each successful response. Defaults to 0.1.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        throttled (int): the number of times the API has throttled us.
+
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, rates=None, burst=None,
+                 min_rate=DEFAULT_MIN_RATE,
+                 decrease_factor=DEFAULT_DECREASE_FACTOR,
+                 increase=DEFAULT_INCREASE, clock=None):
+        self.rate = rate
+        self.rates = dict(rates or {})
+        self.burst = burst
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.clock = clock or utils.monotonic
+        self.throttled = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_max_rate(self, endpoint):
+        """Get the configured rate for an endpoint
+
+        Args:
+            endpoint (str): the API endpoint.
+
+        Returns:
+            float: requests per second.
+
+        """
+        return self.rates.get(endpoint, self.rate)
+
+    def get_rate(self, endpoint, sub_user=None):
+        """Get the current, possibly reduced, rate of a bucket
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user making the requests.
+
+        Returns:
+            float: requests per second.
+
+        """
+        bucket = self._buckets.get((endpoint, sub_user))
+        if bucket is None:
+            return self.get_max_rate(endpoint)
+        return bucket.rate
+
+    def acquire(self, endpoint, sub_user=None):
+        """Reserve a slot to send a request in
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user making the request.
+
+        Returns:
+            float: seconds to wait before sending the request.
+
+        """
+        with self._lock:
+            return self._get_bucket(endpoint, sub_user).reserve()
+
+    def record_response(self, endpoint, sub_user, response):
+        """Adapt the rate to a successful response
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user that made the request.
+            response (dict): the decoded response.
+
+        """
+        if response.get('backend_throttle_failed'):
+            self.decrease(endpoint, sub_user)
+        else:
+            self.increase_rate(endpoint, sub_user)
+
+    def record_error(self, endpoint, sub_user, error):
+        """Adapt the rate to a failed request
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user that made the request.
+            error (Exception): the error raised by the request.
+
+        """
+        if isinstance(error, exceptions.InvalidResponseError):
+            throttled = error.status_code in THROTTLE_STATUSES
+        else:
+            throttled = isinstance(error, exceptions.BackendThrottleError)
+
+        if throttled:
+            self.decrease(endpoint, sub_user)
+
+    def decrease(self, endpoint, sub_user=None):
+        """Cut the rate of a bucket after the API throttled us
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user making the requests.
+
+        """
+        with self._lock:
+            bucket = self._get_bucket(endpoint, sub_user)
+            bucket.rate = max(
+                self.min_rate, bucket.rate * self.decrease_factor)
+            bucket.tokens = min(bucket.tokens, 0)
+            self.throttled += 1
+
+        logger.info(u'throttled on %s, rate reduced to %.2f/s',
+                    endpoint, bucket.rate)
+
+    def increase_rate(self, endpoint, sub_user=None):
+        """Raise the rate of a bucket back towards its configured rate
+
+        Args:
+            endpoint (str): the API endpoint.
+            sub_user (str): the sub user making the requests.
+
+        """
+        with self._lock:
+            bucket = self._buckets.get((endpoint, sub_user))
+            if bucket is None:
+                return
+            bucket.rate = min(
+                self.get_max_rate(endpoint), bucket.rate + self.increase)
+
+    def _get_bucket(self, endpoint, sub_user):
+        key = (endpoint, sub_user)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = self.get_max_rate(endpoint)
+            capacity = self.burst if self.burst is not None else rate
+            bucket = self._buckets[key] = TokenBucket(
+                rate, max(1, capacity), self.clock)
+        return bucket
@@ -54,12 +54,19 @@ class Reservation(Status):
         self.input_contained_unavailable_order = input_contained_unavailable_order
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new **Reservation** object from ticketswitch API data.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a reservation.
+            lazy (bool): parse the sub objects of the events and
+                performances in the orders when they are first read, see
+                :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the events in
+                the orders, see :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
 
         Returns:
             :class:`Reservation <pyticketswitch.order.Reservation>`: a new
@@ -68,13 +75,14 @@ class Reservation(Status):
 
         """
 
-        inst = super(Reservation, cls).from_api_data(data)
+        inst = super(Reservation, cls).from_api_data(
+            data, lazy=lazy, keep_raw=keep_raw)
 
         unreserved_orders = []
         raw_unreserved_orders = data.get('unreserved_orders')
         if raw_unreserved_orders:
             unreserved_orders = [
-                Order.from_api_data(order)
+                Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
                 for order in raw_unreserved_orders
             ]
 
@@ -0,0 +1,165 @@
+"""Retrying of requests that failed for transient reasons.
+
+Give a :class:`RetryPolicy` to the client to retry idempotent requests that
+failed because the connection dropped, timed out or the API responded with a
+server error::
+
+    >>> from pyticketswitch.retry import RetryPolicy
+    >>> client = Client('demo', 'demopass', retry=RetryPolicy(deadline=5))
+
+Only ``GET`` requests are ever retried. Requests that change state, such as
+``reserve.v1``, ``purchase.v1`` and ``cancel.v1``, are sent with ``POST`` and
+are never retried implicitly, as the first attempt may have succeeded even
+though we didn't see the response.
+
+"""
+import logging
+import random
+
+from pyticketswitch import exceptions, utils
+from pyticketswitch.endpoints import GET
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 0.1
+DEFAULT_MAX_BACKOFF = 2.0
+
+#: HTTP status codes that indicate the request may succeed if tried again.
+DEFAULT_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class RetryPolicy(object):
+    """Decides if and when a failed request should be tried again
+
+    Waits between attempts grow exponentially from **backoff**, capped at
+    **max_backoff**. With **jitter** each wait is a random time between zero
+    and that value, so that many clients failing at once don't all retry at
+    the same moment.
+
+    Args:
+        max_attempts (int): the maximum number of attempts, including the
+            first. Defaults to 3.
+        backoff (float): seconds to wait before the first retry. Defaults to
+            0.1.
+        max_backoff (float): the maximum number of seconds to wait between
+            attempts. Defaults to 2.
+        jitter (bool): randomise the waits. Defaults to :obj:`True`.
+        deadline (float): seconds, from the start of the first attempt,
+            after which no more attempts are made. Defaults to :obj:`None`,
+            for no deadline.
+        retry_statuses (set): HTTP status codes worth retrying. Defaults to
+            :data:`DEFAULT_RETRY_STATUSES`.
+        never_retry (set): endpoints that must never be retried, in addition
+            to all ``POST`` endpoints.
+        clock (callable): returns the current time in seconds. Defaults to
+            :func:`utils.monotonic <pyticketswitch.utils.monotonic>`.
+
+    Attributes:
+        retries (int): the number of retries that have been made.
+
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF,
+                 jitter=True, deadline=None,
+                 retry_statuses=DEFAULT_RETRY_STATUSES, never_retry=(),
+                 clock=None):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.never_retry = frozenset(never_retry)
+        self.clock = clock or utils.monotonic
+        self.retries = 0
+
+    def is_idempotent(self, call):
+        """Indicates that the call can safely be made more than once
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call.
+
+        Returns:
+            bool: :obj:`True` for ``GET`` calls not in **never_retry**.
+
+        """
+        return call.method == GET and call.endpoint not in self.never_retry
+
+    def is_transient(self, error, transient_errors=()):
+        """Indicates that the error may not happen on another attempt
+
+        Args:
+            error (Exception): the error raised by the attempt.
+            transient_errors (tuple): transport specific exception types
+                for dropped connections and timeouts.
+
+        Returns:
+            bool: :obj:`True` when the request is worth retrying.
+
+        """
+        if isinstance(error, exceptions.InvalidResponseError):
+            return error.status_code in self.retry_statuses
+
+        if isinstance(error, exceptions.BackendThrottleError):
+            return True
+
+        return isinstance(error, transient_errors)
+
+    def get_backoff(self, attempt):
+        """Get the number of seconds to wait after a failed attempt
+
+        Args:
+            attempt (int): the number of attempts made so far.
+
+        Returns:
+            float: seconds to wait.
+
+        """
+        backoff = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def get_delay(self, call, error, attempt, started,
+                  transient_errors=()):
+        """Decide whether to retry a failed attempt
+
+        Args:
+            call (:class:`APICall <pyticketswitch.endpoints.APICall>`): the
+                call that failed.
+            error (Exception): the error raised by the attempt.
+            attempt (int): the number of attempts made so far.
+            started (float): the time, from **clock**, the first attempt was
+                started.
+            transient_errors (tuple): transport specific exception types
+                for dropped connections and timeouts.
+
+        Returns:
+            float: seconds to wait before the next attempt, or :obj:`None`
+            when the error should be raised.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if not self.is_idempotent(call):
+            return None
+
+        if not self.is_transient(error, transient_errors):
+            return None
+
+        delay = self.get_backoff(attempt)
+        if self.deadline is not None:
+            if self.clock() + delay - started >= self.deadline:
+                return None
+
+        self.retries += 1
+        logger.info(
+            u'retrying %s in %.3fs after attempt %s failed: %r',
+            call.endpoint, delay, attempt, error)
+        return delay
@@ -11,23 +11,51 @@ class SeatBlock(JSONMixin, object):
 
     """
 
+    __slots__ = ('length', 'seats')
+
     def __init__(self, length, seats=None):
         self.length = length
         self.seats = seats
 
+    @staticmethod
+    def index_seat_text(seats_by_text_message):
+        """Invert a mapping of seat text messages to seat IDs.
+
+        When a seat is listed under more than one message the last one wins.
+
+        Args:
+            seats_by_text_message (dict): a mapping of seat text messages to
+                seat IDs.
+
+        Returns:
+            dict: a mapping of seat IDs to their seat text message.
+
+        """
+        text_by_seat = {}
+        for seat_text, list_of_seats in (seats_by_text_message or {}).items():
+            for seat_id in list_of_seats:
+                text_by_seat[seat_id] = seat_text
+        return text_by_seat
+
     @classmethod
     def from_api_data(cls, block, row_id=None, separator='',
-                      restricted_view_seats=None, seats_by_text_message=None):
+                      restricted_view_seats=None, seats_by_text_message=None,
+                      text_by_seat=None):
         """Creates a new SeatBlock object from API data from ticketswitch.
 
+        When parsing many blocks from the same seat map build the indexes
+        once and pass them in, with ``restricted_view_seats`` as a set and
+        ``text_by_seat`` from :meth:`index_seat_text`.
+
         Args:
             block (list): the part of the response from a ticketswitch API call
                 that concerns a seat block.
             row_id (str): the component of the seat ID corresponding to the row
             separator (str): the string separating row and column in the id
-            restricted_view_seats (list): seat IDs that have restricted view
+            restricted_view_seats (set): seat IDs that have restricted view
             seats_by_text_message (dict): a mapping of seat text messages to
-                seat IDs
+                seat IDs. Ignored when **text_by_seat** is given.
+            text_by_seat (dict): a mapping of seat IDs to seat text messages.
 
         Returns:
             :class:`SeatBlock <pyticketswitch.seat.SeatBlock>`: a new
@@ -35,34 +63,25 @@ class SeatBlock(JSONMixin, object):
             populated with the data from the api.
 
         """
-
-        seats = []
-        for seat_id in block:
-
-            column = None
-            delimiter = separator
-
-            if not delimiter:
-                delimiter = row_id
-
-            split_id = seat_id.split(delimiter)
-            column = split_id[1]
-
-            restricted = False
-            restricted_text = ''
-
-            if seat_id in restricted_view_seats:
-                restricted = True
-
-            for seat_text, list_of_seats in seats_by_text_message.items():
-                if seat_id in list_of_seats:
-                    restricted_text = seat_text
-            seat = Seat(
-                id_=seat_id, row=row_id, column=column,
-                separator=separator, is_restricted=restricted,
-                seat_text=restricted_text
+        if restricted_view_seats is None:
+            restricted_view_seats = frozenset()
+        elif not isinstance(restricted_view_seats, (set, frozenset)):
+            restricted_view_seats = frozenset(restricted_view_seats)
+
+        if text_by_seat is None:
+            text_by_seat = cls.index_seat_text(seats_by_text_message)
+
+        delimiter = separator or row_id
+
+        seats = [
+            Seat(
+                id_=seat_id, row=row_id, column=seat_id.split(delimiter)[1],
+                separator=separator,
+                is_restricted=seat_id in restricted_view_seats,
+                seat_text=text_by_seat.get(seat_id, ''),
             )
-            seats.append(seat)
+            for seat_id in block
+        ]
 
         kwargs = {'seats': seats, 'length': len(seats)}
         return cls(**kwargs)
@@ -86,6 +105,9 @@ class Seat(JSONMixin, object):
 
     """
 
+    __slots__ = ('id', 'column', 'row', 'separator', 'is_restricted',
+                 'seat_text', 'seat_text_code', 'barcode')
+
     def __init__(self, id_=None, column=None, row=None, is_restricted=False,
                  seat_text_code=None, seat_text=None, separator=None,
                  barcode=None):
@@ -0,0 +1,738 @@
+"""A compact, indexed view of the free seats in a performance.
+
+:class:`SeatMap` holds every seat from the seat blocks of a performance's
+price bands in flat arrays rather than as one
+:class:`Seat <pyticketswitch.seat.Seat>` object per seat, and keeps indexes so
+the common seat picker queries don't have to scan the whole map::
+
+    >>> ticket_types, meta = client.get_availability(perf_id, seat_blocks=True)
+    >>> seat_map = SeatMap.from_ticket_types(ticket_types)
+    >>> [block.seat_ids for block in seat_map.blocks(min_length=4)]
+    [['A1', 'A2', 'A3', 'A4', 'A5'], ['C10', 'C11', 'C12', 'C13']]
+    >>> seat_map.cheapest_contiguous(2).seat_ids
+    ['F7', 'F8']
+    >>> choice = seat_map.best_available(2, meta=meta)[0]
+    >>> client.make_reservation(
+    ...     performance_id=perf_id, number_of_seats=2, seats=choice.seat_ids,
+    ...     ticket_type_code=choice.ticket_type.code,
+    ...     price_band_code=choice.price_band.code)
+
+:class:`Seat <pyticketswitch.seat.Seat>` objects are only created for the
+seats a query returns.
+
+"""
+import bisect
+import heapq
+from array import array
+
+from pyticketswitch.seat import Seat, SeatBlock
+
+
+def _band_price(price_band):
+    if price_band.seatprice is None:
+        return None
+    if price_band.surcharge is None:
+        return price_band.seatprice
+    return price_band.combined_price()
+
+
+class SeatMapBlock(object):
+    """A run of contiguous seats in a :class:`SeatMap`
+
+    Attributes:
+        seat_map (:class:`SeatMap`): the seat map the seats belong to.
+        start (int): the position of the first seat in the seat map.
+        length (int): the number of seats.
+
+    """
+
+    __slots__ = ('seat_map', 'start', 'length')
+
+    def __init__(self, seat_map, start, length):
+        self.seat_map = seat_map
+        self.start = start
+        self.length = length
+
+    @property
+    def ticket_type(self):
+        """:class:`TicketType <pyticketswitch.ticket_type.TicketType>`: the
+        ticket type of the seats, when known."""
+        return self.seat_map.ticket_type_of(self.start)
+
+    @property
+    def price_band(self):
+        """:class:`PriceBand <pyticketswitch.price_band.PriceBand>`: the
+        price band of the seats."""
+        return self.seat_map.price_band_of(self.start)
+
+    @property
+    def price(self):
+        """The combined seatprice and surcharge per seat, :obj:`None` when
+        the price band has no prices."""
+        return self.seat_map.price_of(self.start)
+
+    @property
+    def row(self):
+        """str: the row the seats are in."""
+        return self.seat_map.row_of(self.start)
+
+    @property
+    def seat_ids(self):
+        """list: the IDs of the seats."""
+        return self.seat_map.seat_ids[self.start:self.start + self.length]
+
+    @property
+    def seats(self):
+        """list: the :class:`Seats <pyticketswitch.seat.Seat>`."""
+        return [
+            self.seat_map.seat(index)
+            for index in range(self.start, self.start + self.length)
+        ]
+
+    def __eq__(self, other):
+        if not isinstance(other, SeatMapBlock):
+            return False
+        return (self.seat_map, self.start, self.length) == \
+            (other.seat_map, other.start, other.length)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self.seat_map), self.start, self.length))
+
+    def __repr__(self):
+        return u'<SeatMapBlock {}>'.format(u' '.join(self.seat_ids))
+
+
+class SeatChoice(object):
+    """Seats that can be reserved together, found by
+    :meth:`SeatMap.best_available`
+
+    Attributes:
+        blocks (list): the :class:`SeatMapBlocks <SeatMapBlock>` the seats
+            are in, one block when the seats are contiguous. They are all in
+            the same price band.
+        leaves_single_seat (bool): :obj:`True` when reserving the seats
+            leaves a single free seat next to them.
+
+    """
+
+    __slots__ = ('blocks', 'leaves_single_seat')
+
+    def __init__(self, blocks, leaves_single_seat=False):
+        self.blocks = blocks
+        self.leaves_single_seat = leaves_single_seat
+
+    @property
+    def contiguous(self):
+        """bool: :obj:`True` when the seats are next to each other."""
+        return len(self.blocks) == 1
+
+    @property
+    def ticket_type(self):
+        """:class:`TicketType <pyticketswitch.ticket_type.TicketType>`: the
+        ticket type of the seats, when known."""
+        return self.blocks[0].ticket_type
+
+    @property
+    def price_band(self):
+        """:class:`PriceBand <pyticketswitch.price_band.PriceBand>`: the
+        price band of the seats."""
+        return self.blocks[0].price_band
+
+    @property
+    def price(self):
+        """The combined seatprice and surcharge per seat, :obj:`None` when
+        the price band has no prices."""
+        return self.blocks[0].price
+
+    @property
+    def restricted(self):
+        """int: the number of seats with a restricted view."""
+        return sum(
+            block.seat_map.count_restricted(block.start, block.length)
+            for block in self.blocks
+        )
+
+    @property
+    def seat_ids(self):
+        """list: the IDs of the seats."""
+        return [seat_id for block in self.blocks for seat_id in block.seat_ids]
+
+    @property
+    def seats(self):
+        """list: the :class:`Seats <pyticketswitch.seat.Seat>`."""
+        return [seat for block in self.blocks for seat in block.seats]
+
+    def __repr__(self):
+        return u'<SeatChoice {}>'.format(u' '.join(self.seat_ids))
+
+
+class SeatMap(object):
+    """The free seats of one or more price bands, stored in flat arrays
+
+    Seats are numbered in the order they are added, the seats of each block
+    are consecutive. The blocks come from the ``free_seat_blocks`` of the
+    availability response, which are already runs of contiguous seats.
+
+    Attributes:
+        seat_ids (list): the ID of every seat, by position.
+        price_bands (list): the
+            :class:`PriceBands <pyticketswitch.price_band.PriceBand>` the
+            seats belong to.
+
+    """
+
+    def __init__(self):
+        self.seat_ids = []
+        self.price_bands = []
+        self._ticket_types = []
+        self._prices = []
+
+        # per seat
+        self._columns = []
+        self._rows = array('i')
+        self._bands = array('i')
+        self._restricted = bytearray()
+        self._texts = array('i')
+
+        # lookup tables for the per seat indexes
+        self._row_values = []
+        self._row_lookup = {}
+        self._text_values = []
+        self._text_lookup = {}
+        self._columns_lookup = {}
+
+        # per block
+        self._block_starts = array('i')
+        self._block_lengths = array('i')
+
+        # indexes
+        self._row_ids = []
+        self._seats_by_row = {}
+        self._restricted_seats = array('i')
+        self._blocks_by_band = []
+        self._longest_by_band = array('i')
+
+        # built when first needed
+        self._by_length = None
+        self._bands_by_price = None
+
+    @classmethod
+    def from_price_bands(cls, price_bands, ticket_type=None):
+        """Creates a new SeatMap from the seat blocks of some price bands
+
+        Args:
+            price_bands (list): list of
+                :class:`PriceBands <pyticketswitch.price_band.PriceBand>`.
+            ticket_type (:class:`TicketType <pyticketswitch.ticket_type.TicketType>`):
+                the ticket type the price bands belong to.
+
+        Returns:
+            :class:`SeatMap`: the new seat map.
+
+        """
+        seat_map = cls()
+        for price_band in price_bands:
+            seat_map.add_price_band(price_band, ticket_type=ticket_type)
+        return seat_map
+
+    @classmethod
+    def from_ticket_types(cls, ticket_types):
+        """Creates a new SeatMap from the seat blocks of some ticket types
+
+        Args:
+            ticket_types (list): list of
+                :class:`TicketTypes <pyticketswitch.ticket_type.TicketType>`,
+                as returned by
+                :meth:`Client.get_availability <pyticketswitch.client.Client.get_availability>`
+                with ``seat_blocks=True``.
+
+        Returns:
+            :class:`SeatMap`: the new seat map.
+
+        """
+        seat_map = cls()
+        for ticket_type in ticket_types:
+            for price_band in ticket_type.price_bands or []:
+                seat_map.add_price_band(price_band, ticket_type=ticket_type)
+        return seat_map
+
+    def add_price_band(self, price_band, ticket_type=None):
+        """Add the seat blocks of a price band to the map
+
+        Args:
+            price_band (:class:`PriceBand <pyticketswitch.price_band.PriceBand>`):
+                the price band.
+            ticket_type (:class:`TicketType <pyticketswitch.ticket_type.TicketType>`):
+                the ticket type the price band belongs to.
+
+        """
+        band = self._add_band(price_band, ticket_type)
+        for seat_block in price_band.seat_blocks or []:
+            self._add_block(band, [
+                (seat.id, seat.row, seat.separator, seat.column,
+                 seat.is_restricted, (seat.seat_text, seat.seat_text_code))
+                for seat in seat_block.seats or []
+            ])
+
+    def add_free_seat_blocks(self, data, price_band, ticket_type=None):
+        """Add seat blocks straight from the API data to the map
+
+        This skips creating the
+        :class:`SeatBlocks <pyticketswitch.seat.SeatBlock>` and
+        :class:`Seats <pyticketswitch.seat.Seat>` altogether.
+
+        Args:
+            data (dict): the ``free_seat_blocks`` of a price band in the
+                response from the availability endpoint.
+            price_band (:class:`PriceBand <pyticketswitch.price_band.PriceBand>`):
+                the price band the seats belong to.
+            ticket_type (:class:`TicketType <pyticketswitch.ticket_type.TicketType>`):
+                the ticket type the price band belongs to.
+
+        """
+        band = self._add_band(price_band, ticket_type)
+        separators_by_row = data.get('separators_by_row') or {}
+        restricted_view_seats = frozenset(
+            data.get('restricted_view_seats') or ())
+        text_by_seat = SeatBlock.index_seat_text(
+            data.get('seats_by_text_message'))
+
+        for row_id, row in (data.get('blocks_by_row') or {}).items():
+            separator = separators_by_row.get(row_id)
+            delimiter = separator or row_id
+            for block in row:
+                self._add_block(band, [
+                    (seat_id, row_id, separator, seat_id.split(delimiter)[1],
+                     seat_id in restricted_view_seats,
+                     (text_by_seat.get(seat_id, ''), None))
+                    for seat_id in block
+                ])
+
+    def _add_band(self, price_band, ticket_type):
+        self.price_bands.append(price_band)
+        self._ticket_types.append(ticket_type)
+        self._prices.append(_band_price(price_band))
+        self._blocks_by_band.append(array('i'))
+        self._longest_by_band.append(0)
+        self._bands_by_price = None
+        return len(self.price_bands) - 1
+
+    def _intern(self, values, lookup, value):
+        index = lookup.get(value)
+        if index is None:
+            index = lookup[value] = len(values)
+            values.append(value)
+        return index
+
+    def _add_block(self, band, seats):
+        if not seats:
+            return
+
+        block = len(self._block_starts)
+        self._block_starts.append(len(self.seat_ids))
+        self._block_lengths.append(len(seats))
+        self._blocks_by_band[band].append(block)
+        if len(seats) > self._longest_by_band[band]:
+            self._longest_by_band[band] = len(seats)
+        self._by_length = None
+
+        for seat_id, row_id, separator, column, restricted, text in seats:
+            index = len(self.seat_ids)
+            self.seat_ids.append(seat_id)
+            self._columns.append(
+                self._columns_lookup.setdefault(column, column))
+            self._rows.append(self._intern(
+                self._row_values, self._row_lookup, (row_id, separator)))
+            self._bands.append(band)
+            self._restricted.append(1 if restricted else 0)
+            self._texts.append(self._intern(
+                self._text_values, self._text_lookup, text))
+
+            if row_id not in self._seats_by_row:
+                self._row_ids.append(row_id)
+                self._seats_by_row[row_id] = array('i')
+            self._seats_by_row[row_id].append(index)
+            if restricted:
+                self._restricted_seats.append(index)
+
+    def __len__(self):
+        return len(self.seat_ids)
+
+    def seat(self, index):
+        """Get a seat by its position in the map
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            :class:`Seat <pyticketswitch.seat.Seat>`: a new seat object.
+
+        """
+        row_id, separator = self._row_values[self._rows[index]]
+        seat_text, seat_text_code = self._text_values[self._texts[index]]
+        return Seat(
+            id_=self.seat_ids[index],
+            column=self._columns[index],
+            row=row_id,
+            separator=separator,
+            is_restricted=bool(self._restricted[index]),
+            seat_text=seat_text,
+            seat_text_code=seat_text_code,
+        )
+
+    def row_of(self, index):
+        """Get the row of a seat
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            str: the row ID.
+
+        """
+        return self._row_values[self._rows[index]][0]
+
+    def is_restricted(self, index):
+        """Check if a seat has a restricted view
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            bool: :obj:`True` when the view is restricted.
+
+        """
+        return bool(self._restricted[index])
+
+    def price_band_of(self, index):
+        """Get the price band of a seat
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            :class:`PriceBand <pyticketswitch.price_band.PriceBand>`: the
+            price band.
+
+        """
+        return self.price_bands[self._bands[index]]
+
+    def ticket_type_of(self, index):
+        """Get the ticket type of a seat
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            :class:`TicketType <pyticketswitch.ticket_type.TicketType>`: the
+            ticket type, :obj:`None` when not known.
+
+        """
+        return self._ticket_types[self._bands[index]]
+
+    def price_of(self, index):
+        """Get the combined seatprice and surcharge of a seat
+
+        Args:
+            index (int): the position of the seat.
+
+        Returns:
+            the price, :obj:`None` when the price band has no prices.
+
+        """
+        return self._prices[self._bands[index]]
+
+    def count_restricted(self, start, length):
+        """Count the seats with a restricted view in a run of seats
+
+        Args:
+            start (int): the position of the first seat.
+            length (int): the number of seats.
+
+        Returns:
+            int: the number of restricted view seats.
+
+        """
+        return self._restricted[start:start + length].count(b'\x01')
+
+    def _block(self, block):
+        return SeatMapBlock(
+            self, self._block_starts[block], self._block_lengths[block])
+
+    def blocks(self, min_length=1):
+        """Get the blocks of at least a number of contiguous seats
+
+        Args:
+            min_length (int): the minimum number of seats in a block.
+
+        Returns:
+            list: :class:`SeatMapBlocks <SeatMapBlock>` in the order they
+            were added.
+
+        """
+        if self._by_length is None:
+            order = sorted(
+                range(len(self._block_lengths)),
+                key=self._block_lengths.__getitem__,
+            )
+            self._by_length = (
+                [self._block_lengths[block] for block in order],
+                order,
+            )
+
+        lengths, order = self._by_length
+        first = bisect.bisect_left(lengths, min_length)
+        return [self._block(block) for block in sorted(order[first:])]
+
+    def blocks_in_band(self, price_band):
+        """Get the blocks of a price band
+
+        Args:
+            price_band (:class:`PriceBand <pyticketswitch.price_band.PriceBand>`):
+                a price band in the map.
+
+        Returns:
+            list: :class:`SeatMapBlocks <SeatMapBlock>`.
+
+        Raises:
+            ValueError: when the price band is not in the map.
+
+        """
+        band = self._band_index(price_band)
+        return [self._block(block) for block in self._blocks_by_band[band]]
+
+    def _band_index(self, price_band):
+        for band, candidate in enumerate(self.price_bands):
+            if candidate is price_band:
+                return band
+        raise ValueError('price band is not in the seat map')
+
+    def row(self, row_id):
+        """Get the free seats in a row
+
+        Args:
+            row_id (str): the row.
+
+        Returns:
+            list: :class:`Seats <pyticketswitch.seat.Seat>`, in the order
+            they were added.
+
+        """
+        return [self.seat(index) for index in self._seats_by_row.get(row_id, ())]
+
+    def rows(self):
+        """Get the rows with free seats
+
+        Returns:
+            list: the row IDs, in the order they were first seen.
+
+        """
+        return list(self._row_ids)
+
+    def restricted_seats(self):
+        """Get the free seats that have a restricted view
+
+        Returns:
+            list: :class:`Seats <pyticketswitch.seat.Seat>`.
+
+        """
+        return [self.seat(index) for index in self._restricted_seats]
+
+    def bands_by_price(self):
+        """Get the price bands from cheapest to most expensive
+
+        Price bands without prices come last.
+
+        Returns:
+            list: :class:`PriceBands <pyticketswitch.price_band.PriceBand>`.
+
+        """
+        return [self.price_bands[band] for band in self._band_order()]
+
+    def _band_order(self):
+        if self._bands_by_price is None:
+            self._bands_by_price = sorted(
+                range(len(self.price_bands)),
+                key=lambda band: (
+                    self._prices[band] is None, self._prices[band] or 0),
+            )
+        return self._bands_by_price
+
+    def cheapest_contiguous(self, quantity):
+        """Find the cheapest contiguous seats
+
+        Args:
+            quantity (int): the number of seats wanted together.
+
+        Returns:
+            :class:`SeatMapBlock`: the first **quantity** seats of the first
+            block long enough in the cheapest price band that has one, or
+            :obj:`None` when no block has enough seats.
+
+        """
+        for band in self._band_order():
+            if self._longest_by_band[band] < quantity:
+                continue
+            for block in self._blocks_by_band[band]:
+                if self._block_lengths[block] >= quantity:
+                    return SeatMapBlock(
+                        self, self._block_starts[block], quantity)
+        return None
+
+    def best_available(self, quantity, meta=None, limit=None):
+        """Find the best seats to reserve, best first
+
+        Contiguous seats come first, then they are ranked by price, by
+        whether they leave a single seat free next to them, by the number of
+        restricted view seats and by how close they are to the middle of
+        their block.
+
+        The ``allows_leaving_single_seats`` of each price band is respected.
+        With ``'never'`` no choices that leave a single seat are returned,
+        with ``'if_necessary'`` they are only returned for price bands that
+        have no other choices.
+
+        When the backend doesn't require contiguous seats, as indicated by
+        the ``contiguous_seat_selection_only`` of **meta**, price bands
+        without enough contiguous seats offer seats from several blocks.
+
+        Args:
+            quantity (int): the number of seats wanted.
+            meta (:class:`AvailabilityMeta <pyticketswitch.availability.AvailabilityMeta>`):
+                the meta data from the availability response. When not given
+                only contiguous seats are returned.
+            limit (int): the maximum number of choices to return. When not
+                given every choice is returned.
+
+        Returns:
+            list: :class:`SeatChoices <SeatChoice>`, empty when there are no
+            seats that can be reserved together, or **quantity** is not one
+            of the ``valid_quantities`` of **meta**.
+
+        """
+        if quantity < 1:
+            return []
+
+        contiguous_only = True
+        if meta is not None:
+            if meta.valid_quantities and quantity not in meta.valid_quantities:
+                return []
+            contiguous_only = meta.contiguous_seat_selection_only
+
+        candidates = []
+        contiguous = 0
+        previous = None
+        for band in self._band_order():
+            # contiguous seats rank first then by price, so once there are
+            # enough of them the dearer price bands can't make the cut
+            price_key = self._price_key(band)
+            if limit is not None and contiguous >= limit and \
+                    price_key != previous:
+                break
+            previous = price_key
+
+            found = self._contiguous_candidates(band, quantity)
+            contiguous += len(found)
+            if not found and not contiguous_only:
+                found = self._split_candidates(band, quantity)
+            candidates.extend(found)
+
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, candidates)
+        else:
+            ranked = sorted(candidates)
+
+        return [
+            SeatChoice(
+                [SeatMapBlock(self, start, length) for start, length in runs],
+                leaves_single_seat=key[3],
+            )
+            for key, runs in ranked
+        ]
+
+    def _allows_single(self, band, avoidable):
+        rule = self.price_bands[band].allows_leaving_single_seats
+        if rule == 'never':
+            return False
+        if rule == 'if_necessary':
+            return not avoidable
+        return True
+
+    def _price_key(self, band):
+        price = self._prices[band]
+        return (price is None, price or 0)
+
+    def _contiguous_candidates(self, band, quantity):
+        # every run of quantity seats within a block of the price band
+        price_key = self._price_key(band)
+        clean, single = [], []
+        for block in self._blocks_by_band[band]:
+            start = self._block_starts[block]
+            length = self._block_lengths[block]
+            if length < quantity:
+                continue
+
+            restricted = self.count_restricted(start, quantity)
+            for offset in range(length - quantity + 1):
+                if offset:
+                    # slide the window along one seat
+                    end = start + offset + quantity - 1
+                    restricted += self._restricted[end]
+                    restricted -= self._restricted[start + offset - 1]
+                leaves_single = 1 in (offset, length - quantity - offset)
+                key = (0,) + price_key + (
+                    leaves_single, restricted,
+                    abs(2 * offset + quantity - length), start + offset)
+                found = single if leaves_single else clean
+                found.append((key, ((start + offset, quantity),)))
+
+        if single and self._allows_single(band, avoidable=bool(clean)):
+            return clean + single
+        return clean
+
+    def _split_candidates(self, band, quantity):
+        # whole blocks, longest first, topped up from the shortest block
+        # that doesn't leave a single seat
+        blocks = sorted(
+            self._blocks_by_band[band],
+            key=lambda block: (-self._block_lengths[block], block))
+
+        runs, remaining = [], quantity
+        for block in blocks:
+            if self._block_lengths[block] > remaining:
+                continue
+            runs.append((self._block_starts[block], self._block_lengths[block]))
+            remaining -= self._block_lengths[block]
+
+        leaves_single = False
+        if remaining:
+            used = set(start for start, _ in runs)
+            spare = [
+                block for block in reversed(blocks)
+                if self._block_starts[block] not in used
+            ]
+            fits = [
+                block for block in spare
+                if self._block_lengths[block] - remaining != 1
+            ]
+            if fits:
+                block = fits[0]
+            elif spare and self._allows_single(band, avoidable=False):
+                block = spare[0]
+                leaves_single = True
+            else:
+                return []
+            runs.append((self._block_starts[block], remaining))
+
+        runs.sort()
+        restricted = sum(
+            self.count_restricted(start, length) for start, length in runs)
+        key = (1,) + self._price_key(band) + (
+            leaves_single, restricted, 0, runs[0][0])
+        return [(key, tuple(runs))]
+
+    def __repr__(self):
+        return u'<SeatMap {} seats>'.format(len(self))
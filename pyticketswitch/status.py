@@ -89,12 +89,19 @@ class Status(JSONMixin, object):
         self.purchase_result = purchase_result
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Status object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a transactions state.
+            lazy (bool): parse the sub objects of the events and
+                performances in the trolley when they are first read, see
+                :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the events in
+                the trolley, see :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
 
         Returns:
             :class:`Status <pyticketswitch.status.Status>`: a new
@@ -114,7 +121,8 @@ class Status(JSONMixin, object):
 
         kwargs = {
             'status': data.get('transaction_status'),
-            'trolley': Trolley.from_api_data(data),
+            'trolley': Trolley.from_api_data(
+                data, lazy=lazy, keep_raw=keep_raw),
             'remote_site': data.get('remote_site'),
             'can_edit_address': data.get('can_edit_address'),
             'needs_agent_reference': data.get('needs_agent_reference'),
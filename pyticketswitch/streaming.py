@@ -0,0 +1,228 @@
+"""Parsing of large list responses as they are downloaded.
+
+The events in a big ``events.v1`` or ``events_by_id.v1`` response can be
+parsed one at a time while the rest of the response is still arriving, so
+the first results are available sooner and the whole document never has to
+be held in memory::
+
+    >>> stream = client.stream_events(city_code='london-uk', page_length=500)
+    >>> for event in stream:
+    ...     print(event.description)
+    >>> stream.meta.total_results
+    1207
+
+The meta data is read from the rest of the response, which the API may send
+after the results, so it is only available once every object has been read.
+
+Streamed requests are made directly, they bypass the client's cache,
+coalescing, retries, hedging, circuit breaker and rate limiter.
+
+"""
+import codecs
+import decimal
+import json
+import re
+
+
+#: Number of bytes read from the response at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_STRUCTURE = re.compile(u'["\\[\\]{}:,]')
+_STRING = re.compile(u'"[^"\\\\]*(?:\\\\.[^"\\\\]*)*"', re.DOTALL)
+
+
+def _encode_key(key):
+    return json.dumps(key)
+
+
+class ItemParser(object):
+    """Decodes the items of a list or dict in a JSON document fed in chunks
+
+    Feed the document to the parser in chunks of any size, it returns every
+    item of the list or dict at **path** as soon as the item is complete.
+    Items must be objects or lists. Only the item being read and the parts of
+    the document outside of the list or dict are kept in memory.
+
+    Args:
+        path (tuple): the keys leading from the top of the document to the
+            list or dict, for example ``('results', 'event')``.
+        use_decimal (bool): parse numbers with a fractional part as
+            :class:`decimal.Decimal` rather than :obj:`float`.
+
+    Attributes:
+        found (bool): :obj:`True` once the list or dict has been found.
+
+    """
+
+    def __init__(self, path, use_decimal=False):
+        self.path = tuple(_encode_key(key) for key in path)
+        self.found = False
+        self._decoder = json.JSONDecoder(
+            parse_float=decimal.Decimal if use_decimal else None)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = u''
+        self._position = 0
+        self._stack = []
+        self._keys = []
+        self._expect_key = False
+        self._depth = None
+        self._prefix = None
+        self._suffix_start = None
+
+    def feed(self, chunk):
+        """Parse the next chunk of the document
+
+        Args:
+            chunk (bytes): the next part of the document.
+
+        Returns:
+            list: tuples of the key, for items of a dict, or :obj:`None`,
+            and the decoded item, for the items completed by this chunk.
+
+        Raises:
+            ValueError: when the chunk is not valid UTF-8.
+
+        """
+        items = []
+        buffer = self._buffer = self._buffer + self._text.decode(chunk)
+        position = self._position
+
+        while True:
+            match = _STRUCTURE.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+
+            index = match.start()
+            char = buffer[index]
+
+            if char == u'"':
+                string = _STRING.match(buffer, index)
+                if string is None:
+                    # the rest of the string is in the next chunk
+                    position = index
+                    break
+                position = string.end()
+                if self._expect_key:
+                    self._keys[-1] = string.group()
+                    self._expect_key = False
+                continue
+
+            if (char == u'{' or char == u'[') and \
+                    len(self._stack) == self._depth:
+                try:
+                    item, position = self._decoder.raw_decode(buffer, index)
+                except ValueError:
+                    # the rest of the item is in the next chunk
+                    position = index
+                    break
+                key = self._keys[-1]
+                if key is not None:
+                    key = json.loads(key)
+                items.append((key, item))
+                continue
+
+            position = index + 1
+            if char == u'{' or char == u'[':
+                self._open(char, index)
+            elif char == u'}' or char == u']':
+                self._close(index)
+            elif char == u',':
+                self._expect_key = self._stack[-1:] == [u'{']
+
+        self._trim(position)
+        return items
+
+    def remainder(self):
+        """Get the document without the items of the list or dict
+
+        Call this once the whole document has been fed to the parser.
+
+        Returns:
+            str: the document with the list or dict emptied, or the whole
+            document when it wasn't found.
+
+        """
+        rest = self._buffer + self._text.decode(b'', final=True)
+        if not self.found:
+            return rest
+        return self._prefix + rest[self._suffix_start or 0:]
+
+    def _open(self, char, index):
+        if self._depth is None and self._suffix_start is None and \
+                tuple(self._keys) == self.path:
+            self._depth = len(self._stack) + 1
+            self._prefix = self._buffer[:index + 1]
+            self.found = True
+        self._stack.append(char)
+        self._keys.append(None)
+        self._expect_key = char == u'{'
+
+    def _close(self, index):
+        self._stack.pop()
+        self._keys.pop()
+        self._expect_key = False
+        if self._depth is not None and len(self._stack) == self._depth - 1:
+            self._depth = None
+            self._suffix_start = index
+
+    def _trim(self, position):
+        # drop everything that has been handed out
+        start = 0
+        if self._depth is not None:
+            start = position
+        elif self._suffix_start:
+            start = self._suffix_start
+            self._suffix_start = 0
+
+        self._buffer = self._buffer[start:]
+        self._position = position - start
+
+
+class ResultStream(object):
+    """The objects in a response, parsed as the response is downloaded
+
+    Args:
+        chunks (iterable): the body of the response in chunks of bytes.
+        path (tuple): the keys leading to the list or dict of objects.
+        parse_item (callable): takes a decoded item and returns the object,
+            or :obj:`None` to skip the item.
+        finish (callable): takes the rest of the response, as text, once
+            every item has been read and returns the meta data.
+        use_decimal (bool): parse prices as :class:`decimal.Decimal`.
+        close (callable): called when the stream is finished with, to
+            release the connection.
+
+    Attributes:
+        meta: the meta data for the objects, :obj:`None` until they have all
+            been read.
+
+    """
+
+    def __init__(self, chunks, path, parse_item, finish, use_decimal=False,
+                 close=None):
+        self.chunks = chunks
+        self.path = path
+        self.parse_item = parse_item
+        self.finish = finish
+        self.use_decimal = use_decimal
+        self.meta = None
+        self._close = close
+
+    def __iter__(self):
+        parser = ItemParser(self.path, self.use_decimal)
+        try:
+            for chunk in self.chunks:
+                for _, data in parser.feed(chunk):
+                    item = self.parse_item(data)
+                    if item is not None:
+                        yield item
+            self.meta = self.finish(parser.remainder())
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the connection without reading the rest of the response"""
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
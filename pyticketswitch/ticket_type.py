@@ -16,6 +16,8 @@ class TicketType(JSONMixin, object):
             wich further subdivided available tickets/seats by price.
 
     """
+    __slots__ = ('code', 'description', 'price_bands')
+
     def __init__(self, code=None, description=None, price_bands=None):
 
         self.code = code
@@ -44,12 +44,19 @@ class Trolley(JSONMixin, object):
         self.input_contained_unavailable_order = input_contained_unavailable_order
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Trolley object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a trolley.
+            lazy (bool): parse the sub objects of the events and
+                performances in the orders when they are first read, see
+                :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
+            keep_raw (bool, str): how to keep the raw data of the events in
+                the orders, see :meth:`Order.from_api_data
+                <pyticketswitch.order.Order.from_api_data>`.
 
         Returns:
             :class:`Trolley <pyticketswitch.trolley.Trolley>`: a new
@@ -68,14 +75,14 @@ class Trolley(JSONMixin, object):
         raw_bundles = raw_contents.get('bundle', [])
 
         bundles = [
-            Bundle.from_api_data(bundle)
+            Bundle.from_api_data(bundle, lazy=lazy, keep_raw=keep_raw)
             for bundle in raw_bundles
         ]
 
         raw_discarded_orders = data.get('discarded_orders', [])
 
         discarded_orders = [
-            Order.from_api_data(order)
+            Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
             for order in raw_discarded_orders
         ]
 
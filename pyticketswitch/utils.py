@@ -1,8 +1,10 @@
 import functools
+import re
+import time
 import warnings
 
 from datetime import date, datetime
-from dateutil import parser
+from dateutil import parser, tz
 from decimal import Decimal
 from pyticketswitch.exceptions import InvalidParametersError
 
@@ -48,9 +50,56 @@ def date_range_str(start_date, end_date):
     return date_range
 
 
+#: Maximum number of datetime strings remembered by
+#: :func:`isostr_to_datetime`.
+ISO_CACHE_SIZE = 4096
+
+_ISO_CACHE = {}
+
+_ISO_DATETIME = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?'
+    r'(?:(Z)|([+-])(\d{2}):?(\d{2}))?$'
+)
+
+_UTC = tz.tzutc()
+
+
+def _parse_iso_datetime(date_str):
+    match = _ISO_DATETIME.match(date_str)
+    if match is None:
+        return None
+
+    (year, month, day, hour, minute, second, fraction,
+     zulu, sign, offset_hours, offset_minutes) = match.groups()
+
+    tzinfo = None
+    if zulu:
+        tzinfo = _UTC
+    elif sign:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        if sign == '-':
+            offset = -offset
+        tzinfo = tz.tzoffset(None, offset) if offset else _UTC
+
+    try:
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int((fraction or '0').ljust(6, '0')),
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+
+
 def isostr_to_datetime(date_str):
     """Convert an iso datetime string to a :py:class:`datetime.datetime` object.
 
+    The ISO 8601 formats used by the API are parsed directly, anything else
+    is left to :py:func:`dateutil.parser.parse`. Results are remembered, so
+    the same string is only parsed once.
+
     Args:
         date_str (str): the string to convert.
 
@@ -65,13 +114,31 @@ def isostr_to_datetime(date_str):
     if not date_str:
         raise ValueError('{} is not a valid datetime string'.format(date_str))
 
-    dt = parser.parse(date_str)
+    dt = _ISO_CACHE.get(date_str)
+    if dt is not None:
+        return dt
+
+    dt = _parse_iso_datetime(date_str)
+    if dt is None:
+        dt = parser.parse(date_str)
+
+    if len(_ISO_CACHE) >= ISO_CACHE_SIZE:
+        _ISO_CACHE.clear()
+    _ISO_CACHE[date_str] = dt
     return dt
 
 
+#: Maximum number of date strings remembered by :func:`yyyymmdd_to_date`.
+DATE_CACHE_SIZE = 4096
+
+_DATE_CACHE = {}
+
+
 def yyyymmdd_to_date(date_str):
     """Convert a YYYYMMDDD formated date to python :py:class:`datetime.date` object.
 
+    Results are remembered, so the same string is only parsed once.
+
     Args:
         date_str (str): the string to convert.
 
@@ -84,9 +151,19 @@ def yyyymmdd_to_date(date_str):
     if not date_str:
         raise ValueError('{} is not a valid datetime string'.format(date_str))
 
-    date = datetime.strptime(date_str, '%Y%m%d')
-    if date:
-        return date.date()
+    parsed = _DATE_CACHE.get(date_str)
+    if parsed is not None:
+        return parsed
+
+    if len(date_str) == 8 and date_str.isdigit():
+        parsed = date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    else:
+        parsed = datetime.strptime(date_str, '%Y%m%d').date()
+
+    if len(_DATE_CACHE) >= DATE_CACHE_SIZE:
+        _DATE_CACHE.clear()
+    _DATE_CACHE[date_str] = parsed
+    return parsed
 
 
 def specific_dates_from_api_data(dates):
@@ -255,3 +332,18 @@ def deprecated(func):
     # Mark the function as deprecated
     wrapped_func.is_deprecated = True
     return wrapped_func
+
+
+def monotonic():
+    """Get the value of a clock that never goes backwards
+
+    Falls back to :func:`time.time` on pythons without
+    :func:`time.monotonic`.
+
+    Returns:
+        float: a time in seconds, only useful for comparing with other
+        values returned by this function.
+
+    """
+    clock = getattr(time, 'monotonic', time.time)
+    return clock()
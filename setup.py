@@ -17,7 +17,15 @@ setup(
         'requests>=2.0.0',
         'python-dateutil>2.5.3',
         'six>=1.11.0',
+        'futures>=3.0.0; python_version < "3"',
     ],
+    extras_require={
+        'async': ['aiohttp>=3.0.0'],
+        'fast_json': [
+            'orjson; python_version >= "3.6"',
+            'ujson; python_version < "3.6"',
+        ],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Programming Language :: Python :: 3',
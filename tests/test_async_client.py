@@ -0,0 +1,878 @@
+import asyncio
+import decimal
+import json
+import pytest
+from mock import AsyncMock, Mock
+import pyticketswitch
+from pyticketswitch.client import POST
+from pyticketswitch.cache import TTLCache
+from pyticketswitch.circuit_breaker import CircuitBreaker
+from pyticketswitch.hedging import HedgePolicy
+from pyticketswitch.rate_limit import RateLimiter
+from pyticketswitch.retry import RetryPolicy
+from pyticketswitch import exceptions
+from pyticketswitch.customer import Customer
+from pyticketswitch.status import Status
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from pyticketswitch.async_client import (  # NOQA
+    AsyncClient, AsyncConcurrencyLimiter)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def client():
+    client = AsyncClient(user="bilbo", password="baggins", use_decimal=True)
+    return client
+
+
+@pytest.fixture
+def mock_make_request(client, monkeypatch):
+    mock_make_request = AsyncMock(return_value={'results': {}})
+    monkeypatch.setattr(client, 'make_request', mock_make_request)
+    return mock_make_request
+
+
+class FakeResponse(object):
+
+    def __init__(self, status=200, content=b''):
+        self.status = status
+        self._content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def read(self):
+        return self._content
+
+
+class FakeStreamContent(object):
+
+    def __init__(self, content):
+        self._content = content
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._content), 16):
+            yield self._content[start:start + 16]
+
+
+class FakeStreamingResponse(FakeResponse):
+
+    def __init__(self, status=200, content=b''):
+        super(FakeStreamingResponse, self).__init__(status, content)
+        self.content = FakeStreamContent(content)
+        self.release = Mock()
+
+    def __await__(self):
+        async def response():
+            return self
+        return response().__await__()
+
+
+def fake_session(response):
+    session = Mock()
+    session.closed = False
+    session.request = Mock(return_value=response)
+    return session
+
+
+def json_response(data, status=200):
+    return FakeResponse(status=status, content=json.dumps(data).encode('utf-8'))
+
+
+class TestAsyncClient:
+
+    def test_make_request(self, client, monkeypatch):
+        session = fake_session(json_response({'lol': 'beans'}))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+        client.language = 'en-GB'
+
+        response = run(client.make_request('events.v1', {'foo': 'bar', 'baz': True}))
+
+        assert response == {'lol': 'beans'}
+        session.request.assert_called_with(
+            'GET',
+            'https://api.ticketswitch.com/f13/events.v1/',
+            auth=aiohttp.BasicAuth('bilbo', 'baggins', encoding='utf-8'),
+            params={'foo': 'bar', 'baz': 'True'},
+            headers={
+                'Accept-Language': 'en-GB',
+                'User-Agent': 'pyticketswitch {}'.format(pyticketswitch.__version__),
+            },
+        )
+
+    def test_make_request_logs_body_when_debugging(self, client, monkeypatch, caplog):
+        session = fake_session(json_response({'lol': u'caf\xe9'}))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        with caplog.at_level('INFO', logger='pyticketswitch.async_client'):
+            run(client.make_request('events.v1', {}))
+        assert 'lol' not in caplog.text
+
+        with caplog.at_level('DEBUG', logger='pyticketswitch.async_client'):
+            run(client.make_request('events.v1', {}))
+        assert '{"lol": "caf\\u00e9"}' in caplog.text
+
+    def test_sync_context_manager(self, client):
+        with pytest.raises(TypeError):
+            with client:
+                pass  # pragma: no cover
+
+        with pytest.raises(TypeError):
+            client.__exit__(None, None, None)
+
+    def test_make_request_with_post(self, client, monkeypatch):
+        session = fake_session(json_response({'lol': 'beans'}))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        run(client.make_request('reserve.v1', {'foo': 'bar'}, method=POST))
+
+        args, kwargs = session.request.call_args
+        assert args == ('POST', 'https://api.ticketswitch.com/f13/reserve.v1/')
+        assert kwargs['data'] == {'foo': 'bar'}
+
+    def test_make_request_with_timeout(self, client, monkeypatch):
+        session = fake_session(json_response({'lol': 'beans'}))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        run(client.make_request('events.v1', {}, timeout=15))
+
+        _, kwargs = session.request.call_args
+        assert kwargs['timeout'].total == 15
+
+    def test_make_request_using_decimal_parsing(self, client, monkeypatch):
+        session = fake_session(json_response({'amount': 1.0}))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        response = run(client.make_request('test.v1', {}))
+
+        assert response['amount'] == decimal.Decimal('1.0')
+
+    def test_make_request_bad_response_with_auth_error(self, client, monkeypatch):
+        session = fake_session(json_response(
+            {'error_code': 3, 'error_desc': 'User authorisation failure'},
+            status=400,
+        ))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        with pytest.raises(exceptions.AuthenticationError):
+            run(client.make_request('test.v1', {}))
+
+    def test_make_request_410_gone_response(self, client, monkeypatch):
+        session = fake_session(json_response(
+            {'error_code': 8, 'error_desc': 'transaction failed'},
+            status=410,
+        ))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        with pytest.raises(exceptions.CallbackGoneError):
+            run(client.make_request('callback.v1', {}))
+
+    def test_make_request_bad_response_without_error(self, client, monkeypatch):
+        session = fake_session(json_response({}, status=500))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            run(client.make_request('test.v1', {}))
+
+    def test_make_request_no_contents_raises(self, client, monkeypatch):
+        session = fake_session(FakeResponse(status=200, content=b'not json'))
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            run(client.make_request('test.v1', {}))
+
+    def test_get_session_is_reused(self, client):
+
+        async def sessions():
+            first = await client.get_session()
+            second = await client.get_session()
+            await client.close()
+            return first, second
+
+        first, second = run(sessions())
+        assert first is second
+        assert first.closed
+
+    def test_list_events(self, client, monkeypatch):
+        response = {
+            'results': {
+                'event': [
+                    {'event_id': 'ABC123'},
+                    {'event_id': 'DEF456'},
+                ],
+                'paging_status': {
+                    'total_unpaged_results': 10,
+                },
+            },
+        }
+        mock_make_request = AsyncMock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = run(client.list_events(keywords=['awesome', 'stuff']))
+
+        mock_make_request.assert_called_with(
+            'events.v1', {'keywords': 'awesome,stuff'})
+        assert [event.id for event in events] == ['ABC123', 'DEF456']
+        assert meta.total_results == 10
+
+    def test_list_events_with_overridden_hooks(self, monkeypatch):
+
+        class CustomClient(AsyncClient):
+
+            def add_optional_kwargs(self, params, **kwargs):
+                params.update(channel='web')
+                super(CustomClient, self).add_optional_kwargs(params, **kwargs)
+
+        client = CustomClient(user='bilbo', password='baggins')
+        mock_make_request = AsyncMock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.list_events(tracking_id='abc123'))
+
+        mock_make_request.assert_called_with('events.v1', {
+            'channel': 'web',
+            'tsw_session_track_id': 'abc123',
+        })
+
+    def test_list_events_lazy_models(self, monkeypatch):
+        client = AsyncClient(
+            user='bilbo', password='baggins', lazy_models=True)
+        response = {'results': {'event': [{'event_id': 'ABC123'}]}}
+        monkeypatch.setattr(
+            client, 'make_request', AsyncMock(return_value=response))
+
+        events, meta = run(client.list_events())
+
+        assert events[0].is_deferred('cost_range')
+
+    def test_list_events_keep_raw(self, monkeypatch):
+        client = AsyncClient(user='bilbo', password='baggins', keep_raw=False)
+        response = {'results': {'event': [{'event_id': 'ABC123'}]}}
+        monkeypatch.setattr(
+            client, 'make_request', AsyncMock(return_value=response))
+
+        events, meta = run(client.list_events())
+
+        assert events[0].raw is None
+
+    def test_list_events_no_results(self, client, monkeypatch):
+        monkeypatch.setattr(client, 'make_request', AsyncMock(return_value={}))
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            run(client.list_events())
+
+    def test_stream_events(self, client, monkeypatch):
+        response = FakeStreamingResponse(content=json.dumps({
+            'results': {
+                'event': [
+                    {'event_id': 'ABC1', 'event_desc': 'Thing one'},
+                    {'event_id': 'DEF2', 'event_desc': 'Thing two'},
+                ],
+                'paging_status': {'total_unpaged_results': 8},
+            },
+        }).encode('utf-8'))
+        session = fake_session(response)
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        async def collect():
+            stream = await client.stream_events(page_length=2)
+            return [event.id async for event in stream], stream.meta
+
+        event_ids, meta = run(collect())
+
+        assert event_ids == ['ABC1', 'DEF2']
+        assert meta.total_results == 8
+        assert session.request.call_args[0][0] == 'GET'
+        assert session.request.call_args[1]['params']['page_len'] == '2'
+        response.release.assert_called_once_with()
+
+    def test_stream_events_by_id_error(self, client, monkeypatch):
+        response = FakeStreamingResponse(status=400, content=json.dumps({
+            'error_code': 8, 'error_desc': 'bad things',
+        }).encode('utf-8'))
+        session = fake_session(response)
+        monkeypatch.setattr(client, 'get_session', AsyncMock(return_value=session))
+
+        async def collect():
+            stream = await client.stream_events_by_id(['ABC1'])
+            return [event async for event in stream]
+
+        with pytest.raises(exceptions.APIError):
+            run(collect())
+
+    def test_get_event(self, client, monkeypatch):
+        response = {
+            'events_by_id': {
+                'ABC123': {'event': {'event_id': 'ABC123'}},
+            },
+        }
+        mock_make_request = AsyncMock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        event, meta = run(client.get_event('ABC123'))
+
+        mock_make_request.assert_called_with(
+            'events_by_id.v1', {'event_id_list': 'ABC123'})
+        assert event.id == 'ABC123'
+
+    def test_list_performances(self, client, monkeypatch):
+        response = {
+            'results': {
+                'performance': [
+                    {'perf_id': 'ABC123-1', 'event_id': 'ABC123'},
+                ],
+            },
+        }
+        mock_make_request = AsyncMock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances, meta = run(client.list_performances('ABC123', page=2))
+
+        mock_make_request.assert_called_with(
+            'performances.v1', {'event_id': 'ABC123', 'page_no': 2})
+        assert performances[0].id == 'ABC123-1'
+
+    def test_get_performance(self, client, monkeypatch):
+        response = {
+            'performances_by_id': {
+                'ABC123-1': {'perf_id': 'ABC123-1', 'event_id': 'ABC123'},
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', AsyncMock(return_value=response))
+
+        performance, meta = run(client.get_performance('ABC123-1'))
+
+        assert performance.id == 'ABC123-1'
+
+    def test_get_availability(self, client, monkeypatch):
+        response = {
+            'availability': {
+                'ticket_type': [
+                    {
+                        'ticket_type_code': 'CIRCLE',
+                        'price_band': [{'price_band_code': 'A'}],
+                    },
+                ],
+            },
+            'backend_is_down': False,
+        }
+        mock_make_request = AsyncMock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        availability, meta = run(client.get_availability('ABC123-1', seat_blocks=True))
+
+        mock_make_request.assert_called_with(
+            'availability.v1', {'perf_id': 'ABC123-1', 'add_seat_blocks': True})
+        assert availability[0].code == 'CIRCLE'
+        assert meta.backend_is_down is False
+
+    def test_execute_with_cache(self, client, monkeypatch):
+        client.cache = TTLCache()
+        mock_make_request = AsyncMock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.get_months('6IF'))
+        run(client.get_months('6IF'))
+
+        mock_make_request.assert_called_once_with(
+            'months.v1', {'event_id': '6IF'})
+
+    def test_execute_with_coalescing(self, monkeypatch):
+        client = AsyncClient(user='bilbo', password='baggins', coalesce=True)
+        calls = []
+
+        async def fake_make_request(endpoint, params):
+            calls.append(params)
+            await asyncio.sleep(0)
+            return {'availability': {'ticket_type': [
+                {'ticket_type_code': 'CIRCLE'},
+            ]}}
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def fetch_many():
+            return await asyncio.gather(*[
+                client.get_availability('6IF-B1H') for _ in range(3)
+            ])
+
+        results = run(fetch_many())
+
+        assert calls == [{'perf_id': '6IF-B1H'}]
+        assert [availability[0].code for availability, _ in results] == [
+            'CIRCLE'] * 3
+        assert client.single_flight.shared == 2
+        assert len(client.single_flight) == 0
+
+    def test_execute_with_coalescing_waiter_deadline(self, monkeypatch):
+        client = AsyncClient(user='bilbo', password='baggins', coalesce=True)
+        release = asyncio.Event()
+
+        async def fake_make_request(endpoint, params):
+            await release.wait()
+            return {'availability': {}}
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def waiter():
+            with client.deadline(0.01):
+                return await client.get_availability('6IF-B1H')
+
+        async def fetch_both():
+            leader = asyncio.ensure_future(client.get_availability('6IF-B1H'))
+            await asyncio.sleep(0)
+            with pytest.raises(exceptions.DeadlineExceededError):
+                await waiter()
+            release.set()
+            return await leader
+
+        availability, meta = run(fetch_both())
+
+        assert client.single_flight.shared == 1
+        assert len(client.single_flight) == 0
+
+    def test_get_event_with_batch_window(self, monkeypatch):
+        client = AsyncClient(user='bilbo', password='baggins', batch_window=0)
+        calls = []
+
+        async def fake_make_request(endpoint, params):
+            calls.append(params)
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in params['event_id_list'].split(',')
+                },
+            }
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def fetch_many():
+            return await asyncio.gather(
+                client.get_event('6IF'),
+                client.get_event('7AB'),
+                client.get_event('6IF'),
+            )
+
+        results = run(fetch_many())
+
+        assert calls == [{'event_id_list': '6IF,7AB'}]
+        assert [event.id for event, _ in results] == ['6IF', '7AB', '6IF']
+
+    def test_get_performance_with_batch_window_error(self, monkeypatch):
+        client = AsyncClient(user='bilbo', password='baggins', batch_window=0)
+        mock_make_request = AsyncMock(
+            side_effect=exceptions.APIError('not found', 5))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.APIError):
+            run(client.get_performance('6IF-B1H'))
+
+    def test_batch(self, client, monkeypatch):
+        calls = []
+
+        async def fake_make_request(endpoint, params):
+            calls.append((endpoint, params))
+            if endpoint == 'events_by_id.v1':
+                return {
+                    'events_by_id': {
+                        event_id: {'event': {'event_id': event_id}}
+                        for event_id in params['event_id_list'].split(',')
+                    },
+                }
+            return {
+                'performances_by_id': {
+                    perf_id: {'perf_id': perf_id}
+                    for perf_id in params['perf_id_list'].split(',')
+                },
+            }
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def fetch_many():
+            async with client.batch() as batch:
+                events = [batch.get_event('6IF'), batch.get_event('7AB')]
+                performance = batch.get_performance('6IF-B1H')
+                assert calls == []
+            assert all(event.done() for event in events)
+            return [await event for event in events], await performance
+
+        events, performance = run(fetch_many())
+
+        assert sorted(endpoint for endpoint, _ in calls) == [
+            'events_by_id.v1', 'performances_by_id.v1']
+        assert [event.id for event, _ in events] == ['6IF', '7AB']
+        assert performance[0].id == '6IF-B1H'
+
+    def test_batch_error(self, client, monkeypatch):
+        mock_make_request = AsyncMock(
+            side_effect=exceptions.APIError('not found', 5))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def fetch():
+            async with client.batch() as batch:
+                lookup = batch.get_event('6IF')
+            return await lookup
+
+        with pytest.raises(exceptions.APIError):
+            run(fetch())
+
+    def test_execute_with_retry(self, client, monkeypatch):
+        client.retry = RetryPolicy(backoff=0)
+        mock_make_request = AsyncMock(side_effect=[
+            aiohttp.ServerDisconnectedError(),
+            asyncio.TimeoutError(),
+            {'results': {}},
+        ])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.get_months('6IF'))
+
+        assert mock_make_request.call_count == 3
+
+    def test_execute_with_retry_never_retries_post(self, client, monkeypatch):
+        client.retry = RetryPolicy(backoff=0)
+        mock_make_request = AsyncMock(
+            side_effect=aiohttp.ServerDisconnectedError())
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            run(client.cancel_purchase('abc123'))
+
+        assert mock_make_request.call_count == 1
+
+    def test_execute_with_circuit_breaker(self, client, monkeypatch):
+        client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        client.circuit_breaker.learn('6IF', 'ext_test0')
+        mock_make_request = AsyncMock(side_effect=asyncio.TimeoutError())
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(asyncio.TimeoutError):
+            run(client.get_availability('6IF-B1H'))
+        with pytest.raises(exceptions.CircuitOpenError):
+            run(client.get_availability('6IF-B1H'))
+
+        assert mock_make_request.call_count == 1
+
+    def test_execute_with_rate_limiter(self, client, monkeypatch):
+        client.rate_limiter = RateLimiter(rate=1)
+        mock_sleep = AsyncMock()
+        monkeypatch.setattr('pyticketswitch.async_client.asyncio.sleep', mock_sleep)
+        mock_make_request = AsyncMock(side_effect=[
+            {'results': {}},
+            exceptions.InvalidResponseError('slow down', status_code=429),
+        ])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.get_months('6IF'))
+        with pytest.raises(exceptions.InvalidResponseError):
+            run(client.get_months('6IF'))
+
+        assert mock_sleep.call_count == 1
+        assert client.rate_limiter.get_rate('months.v1') == 0.5
+
+    def test_execute_with_hedge(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=0.01)
+        cancelled = []
+        delays = [5, 0]
+
+        async def make_request(*args, **kwargs):
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return {'user_id': 'after {}s'.format(delay)}
+
+        monkeypatch.setattr(client, 'make_request', make_request)
+
+        async def fetch():
+            result = await client.test()
+            await asyncio.sleep(0)
+            return result
+
+        user = run(fetch())
+
+        assert user.id == 'after 0s'
+        assert cancelled == [5]
+        assert client.hedge.hedged == 1
+        assert client.hedge.wins == 1
+
+    def test_execute_with_hedge_fast_response(self, client,
+                                              mock_make_request):
+        client.hedge = HedgePolicy(percentile=None, delay=5)
+
+        run(client.test())
+
+        assert mock_make_request.call_count == 1
+        assert client.hedge.hedged == 0
+
+    def test_execute_with_concurrency_limiter(self, client, monkeypatch):
+        client.concurrency_limiter = AsyncConcurrencyLimiter(limit=2)
+        peak = []
+
+        async def make_request(*args, **kwargs):
+            peak.append(client.concurrency_limiter.stats().active)
+            await asyncio.sleep(0.001)
+            return {'results': {}}
+
+        monkeypatch.setattr(client, 'make_request', make_request)
+
+        async def fetch_all():
+            await asyncio.gather(*[
+                client.get_months(event_id)
+                for event_id in ('6IF', '7AB', '8CD', '9EF', '1GH')
+            ])
+
+        run(fetch_all())
+
+        assert max(peak) == 2
+        stats = client.concurrency_limiter.stats()
+        assert stats.active == 0
+        assert stats.waiting == 0
+        assert stats.acquired == 5
+
+    def test_execute_with_concurrency_limiter_timeout(self, client,
+                                                      mock_make_request):
+        client.concurrency_limiter = AsyncConcurrencyLimiter(limit=1)
+
+        async def flow():
+            await client.concurrency_limiter.acquire('months.v1')
+            with client.deadline(0.01):
+                await client.get_months('6IF')
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            run(flow())
+
+        mock_make_request.assert_not_called()
+        stats = client.concurrency_limiter.stats()
+        assert stats.rejected == 1
+        assert stats.waiting == 0
+
+    def test_concurrency_limiter_cancelled_waiter(self):
+        limiter = AsyncConcurrencyLimiter(limit=1)
+
+        async def flow():
+            await limiter.acquire('events.v1')
+            waiter = asyncio.ensure_future(limiter.acquire('events.v1'))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release('events.v1')
+
+        run(flow())
+
+        stats = limiter.stats()
+        assert stats.active == 0
+        assert stats.waiting == 0
+
+    def test_execute_with_deadline(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def flow():
+            with client.deadline(10):
+                await client.get_months('6IF')
+            with client.deadline(0):
+                await client.get_months('7AB')
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            run(flow())
+
+        assert mock_make_request.call_count == 1
+        assert 0 < mock_make_request.call_args[1]['timeout'] <= 10
+
+    def test_iter_events(self, client, monkeypatch):
+        async def fake_make_request(endpoint, params):
+            page = params.get('page_no', 1)
+            return {
+                'results': {
+                    'event': [{'event_id': str(page)}],
+                    'paging_status': {
+                        'page_number': page,
+                        'pages_remaining': 3 - page,
+                    },
+                },
+            }
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def collect(**kwargs):
+            return [event.id async for event in client.iter_events(**kwargs)]
+
+        assert run(collect()) == ['1', '2', '3']
+        assert run(collect(concurrent=True, max_workers=1)) == ['1', '2', '3']
+
+    def test_iter_events_keeps_deadline(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def collect():
+            with client.deadline(0):
+                events = client.iter_events()
+            return [event async for event in events]
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            run(collect())
+        assert mock_make_request.call_count == 0
+
+    def test_iter_performances(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={
+            'results': {'performance': [{'perf_id': '6IF-1'}]},
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def collect():
+            return [
+                performance.id
+                async for performance in client.iter_performances('6IF')
+            ]
+
+        assert run(collect()) == ['6IF-1']
+        mock_make_request.assert_called_once_with('performances.v1', {
+            'event_id': '6IF', 'page_len': 50})
+
+    def test_get_events_in_chunks(self, client, monkeypatch):
+        async def fake_make_request(endpoint, params):
+            event_ids = params['event_id_list'].split(',')
+            if 'BAD1' in event_ids:
+                raise exceptions.APIError('event not found', 5)
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in event_ids
+                },
+            }
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        events, meta = run(client.get_events(
+            ['ABC1', 'DEF2', 'GHI3'], chunk_size=2))
+        assert sorted(events) == ['ABC1', 'DEF2', 'GHI3']
+
+        with pytest.raises(exceptions.APIError):
+            run(client.get_events(['ABC1', 'BAD1'], chunk_size=1))
+
+    def test_get_performances_in_chunks(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={'performances_by_id': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.get_performances(['6IF-A8B', '6IF-A8C'], chunk_size=1))
+
+        assert mock_make_request.call_count == 2
+        mock_make_request.assert_any_call(
+            'performances_by_id.v1', {'perf_id_list': '6IF-A8C'})
+
+    def test_get_availability_many(self, client, monkeypatch):
+        async def fake_make_request(endpoint, params):
+            if params['perf_id'] == 'BAD-1':
+                raise exceptions.APIError('perf not found', 5)
+            return {
+                'availability': {
+                    'ticket_type': [{'ticket_type_code': params['perf_id']}],
+                },
+            }
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        results, errors = run(client.get_availability_many(
+            ['6IF-A8B', 'BAD-1', '6IF-A8B'], max_workers=1))
+
+        availability, meta = results['6IF-A8B']
+        assert availability[0].code == '6IF-A8B'
+        assert list(results) == ['6IF-A8B']
+        assert isinstance(errors['BAD-1'], exceptions.APIError)
+
+    def test_get_trolley(self, client, monkeypatch):
+        response = {'trolley_token': 'ABC123'}
+        mock_make_request = AsyncMock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        trolley, meta = run(client.get_trolley(
+            performance_id='6IF-A8B', number_of_seats=2))
+
+        mock_make_request.assert_called_with(
+            'trolley.v1', {'perf_id': '6IF-A8B', 'no_of_seats': 2})
+        assert trolley.token == 'ABC123'
+
+    def test_make_reservation(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        run(client.make_reservation(token='ABC123'))
+
+        mock_make_request.assert_called_with(
+            'reserve.v1', {'trolley_token': 'ABC123'}, method=POST)
+
+    def test_reservation_and_purchase_with_overridden_hooks(self, monkeypatch):
+
+        class CustomClient(AsyncClient):
+
+            def process_reservation_response(self, response,
+                                             raise_on_unavailable_order):
+                return 'reservation', raise_on_unavailable_order
+
+            def process_purchase_response(self, response):
+                return 'purchase', response
+
+        client = CustomClient(user='bilbo', password='baggins')
+        monkeypatch.setattr(
+            client, 'make_request', AsyncMock(return_value={'foo': 'bar'}))
+        customer = Customer('fred', 'flintstone', ['301 cobblestone way'], 'us')
+
+        assert run(client.make_reservation(
+            raise_on_unavailable_order=True)) == ('reservation', True)
+        assert run(client.get_reservation('abc123')) == (
+            'reservation', False)
+        assert run(client.make_purchase('abc123', customer)) == (
+            'purchase', {'foo': 'bar'})
+        assert run(client.get_purchase('abc123')) == (
+            'purchase', {'foo': 'bar'})
+        assert run(client.next_callout('abc', 'def', {})) == (
+            'purchase', {'foo': 'bar'})
+
+    def test_make_purchase(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={
+            'transaction_status': 'purchased',
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+        customer = Customer('fred', 'flintstone', ['301 cobblestone way'], 'us')
+
+        status, callout, meta = run(client.make_purchase('abc123', customer))
+
+        assert isinstance(status, Status)
+        assert status.status == 'purchased'
+        assert callout is None
+        args, kwargs = mock_make_request.call_args
+        assert args[0] == 'purchase.v1'
+        assert kwargs == {'method': POST}
+
+    def test_next_callout(self, client, monkeypatch):
+        mock_make_request = AsyncMock(return_value={
+            'callout': {'bundle_source_code': 'ext_test0'},
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        status, callout, meta = run(client.next_callout('abc', 'def', {'a': 'b'}))
+
+        mock_make_request.assert_called_with(
+            'callback.v1/this.abc/next.def', {'a': 'b'}, method=POST)
+        assert status is None
+        assert callout.code == 'ext_test0'
+
+    def test_cancel_purchase(self, client, monkeypatch):
+        with open("test_data/successful_cancellation.json", 'r') as file_handle:
+            response = json.load(file_handle)
+        monkeypatch.setattr(client, 'make_request', AsyncMock(return_value=response))
+
+        result, meta = run(client.cancel_purchase('abc123'))
+
+        assert result.is_fully_cancelled()
@@ -405,6 +405,68 @@ class TestAvailabilityDetails:
         assert len(details) == 1
 
         assert details[0]._weekday_mask == 63
+        assert details[0].weekday_list == [
+            True, True, True, True, True, False, True]
+
+    def test_from_api_data_with_repeated_masks(self):
+        avail_detail = {
+            'available_dates': {
+                'first_yyyymmdd': '20161205',
+                'last_yyyymmdd': '20170110',
+                'year_2016': {'dec_bitmask': 1065287163},
+                'year_2017': {'jan_bitmask': 2012209087},
+            },
+            'available_weekdays_bitmask': 23,
+        }
+        data = {
+            'ticket_type': [
+                {
+                    'ticket_type_code': 'FOO',
+                    'ticket_type_desc': 'Foo',
+                    'price_band': [
+                        {
+                            'price_band_code': 'A',
+                            'avail_detail': [dict(avail_detail)],
+                        },
+                        {
+                            'price_band_code': 'B',
+                            'avail_detail': [dict(avail_detail)],
+                        },
+                    ]
+                },
+            ],
+        }
+        first, second = AvailabilityDetails.from_api_data(data)
+
+        assert first.first_date == datetime.date(2016, 12, 5)
+        assert second.last_date == datetime.date(2017, 1, 10)
+        assert first._calendar_masks == {
+            2016: {12: 1065287163}, 2017: {1: 2012209087}}
+        assert second._calendar_masks == first._calendar_masks
+        assert first.weekday_list == [
+            True, True, False, True, False, False, True]
+        assert first.weekday_list == second.weekday_list
+
+        first._calendar_masks[2016][12] = 0
+        first._calendar_masks[2017] = {}
+        first.weekday_list[0] = False
+
+        assert second._calendar_masks == {
+            2016: {12: 1065287163}, 2017: {1: 2012209087}}
+        assert second.weekday_list[0] is True
+        assert second.is_available(2016, 12, 1)
+
+        third, = AvailabilityDetails.from_api_data({
+            'ticket_type': [{
+                'ticket_type_code': 'FOO',
+                'price_band': [{
+                    'price_band_code': 'A',
+                    'avail_detail': [dict(avail_detail)],
+                }],
+            }],
+        })
+        assert third._calendar_masks == second._calendar_masks
+        assert third.weekday_list == second.weekday_list
 
     def test_from_api_data_adds_valid_quantities(self):
         data = {
@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+from mock import Mock
+
+from pyticketswitch import batching
+from pyticketswitch.batching import Batch, Loader
+
+
+def fake_fetch(ids, **kwargs):
+    return {id_: 'object {}'.format(id_) for id_ in ids if id_ != 'MISSING'}, 'meta'
+
+
+class TestKwargsKey:
+
+    def test_kwargs_key(self):
+        key_one = batching.kwargs_key({'media': True, 'reviews': False})
+        key_two = batching.kwargs_key({'reviews': False, 'media': True})
+        assert key_one == key_two
+        assert key_one != batching.kwargs_key({'media': True})
+
+
+class TestLoader:
+
+    def test_dispatch(self):
+        fetch = Mock(side_effect=fake_fetch)
+        loader = Loader(fetch)
+
+        lookups = [
+            loader.load(id_) for id_ in ['6IF', '7AB', '6IF', 'MISSING']
+        ]
+        assert not any(lookup.done() for lookup in lookups)
+
+        loader.dispatch()
+
+        fetch.assert_called_once_with(['6IF', '7AB', 'MISSING'])
+        assert [lookup.result() for lookup in lookups] == [
+            ('object 6IF', 'meta'),
+            ('object 7AB', 'meta'),
+            ('object 6IF', 'meta'),
+            (None, 'meta'),
+        ]
+        assert loader.batches == 1
+        assert loader.lookups == 4
+
+    def test_dispatch_groups_by_kwargs(self):
+        fetch = Mock(side_effect=fake_fetch)
+        loader = Loader(fetch)
+
+        loader.load('6IF', media=True)
+        loader.load('7AB')
+        loader.load('8CD', media=True)
+        loader.dispatch()
+
+        assert fetch.call_count == 2
+        fetch.assert_any_call(['6IF', '8CD'], media=True)
+        fetch.assert_any_call(['7AB'])
+
+    def test_result_dispatches_pending(self):
+        fetch = Mock(side_effect=fake_fetch)
+        loader = Loader(fetch)
+
+        lookup = loader.load('6IF')
+        assert lookup.result() == ('object 6IF', 'meta')
+        fetch.assert_called_once_with(['6IF'])
+
+    def test_result_with_error(self):
+        loader = Loader(Mock(side_effect=ValueError('boom')))
+        lookups = [loader.load('6IF'), loader.load('7AB')]
+
+        for lookup in lookups:
+            with pytest.raises(ValueError):
+                lookup.result()
+
+    def test_window(self):
+        fetch = Mock(side_effect=fake_fetch)
+        loader = Loader(fetch, window=0.05)
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda id_=id_: results.append(
+                    loader.load(id_).result(timeout=5)))
+            for id_ in ['6IF', '7AB', '8CD']
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetch.call_count == 1
+        assert sorted(fetch.call_args[0][0]) == ['6IF', '7AB', '8CD']
+        assert sorted(results) == [
+            ('object 6IF', 'meta'),
+            ('object 7AB', 'meta'),
+            ('object 8CD', 'meta'),
+        ]
+
+
+class TestBatch:
+
+    def test_batch(self):
+        client = Mock()
+        client.get_events.side_effect = fake_fetch
+        client.get_performances.side_effect = fake_fetch
+
+        with Batch(client) as batch:
+            event_one = batch.get_event('6IF')
+            event_two = batch.get_event('7AB')
+            performance = batch.get_performance('6IF-B1H', media=True)
+
+        client.get_events.assert_called_once_with(['6IF', '7AB'])
+        client.get_performances.assert_called_once_with(
+            ['6IF-B1H'], media=True)
+        assert event_one.result() == ('object 6IF', 'meta')
+        assert event_two.result() == ('object 7AB', 'meta')
+        assert performance.result() == ('object 6IF-B1H', 'meta')
+
+    def test_batch_not_sent_on_error(self):
+        client = Mock()
+
+        with pytest.raises(ValueError):
+            with Batch(client) as batch:
+                batch.get_event('6IF')
+                raise ValueError()
+
+        client.get_events.assert_not_called()
@@ -0,0 +1,117 @@
+from pyticketswitch import cache
+from pyticketswitch.cache import TTLCache
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMakeKey:
+
+    def test_make_key(self):
+        key = cache.make_key(
+            'events.v1', {'page_no': 2, 'keywords': 'cats'},
+            sub_user='fred', language='en-gb', use_decimal=True)
+
+        assert key == (
+            'events.v1',
+            (('keywords', u'cats'), ('page_no', u'2')),
+            'fred', 'en-gb', True,
+        )
+
+    def test_make_key_normalises_params(self):
+        key_one = cache.make_key('events.v1', {
+            'page_no': 2, 'keywords': 'cats', 'city_code': None,
+            'tsw_session_track_id': 'abc',
+        })
+        key_two = cache.make_key('events.v1', {
+            'keywords': 'cats', 'page_no': '2',
+            'tsw_session_track_id': 'xyz',
+        })
+        assert key_one == key_two
+
+    def test_make_key_varies_with_client_settings(self):
+        params = {'event_id': '6IF'}
+        keys = set([
+            cache.make_key('months.v1', params),
+            cache.make_key('months.v1', params, sub_user='fred'),
+            cache.make_key('months.v1', params, language='de'),
+            cache.make_key('months.v1', params, use_decimal=True),
+        ])
+        assert len(keys) == 4
+
+
+class TestTTLCache:
+
+    def test_get_and_set(self):
+        ttl_cache = TTLCache()
+        key = cache.make_key('events.v1', {})
+
+        assert ttl_cache.get(key) is None
+        ttl_cache.set(key, {'results': {}})
+        assert ttl_cache.get(key) == {'results': {}}
+
+        stats = ttl_cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.currsize == 1
+
+    def test_expiry_per_endpoint(self):
+        clock = FakeClock()
+        ttl_cache = TTLCache(ttls={'events.v1': 30}, clock=clock)
+        events_key = cache.make_key('events.v1', {})
+        availability_key = cache.make_key('availability.v1', {})
+        ttl_cache.set(events_key, 'events')
+        ttl_cache.set(availability_key, 'availability')
+
+        clock.now += 15
+        assert ttl_cache.get(events_key) == 'events'
+        assert ttl_cache.get(availability_key) is None
+        assert ttl_cache.get_stale(availability_key) == 'availability'
+
+        clock.now += 15
+        assert ttl_cache.get(events_key) is None
+
+    def test_lru_eviction(self):
+        ttl_cache = TTLCache(maxsize=2)
+        key_one, key_two, key_three = [
+            cache.make_key('events.v1', {'page_no': page})
+            for page in range(3)
+        ]
+        ttl_cache.set(key_one, 1)
+        ttl_cache.set(key_two, 2)
+        ttl_cache.get(key_one)
+        ttl_cache.set(key_three, 3)
+
+        assert ttl_cache.get(key_two) is None
+        assert ttl_cache.get(key_one) == 1
+        assert ttl_cache.get(key_three) == 3
+        assert ttl_cache.stats().evictions == 1
+
+    def test_is_cacheable(self):
+        ttl_cache = TTLCache(ttls={'months.v1': 0})
+
+        assert ttl_cache.is_cacheable('events_by_id.v1') is True
+        assert ttl_cache.is_cacheable('months.v1') is False
+        assert ttl_cache.is_cacheable('trolley.v1') is False
+
+    def test_set_uncacheable_endpoint(self):
+        ttl_cache = TTLCache()
+        key = cache.make_key('trolley.v1', {})
+        ttl_cache.set(key, 'trolley')
+        assert len(ttl_cache) == 0
+
+    def test_get_stale_missing(self):
+        ttl_cache = TTLCache()
+        assert ttl_cache.get_stale(cache.make_key('events.v1', {})) is None
+
+    def test_clear(self):
+        ttl_cache = TTLCache()
+        ttl_cache.set(cache.make_key('events.v1', {}), 'events')
+        ttl_cache.clear()
+        assert len(ttl_cache) == 0
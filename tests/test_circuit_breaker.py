@@ -0,0 +1,173 @@
+import pytest
+import requests
+
+from pyticketswitch import circuit_breaker, endpoints, exceptions
+from pyticketswitch.circuit_breaker import CircuitBreaker
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    breaker = CircuitBreaker(
+        failure_threshold=2, recovery_timeout=10, clock=clock)
+    breaker.learn('6IF', 'ext_test0')
+    return breaker
+
+
+class TestGetEventId:
+
+    @pytest.mark.parametrize('call,expected', [
+        (endpoints.get_availability('6IF-B1H'), '6IF'),
+        (endpoints.get_send_methods('6IF-B1H'), '6IF'),
+        (endpoints.get_months('6IF'), '6IF'),
+        (endpoints.list_performances('6IF'), '6IF'),
+        (endpoints.list_events(), None),
+        (endpoints.get_events(['6IF']), None),
+    ])
+    def test_get_event_id(self, call, expected):
+        assert circuit_breaker.get_event_id(call) == expected
+
+
+class TestCircuitBreaker:
+
+    def test_get_source_code(self, breaker):
+        assert breaker.get_source_code(
+            endpoints.get_availability('6IF-B1H')) == 'ext_test0'
+        assert breaker.get_source_code(
+            endpoints.get_availability('7AB-B1H')) is None
+
+    def test_record_response_learns_source_code(self):
+        breaker = CircuitBreaker()
+        call = endpoints.get_availability('7AB-B1H')
+        breaker.record_response(call, {'source_code': 'ext_test1'})
+
+        assert breaker.get_source_code(
+            endpoints.get_discounts('7AB-C2D', 'CIRCLE', 'A')) == 'ext_test1'
+
+    @pytest.mark.parametrize('flag', circuit_breaker.BACKEND_FLAGS)
+    def test_record_response_trips_on_backend_flags(self, breaker, flag):
+        call = endpoints.get_availability('6IF-B1H')
+        breaker.record_response(call, {'source_code': 'ext_test0', flag: True})
+
+        assert breaker.get_state('ext_test0') == circuit_breaker.OPEN
+        with pytest.raises(exceptions.CircuitOpenError) as info:
+            breaker.before_call('ext_test0')
+        assert info.value.source_code == 'ext_test0'
+        assert isinstance(info.value, exceptions.BackendDownError)
+        assert breaker.rejected == 1
+
+    def test_record_response_learns_event_sources(self):
+        breaker = CircuitBreaker()
+        breaker.record_response(endpoints.list_events(), {
+            'results': {'event': [
+                {'event_id': '6IF', 'source_code': 'ext_test0'},
+                {'event_id': '7AB'},
+            ]},
+        })
+        breaker.record_response(endpoints.get_events(['8CD']), {
+            'events_by_id': {
+                '8CD': {
+                    'event': {'event_id': '8CD', 'source_code': 'ext_test1'},
+                },
+            },
+        })
+
+        assert breaker.get_source_code(
+            endpoints.get_availability('6IF-B1H')) == 'ext_test0'
+        assert breaker.get_source_code(
+            endpoints.get_availability('7AB-B1H')) is None
+        assert breaker.get_source_code(
+            endpoints.get_months('8CD')) == 'ext_test1'
+
+    def test_before_call_unknown_backend(self, breaker):
+        breaker.before_call(None)
+        breaker.before_call('ext_test9')
+
+    def test_record_error_opens_after_threshold(self, breaker):
+        call = endpoints.get_availability('6IF-B1H')
+        error = requests.exceptions.Timeout()
+        transient = (requests.exceptions.Timeout,)
+
+        breaker.record_error(call, error, transient)
+        assert breaker.get_state('ext_test0') == circuit_breaker.CLOSED
+        breaker.record_error(call, error, transient)
+        assert breaker.get_state('ext_test0') == circuit_breaker.OPEN
+
+    def test_record_error_ignores_client_errors(self, breaker):
+        call = endpoints.get_availability('6IF-B1H')
+
+        for _ in range(3):
+            breaker.record_error(call, exceptions.APIError('bad perf', 5))
+            breaker.record_error(
+                call, exceptions.InvalidResponseError('bad', status_code=404))
+
+        assert breaker.get_state('ext_test0') == circuit_breaker.CLOSED
+
+    def test_record_error_leaves_open_circuit(self, breaker, clock):
+        call = endpoints.get_availability('6IF-B1H')
+        breaker.trip('ext_test0')
+
+        breaker.record_error(call, exceptions.APIError('bad perf', 5))
+        assert breaker.get_state('ext_test0') == circuit_breaker.OPEN
+
+        clock.now += 10
+        breaker.before_call('ext_test0')
+        breaker.record_error(call, exceptions.APIError('bad perf', 5))
+        assert breaker.get_state('ext_test0') == circuit_breaker.HALF_OPEN
+
+        # the failed trial didn't say anything, so the next call is a trial
+        breaker.before_call('ext_test0')
+        with pytest.raises(exceptions.CircuitOpenError):
+            breaker.before_call('ext_test0')
+
+    def test_success_resets_failures(self, breaker):
+        breaker.record_failure('ext_test0')
+        breaker.record_success('ext_test0')
+        breaker.record_failure('ext_test0')
+        assert breaker.get_state('ext_test0') == circuit_breaker.CLOSED
+
+    def test_half_open_trial(self, breaker, clock):
+        breaker.trip('ext_test0')
+
+        clock.now += 10
+        breaker.before_call('ext_test0')
+        assert breaker.get_state('ext_test0') == circuit_breaker.HALF_OPEN
+        with pytest.raises(exceptions.CircuitOpenError):
+            breaker.before_call('ext_test0')
+
+        breaker.record_success('ext_test0')
+        assert breaker.get_state('ext_test0') == circuit_breaker.CLOSED
+        breaker.before_call('ext_test0')
+
+    def test_half_open_trial_fails(self, breaker, clock):
+        breaker.trip('ext_test0')
+        clock.now += 10
+        breaker.before_call('ext_test0')
+
+        breaker.record_failure('ext_test0')
+
+        assert breaker.get_state('ext_test0') == circuit_breaker.OPEN
+        with pytest.raises(exceptions.CircuitOpenError):
+            breaker.before_call('ext_test0')
+
+    def test_half_open_trial_never_reports_back(self, breaker, clock):
+        breaker.trip('ext_test0')
+        clock.now += 10
+        breaker.before_call('ext_test0')
+
+        clock.now += 10
+        breaker.before_call('ext_test0')
+        assert breaker.get_state('ext_test0') == circuit_breaker.HALF_OPEN
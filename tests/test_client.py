@@ -1,11 +1,19 @@
+import copy
 import decimal
 import pytest
 import json
 import requests
+import threading
 from datetime import datetime
 from mock import Mock
 import pyticketswitch
-from pyticketswitch.client import Client, POST, GET
+from pyticketswitch.client import Client, POST
+from pyticketswitch.cache import TTLCache
+from pyticketswitch.circuit_breaker import CircuitBreaker
+from pyticketswitch.concurrency import ConcurrencyLimiter
+from pyticketswitch.hedging import HedgePolicy
+from pyticketswitch.rate_limit import RateLimiter
+from pyticketswitch.retry import RetryPolicy
 from pyticketswitch import exceptions
 from pyticketswitch.trolley import Trolley
 from pyticketswitch.reservation import Reservation
@@ -84,7 +92,19 @@ class FakeResponse(object):
 
     @property
     def content(self):
-        return json.dumps(self._json)
+        return json.dumps(self._json).encode('utf-8')
+
+
+class FakeStreamingResponse(FakeResponse):
+
+    def __init__(self, status_code=200, json=None):
+        super(FakeStreamingResponse, self).__init__(status_code, json)
+        self.close = Mock()
+
+    def iter_content(self, chunk_size=1):
+        content = self.content
+        for start in range(0, len(content), 16):
+            yield content[start:start + 16]
 
 
 class FakeResponseRaisesValueError(FakeResponse):
@@ -92,6 +112,10 @@ class FakeResponseRaisesValueError(FakeResponse):
     def json(self, **kwargs):
         raise ValueError("ERROR")
 
+    @property
+    def content(self):
+        return b'{"data": '
+
 
 class TestClient:
 
@@ -337,6 +361,412 @@ class TestClient:
         with pytest.raises(exceptions.InvalidResponseError):
             client.make_request('test.v1', {})
 
+    def test_execute_with_cache(self, client, monkeypatch):
+        client.cache = TTLCache()
+        response = {'results': {'event': [{'event_id': 'ABC123'}]}}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events_one, _ = client.list_events(keywords=['cats'])
+        events_two, _ = client.list_events(
+            keywords=['cats'], tracking_id='abc123')
+
+        mock_make_request.assert_called_once_with(
+            'events.v1', {'keywords': 'cats'})
+        assert events_one[0].id == events_two[0].id == 'ABC123'
+        assert events_one[0] is not events_two[0]
+        assert client.cache.stats().hits == 1
+
+        client.list_events(keywords=['dogs'])
+        assert mock_make_request.call_count == 2
+
+    def test_execute_with_cache_does_not_change_response(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', lazy_models=True)
+        client.cache = TTLCache()
+        response = {'results': {'event': [{
+            'event_id': 'ABC123',
+            'cost_range': {
+                'min_seatprice': 20,
+                'no_singles_cost_range': {'min_seatprice': 25},
+            },
+        }]}}
+        original = copy.deepcopy(response)
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events_one, _ = client.list_events()
+        events_one[0].as_dict_for_json()
+        events_two, _ = client.list_events()
+
+        assert client.cache.stats().hits == 1
+        assert response == original
+        assert events_two[0].cost_range.min_seatprice == 20
+        assert events_two[0].no_singles_cost_range.min_seatprice == 25
+        assert (events_one[0].as_dict_for_json()
+                == events_two[0].as_dict_for_json())
+
+    def test_execute_with_cache_keys_on_sub_user(self, client, monkeypatch):
+        client.cache = TTLCache()
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_months('6IF')
+        client.sub_user = 'fred'
+        client.get_months('6IF')
+
+        assert mock_make_request.call_count == 2
+
+    def test_execute_with_cache_ignores_uncacheable(self, client, monkeypatch):
+        client.cache = TTLCache()
+        mock_make_request = Mock(return_value={})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.make_reservation(token='ABC123')
+        client.make_reservation(token='ABC123')
+        client.get_trolley(token='ABC123')
+        client.get_trolley(token='ABC123')
+
+        assert mock_make_request.call_count == 4
+        assert len(client.cache) == 0
+
+    def test_execute_with_coalescing(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', coalesce=True)
+        release = threading.Event()
+        calls = []
+
+        def fake_make_request(endpoint, params):
+            calls.append(params)
+            release.wait()
+            return {'events_by_id': {'6IF': {'event': {'event_id': '6IF'}}}}
+
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        events = []
+        threads = [
+            threading.Thread(
+                target=lambda: events.append(client.get_event('6IF')[0]))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while client.single_flight.shared < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [{'event_id_list': '6IF'}]
+        assert [event.id for event in events] == ['6IF'] * 3
+        assert events[0] is not events[1]
+
+    def test_execute_with_coalescing_ignores_writes(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', coalesce=True)
+        mock_make_request = Mock(return_value={})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.make_reservation(token='ABC123')
+
+        mock_make_request.assert_called_once_with(
+            'reserve.v1', {'trolley_token': 'ABC123'}, method=POST)
+        assert client.single_flight.calls == 0
+
+    def test_execute_with_retry(self, client, monkeypatch):
+        client.retry = RetryPolicy(backoff=0)
+        mock_make_request = Mock(side_effect=[
+            requests.exceptions.ConnectionError('reset'),
+            exceptions.InvalidResponseError('bad gateway', status_code=502),
+            {'results': {'event': [{'event_id': '6IF'}]}},
+        ])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.list_events()
+
+        assert mock_make_request.call_count == 3
+        assert events[0].id == '6IF'
+        assert client.retry.retries == 2
+
+    def test_execute_with_retry_gives_up(self, client, monkeypatch):
+        client.retry = RetryPolicy(max_attempts=2, backoff=0)
+        mock_make_request = Mock(
+            side_effect=requests.exceptions.Timeout('timed out'))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get_months('6IF')
+
+        assert mock_make_request.call_count == 2
+
+    def test_execute_with_retry_never_retries_post(self, client, monkeypatch):
+        client.retry = RetryPolicy(backoff=0)
+        mock_make_request = Mock(
+            side_effect=requests.exceptions.ConnectionError('reset'))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.make_purchase('abc123', Customer('fred', 'bloggs', [], 'UK'))
+
+        assert mock_make_request.call_count == 1
+
+    def test_execute_with_circuit_breaker(self, client, monkeypatch):
+        client.circuit_breaker = CircuitBreaker()
+        mock_make_request = Mock(return_value={
+            'availability': {},
+            'source_code': 'ext_test0',
+            'backend_is_down': True,
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        availability, meta = client.get_availability('6IF-B1H')
+        assert meta.backend_is_down is True
+
+        with pytest.raises(exceptions.CircuitOpenError):
+            client.get_availability('6IF-C2D')
+        with pytest.raises(exceptions.BackendDownError):
+            client.get_send_methods('6IF-B1H')
+
+        assert mock_make_request.call_count == 1
+        client.get_availability('7AB-B1H')
+        assert mock_make_request.call_count == 2
+
+    def test_execute_with_circuit_breaker_serves_stale(self, client, monkeypatch):
+        clock = Mock(return_value=0)
+        client.cache = TTLCache(clock=clock)
+        client.circuit_breaker = CircuitBreaker()
+        mock_make_request = Mock(return_value={
+            'availability': {'ticket_type': [{'ticket_type_code': 'CIRCLE'}]},
+            'source_code': 'ext_test0',
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_availability('6IF-B1H')
+        client.circuit_breaker.trip('ext_test0')
+        clock.return_value = 3600
+
+        availability, meta = client.get_availability('6IF-B1H')
+
+        assert availability[0].code == 'CIRCLE'
+        assert mock_make_request.call_count == 1
+
+    def test_execute_with_circuit_breaker_counts_errors(self, client, monkeypatch):
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+        client.circuit_breaker.learn('6IF', 'ext_test0')
+        mock_make_request = Mock(
+            side_effect=requests.exceptions.ConnectionError('reset'))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.get_months('6IF')
+
+        with pytest.raises(exceptions.CircuitOpenError):
+            client.get_months('6IF')
+        assert mock_make_request.call_count == 2
+
+    def test_execute_with_rate_limiter(self, client, monkeypatch):
+        client.rate_limiter = RateLimiter(rate=1)
+        client.sub_user = 'fred'
+        mock_sleep = Mock()
+        monkeypatch.setattr('pyticketswitch.client.time.sleep', mock_sleep)
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_months('6IF')
+        mock_sleep.assert_not_called()
+
+        client.get_months('6IF')
+        assert mock_sleep.call_count == 1
+        assert 0 < mock_sleep.call_args[0][0] <= 1
+
+    def test_execute_with_rate_limiter_throttled(self, client, monkeypatch):
+        client.rate_limiter = RateLimiter(rate=10)
+        client.retry = RetryPolicy(backoff=0)
+        monkeypatch.setattr('pyticketswitch.client.time.sleep', Mock())
+        mock_make_request = Mock(side_effect=[
+            exceptions.InvalidResponseError('slow down', status_code=429),
+            {'availability': {}, 'backend_throttle_failed': True},
+        ])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_availability('6IF-B1H')
+
+        assert client.rate_limiter.get_rate('availability.v1') == 2.5
+        assert client.rate_limiter.throttled == 2
+
+    def test_execute_with_hedge(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=0.01)
+        release = threading.Event()
+        responses = [{'user_id': 'slow'}, {'user_id': 'fast'}]
+
+        def make_request(*args, **kwargs):
+            response = responses.pop(0)
+            if response['user_id'] == 'slow':
+                release.wait(5)
+            return response
+
+        monkeypatch.setattr(client, 'make_request', make_request)
+
+        try:
+            user = client.test()
+        finally:
+            release.set()
+
+        assert user.id == 'fast'
+        assert client.hedge.hedged == 1
+        assert client.hedge.wins == 1
+
+    def test_execute_with_hedge_reuses_executor(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=5)
+        mock_make_request = Mock(return_value={'availability': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_availability('6IF-B1H')
+        executor = client.get_hedge_executor()
+        client.get_availability('6IF-B1H')
+
+        assert client.get_hedge_executor() is executor
+        client.close()
+        assert client.get_hedge_executor() is not executor
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_execute_with_hedge_fast_response(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=5)
+        mock_make_request = Mock(return_value={'availability': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_availability('6IF-B1H')
+
+        assert mock_make_request.call_count == 1
+        assert client.hedge.hedged == 0
+
+    def test_execute_with_hedge_learns_delay(self, client, monkeypatch):
+        client.hedge = HedgePolicy(min_samples=1)
+        mock_make_request = Mock(return_value={'availability': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        assert client.hedge.get_delay('availability.v1') is None
+        client.get_availability('6IF-B1H')
+
+        assert client.hedge.get_delay('availability.v1') is not None
+
+    def test_execute_with_hedge_both_fail(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=0.01)
+        errors = [
+            exceptions.InvalidResponseError('first', status_code=502),
+            exceptions.InvalidResponseError('second', status_code=502),
+        ]
+        started = threading.Event()
+
+        def make_request(*args, **kwargs):
+            error = errors.pop(0)
+            if not started.is_set():
+                started.set()
+                threading.Event().wait(0.05)
+            raise error
+
+        monkeypatch.setattr(client, 'make_request', make_request)
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            client.get_availability('6IF-B1H')
+
+        assert client.hedge.hedged == 1
+        assert client.hedge.wins == 0
+
+    def test_execute_with_hedge_never_hedges_post(self, client, monkeypatch):
+        client.hedge = HedgePolicy(percentile=None, delay=0)
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.release_reservation('abc123')
+
+        assert mock_make_request.call_count == 1
+        assert client.hedge.hedged == 0
+
+    def test_execute_with_concurrency_limiter(self, client, monkeypatch):
+        client.concurrency_limiter = ConcurrencyLimiter(limit=1)
+
+        def make_request(*args, **kwargs):
+            assert client.concurrency_limiter.stats().active == 1
+            return {'results': {}}
+
+        monkeypatch.setattr(client, 'make_request', make_request)
+
+        client.get_months('6IF')
+        client.get_months('7AB')
+
+        stats = client.concurrency_limiter.stats()
+        assert stats.active == 0
+        assert stats.acquired == 2
+
+    def test_execute_with_concurrency_limiter_deadline(self, client,
+                                                       monkeypatch):
+        client.concurrency_limiter = ConcurrencyLimiter(limit=1)
+        client.concurrency_limiter.acquire('months.v1')
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            with client.deadline(0.01):
+                client.get_months('6IF')
+
+        mock_make_request.assert_not_called()
+
+    def test_execute_with_timeout(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', timeout=15)
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_months('6IF')
+        client.release_reservation('abc123')
+
+        mock_make_request.assert_any_call(
+            'months.v1', {'event_id': '6IF'}, timeout=15)
+        mock_make_request.assert_any_call(
+            'release.v1', {'transaction_uuid': 'abc123'}, method=POST,
+            timeout=15)
+
+    def test_execute_with_deadline(self, client, monkeypatch):
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with client.deadline(10):
+            client.get_months('6IF')
+
+        timeout = mock_make_request.call_args[1]['timeout']
+        assert 0 < timeout <= 10
+
+    def test_execute_with_deadline_exceeded(self, client, monkeypatch):
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            with client.deadline(0):
+                client.get_months('6IF')
+
+        mock_make_request.assert_not_called()
+
+    def test_execute_with_deadline_stops_retries(self, client, monkeypatch):
+        client.retry = RetryPolicy(backoff=30, max_backoff=30, jitter=False)
+        mock_make_request = Mock(
+            side_effect=requests.exceptions.ConnectionError('reset'))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            with client.deadline(10):
+                client.get_months('6IF')
+
+        assert mock_make_request.call_count == 1
+
+    def test_execute_with_deadline_in_worker_threads(self, client, monkeypatch):
+        mock_make_request = Mock(return_value={'availability': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with client.deadline(10):
+            client.get_availability_many(['6IF-B1H', '6IF-C2D'])
+
+        for call in mock_make_request.call_args_list:
+            assert 0 < call[1]['timeout'] <= 10
+
     def test_add_optional_kwargs_extra_info(self, client):
         params = {}
         client.add_optional_kwargs(params, extra_info=True)
@@ -484,6 +914,81 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+    def test_list_events_with_overridden_hooks(self, monkeypatch):
+
+        class CustomClient(Client):
+
+            def add_optional_kwargs(self, params, **kwargs):
+                params.update(channel='web')
+                super(CustomClient, self).add_optional_kwargs(params, **kwargs)
+
+            def get_tracking_params(self, custom_tracking_id=None):
+                return {'my_track_id': custom_tracking_id}
+
+        client = CustomClient(user='bilbo', password='baggins')
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.list_events(extra_info=True, tracking_id='abc123')
+
+        mock_make_request.assert_called_with('events.v1', {
+            'channel': 'web',
+            'req_extra_info': True,
+            'my_track_id': 'abc123',
+        })
+
+    def test_list_events_lazy_models(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', lazy_models=True)
+        response = {
+            'results': {
+                'event': [{
+                    'event_id': 'ABC123',
+                    'cost_range': {'min_seatprice': 18},
+                }],
+            },
+        }
+        monkeypatch.setattr(
+            client, 'make_request', Mock(return_value=response))
+
+        events, meta = client.list_events()
+
+        assert events[0].id == 'ABC123'
+        assert events[0].is_deferred('cost_range')
+        assert events[0].cost_range.min_seatprice == 18
+
+    def test_get_events_keep_raw(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', keep_raw='compact')
+        response = {
+            'events_by_id': {
+                'ABC123': {'event': {'event_id': 'ABC123'}},
+            },
+        }
+        monkeypatch.setattr(
+            client, 'make_request', Mock(return_value=response))
+
+        events, meta = client.get_events(['ABC123'])
+
+        assert events['ABC123'].raw == {'event_id': 'ABC123'}
+        assert events['ABC123'].raw is not events['ABC123'].raw
+
+    def test_keep_raw_invalid(self):
+        with pytest.raises(ValueError):
+            Client(user='bilbo', password='baggins', keep_raw='weak')
+
+    def test_get_performances_lazy_models(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', lazy_models=True)
+        response = {
+            'performances_by_id': {
+                'ABC123-1': {'perf_id': 'ABC123-1', 'event_id': 'ABC123'},
+            },
+        }
+        monkeypatch.setattr(
+            client, 'make_request', Mock(return_value=response))
+
+        performances, meta = client.get_performances(['ABC123-1'])
+
+        assert performances['ABC123-1'].is_deferred('availability_details')
+
     def test_list_events_with_keywords(self, client, mock_make_request):
         client.list_events(keywords=['awesome', 'stuff'])
 
@@ -672,6 +1177,70 @@ class TestClient:
             'event_id_list': 'ABC123', 'add_add_ons': True,
         })
 
+    def test_stream_events(self, client, monkeypatch):
+        response = FakeStreamingResponse(json={
+            'results': {
+                'event': [
+                    {'event_id': 'ABC1', 'event_desc': 'Thing one'},
+                    {'event_id': 'DEF2', 'event_desc': 'Thing two'},
+                ],
+                'paging_status': {
+                    'page_length': 2,
+                    'page_number': 0,
+                    'pages_remaining': 3,
+                    'results_remaining': 6,
+                    'total_unpaged_results': 8,
+                },
+            },
+        })
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        stream = client.stream_events(keywords=['thing'], page_length=2)
+        events = list(stream)
+
+        assert [event.id for event in events] == ['ABC1', 'DEF2']
+        assert events[1].description == 'Thing two'
+        assert stream.meta.total_results == 8
+        assert session.get.call_args[1]['stream'] is True
+        assert session.get.call_args[1]['params']['keywords'] == 'thing'
+        response.close.assert_called_once_with()
+        session.close.assert_called_once_with()
+
+    def test_stream_events_error(self, client, monkeypatch):
+        response = FakeStreamingResponse(status_code=400, json={
+            'error_code': 8,
+            'error_desc': 'price_band_code needs /pool or /alloc suffix',
+        })
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        with pytest.raises(exceptions.APIError):
+            list(client.stream_events())
+
+        response.close.assert_called_once_with()
+
+    def test_stream_events_by_id(self, client, monkeypatch):
+        response = FakeStreamingResponse(json={
+            'events_by_id': {
+                'ABC1': {'event': {'event_id': 'ABC1'}},
+                'DEF2': {'event': {'event_id': 'DEF2'}},
+                'GHI3': {},
+            },
+        })
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        stream = client.stream_events_by_id(['ABC1', 'DEF2', 'GHI3'])
+
+        assert sorted(event.id for event in stream) == ['ABC1', 'DEF2']
+        assert session.get.call_args[1]['params']['event_id_list'] == \
+            'ABC1,DEF2,GHI3'
+        assert stream.meta is not None
+
     def test_get_event(self, client, monkeypatch):
         response = {
             'events_by_id': {
@@ -700,6 +1269,71 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+    def test_batch(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in params['event_id_list'].split(',')
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with client.batch() as batch:
+            lookups = [batch.get_event(event_id) for event_id in ['6IF', '7AB']]
+
+        mock_make_request.assert_called_once_with(
+            'events_by_id.v1', {'event_id_list': '6IF,7AB'})
+        event, meta = lookups[1].result()
+        assert event.id == '7AB'
+
+    def test_get_event_with_batch_window(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', batch_window=0.05)
+
+        def fake_make_request(endpoint, params):
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in params['event_id_list'].split(',')
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = {}
+
+        def get_event(event_id):
+            events[event_id], _ = client.get_event(event_id)
+
+        threads = [
+            threading.Thread(target=get_event, args=(event_id,))
+            for event_id in ['6IF', '7AB']
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_make_request.call_count == 1
+        assert events['6IF'].id == '6IF'
+        assert events['7AB'].id == '7AB'
+
+    def test_get_performance_with_batch_window(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', batch_window=0)
+        mock_make_request = Mock(return_value={
+            'performances_by_id': {'6IF-B1H': {'perf_id': '6IF-B1H'}},
+        })
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performance, meta = client.get_performance('6IF-B1H')
+
+        mock_make_request.assert_called_once_with(
+            'performances_by_id.v1', {'perf_id_list': '6IF-B1H'})
+        assert performance.id == '6IF-B1H'
+
     def test_get_months(self, client, monkeypatch):
         response = {
             'results': {
@@ -1145,6 +1779,234 @@ class TestClient:
         with pytest.raises(exceptions.InvalidResponseError):
             _, _ = client.get_availability('ABC123-1')
 
+    def test_iter_events(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            page = params.get('page_no', 1)
+            return {
+                'results': {
+                    'event': [
+                        {'event_id': '{}-{}'.format(page, i)} for i in range(2)
+                    ],
+                    'paging_status': {
+                        'page_length': 2,
+                        'page_number': page,
+                        'pages_remaining': 3 - page,
+                        'total_unpaged_results': 6,
+                    },
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = client.iter_events(page_length=2, city_code='london-uk')
+
+        assert mock_make_request.call_count == 0
+        assert [event.id for event in events] == [
+            '1-0', '1-1', '2-0', '2-1', '3-0', '3-1',
+        ]
+        assert mock_make_request.call_count == 3
+        mock_make_request.assert_any_call('events.v1', {
+            'city_code': 'london-uk', 'page_len': 2})
+        mock_make_request.assert_any_call('events.v1', {
+            'city_code': 'london-uk', 'page_no': 3, 'page_len': 2})
+
+    def test_iter_events_keeps_deadline(self, client, monkeypatch):
+        mock_make_request = Mock(return_value={'results': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with client.deadline(0):
+            events = client.iter_events()
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            list(events)
+        assert mock_make_request.call_count == 0
+
+    def test_iter_events_concurrently(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            page = params.get('page_no', 1)
+            return {
+                'results': {
+                    'event': [{'event_id': str(page)}],
+                    'paging_status': {
+                        'page_number': page,
+                        'pages_remaining': 4 - page,
+                    },
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = client.iter_events(concurrent=True, max_workers=2)
+
+        assert [event.id for event in events] == ['1', '2', '3', '4']
+        assert mock_make_request.call_count == 4
+
+    def test_iter_events_not_paginated(self, client, monkeypatch):
+        response = {'results': {'event': [{'event_id': 'ABC123'}]}}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = list(client.iter_events(prefetch=0))
+
+        assert [event.id for event in events] == ['ABC123']
+        mock_make_request.assert_called_once_with('events.v1', {'page_len': 50})
+
+    def test_iter_events_stopped_early(self, client, monkeypatch):
+        response = {
+            'results': {
+                'event': [{'event_id': 'ABC123'}, {'event_id': 'DEF456'}],
+                'paging_status': {'page_number': 1, 'pages_remaining': 10},
+            },
+        }
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = client.iter_events()
+        assert next(events).id == 'ABC123'
+        events.close()
+
+        assert mock_make_request.call_count <= 2
+
+    def test_iter_performances(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            page = params.get('page_no', 1)
+            return {
+                'results': {
+                    'performance': [{'perf_id': '6IF-{}'.format(page)}],
+                    'paging_status': {
+                        'page_number': page,
+                        'pages_remaining': 2 - page,
+                    },
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances = client.iter_performances('6IF', prefetch=0)
+
+        assert [perf.id for perf in performances] == ['6IF-1', '6IF-2']
+        mock_make_request.assert_called_with('performances.v1', {
+            'event_id': '6IF', 'page_no': 2, 'page_len': 50})
+
+    def test_get_events_in_chunks(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            event_ids = params['event_id_list'].split(',')
+            currency = 'gbp' if 'ABC1' in event_ids else 'usd'
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in event_ids
+                },
+                'currency_code': currency,
+                'currency_details': {
+                    currency: {'currency_code': currency},
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(
+            ['ABC1', 'DEF2', 'GHI3', 'ABC1', 'JKL4', 'MNO5'],
+            chunk_size=2, with_addons=True,
+        )
+
+        assert mock_make_request.call_count == 3
+        mock_make_request.assert_any_call('events_by_id.v1', {
+            'event_id_list': 'GHI3,JKL4', 'add_add_ons': True})
+        assert sorted(events) == ['ABC1', 'DEF2', 'GHI3', 'JKL4', 'MNO5']
+        assert meta.default_currency_code == 'gbp'
+        assert sorted(meta.currencies) == ['gbp', 'usd']
+
+    def test_get_events_chunk_size_from_client(self, client, monkeypatch):
+        client.id_chunk_size = 1
+        mock_make_request = Mock(return_value={'events_by_id': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_events(['ABC1', 'DEF2'])
+
+        assert mock_make_request.call_count == 2
+
+    def test_get_events_with_chunking_disabled(self, client, monkeypatch):
+        client.id_chunk_size = None
+        mock_make_request = Mock(return_value={'events_by_id': {}})
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_events(['ABC1', 'DEF2'])
+
+        mock_make_request.assert_called_once_with(
+            'events_by_id.v1', {'event_id_list': 'ABC1,DEF2'})
+
+    def test_get_events_in_chunks_with_error(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            if params['event_id_list'] == 'DEF2':
+                raise exceptions.APIError('event not found', 5)
+            return {'events_by_id': {}}
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.APIError):
+            client.get_events(['ABC1', 'DEF2'], chunk_size=1)
+
+    def test_get_performances_in_chunks(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            return {
+                'performances_by_id': {
+                    perf_id: {'perf_id': perf_id}
+                    for perf_id in params['perf_id_list'].split(',')
+                },
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances, meta = client.get_performances(
+            ['6IF-A8B', '6IF-A8C', '6IF-A8D'], chunk_size=2, max_workers=1)
+
+        assert mock_make_request.call_count == 2
+        mock_make_request.assert_any_call(
+            'performances_by_id.v1', {'perf_id_list': '6IF-A8D'})
+        assert sorted(performances) == ['6IF-A8B', '6IF-A8C', '6IF-A8D']
+
+    def test_get_availability_many(self, client, monkeypatch):
+        def fake_make_request(endpoint, params):
+            if params['perf_id'] == 'BAD-1':
+                raise exceptions.APIError('perf not found', 5)
+            return {
+                'availability': {
+                    'ticket_type': [{'ticket_type_code': params['perf_id']}],
+                },
+                'no_of_seats': params.get('no_of_seats'),
+            }
+
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        results, errors = client.get_availability_many(
+            ['6IF-A8B', 'BAD-1', '6IF-A8C', '6IF-A8B'],
+            max_workers=2, number_of_seats=2,
+        )
+
+        assert mock_make_request.call_count == 3
+        assert sorted(results) == ['6IF-A8B', '6IF-A8C']
+        availability, meta = results['6IF-A8C']
+        assert availability[0].code == '6IF-A8C'
+        assert list(errors) == ['BAD-1']
+        assert isinstance(errors['BAD-1'], exceptions.APIError)
+        mock_make_request.assert_any_call(
+            'availability.v1', {'perf_id': '6IF-A8C', 'no_of_seats': 2})
+
+    def test_get_availability_many_with_no_performances(self, client, mock_make_request):
+        results, errors = client.get_availability_many([])
+
+        assert results == {}
+        assert errors == {}
+        mock_make_request.assert_not_called()
+
     def test_get_send_methods(self, client, monkeypatch):
         response = {
             'currency_code': 'gbp',
@@ -1320,6 +2182,51 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+    def test_get_trolley_without_raw(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', keep_raw=False)
+        response = {
+            'trolley_contents': {
+                'bundle': [{
+                    'order': [{'event': {'event_id': 'ABC123'}}],
+                }],
+            },
+            'trolley_token': 'DEF456',
+        }
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        trolley, meta = client.get_trolley()
+
+        event = trolley.get_events()[0]
+        assert event.id == 'ABC123'
+        assert event.raw is None
+
+    def test_get_trolley_with_overridden_hooks(self, monkeypatch):
+
+        class CustomClient(Client):
+
+            def add_optional_kwargs(self, params, **kwargs):
+                params.update(channel='web')
+                super(CustomClient, self).add_optional_kwargs(params, **kwargs)
+
+            def _trolley_params(self, **kwargs):
+                params = super(CustomClient, self)._trolley_params(**kwargs)
+                params.update(basket='main')
+                return params
+
+        client = CustomClient(user='bilbo', password='baggins')
+        response = {'trolley_contents': {}, 'trolley_token': 'DEF456'}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        client.get_trolley(token='ABC123')
+
+        mock_make_request.assert_called_with('trolley.v1', {
+            'trolley_token': 'ABC123',
+            'channel': 'web',
+            'basket': 'main',
+        })
+
     def test_get_trolley_with_unavailable_order(self, client, monkeypatch):
         """
         This test is to check that an unavailable order doesn't raise
@@ -1437,6 +2344,31 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+    def test_reservation_and_purchase_with_overridden_hooks(self, monkeypatch):
+
+        class CustomClient(Client):
+
+            def process_reservation_response(self, response,
+                                             raise_on_unavailable_order):
+                return 'reservation', raise_on_unavailable_order
+
+            def process_purchase_response(self, response):
+                return 'purchase', response
+
+        client = CustomClient(user='bilbo', password='baggins')
+        monkeypatch.setattr(
+            client, 'make_request', Mock(return_value={'foo': 'bar'}))
+        customer = Customer('fred', 'flintstone', ['301 cobblestone way'], 'us')
+
+        assert client.make_reservation(raise_on_unavailable_order=True) == (
+            'reservation', True)
+        assert client.get_reservation('abc123') == ('reservation', False)
+        assert client.make_purchase('abc123', customer) == (
+            'purchase', {'foo': 'bar'})
+        assert client.get_purchase('abc123') == ('purchase', {'foo': 'bar'})
+        assert client.next_callout('abc', 'def', {}) == (
+            'purchase', {'foo': 'bar'})
+
     def test_get_reservation(self, client, monkeypatch):
         transaction_uuid = 'DEF456'
         response = {
@@ -1458,7 +2390,7 @@ class TestClient:
 
         mock_make_request.assert_called_with('reserve_page_archive.v1', {
             "transaction_uuid": transaction_uuid
-        }, method=GET)
+        })
 
         assert isinstance(reservation, Reservation)
         assert reservation.trolley.transaction_uuid == transaction_uuid
@@ -1886,7 +2818,6 @@ class TestClient:
         mock_make_request.assert_called_with(
             'purchase_page_archive.v1',
             expected_params,
-            method=GET
         )
 
         assert callout is None
@@ -2122,6 +3053,21 @@ class TestClient:
         assert type(result['amount']) == decimal.Decimal
         assert result['amount'] == decimal.Decimal('1.0')
 
+    def test_make_request_decodes_content(self, client, monkeypatch):
+        fake_response = requests.models.Response()
+        fake_response._content = u'{"name": "Caf\u00e9 \u2615"}'.encode('utf-8')
+        fake_response.status_code = 200
+        fake_response.json = Mock()
+
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        result = client.make_request('test.v1', {})
+
+        assert result == {'name': u'Caf\u00e9 \u2615'}
+        fake_response.json.assert_not_called()
+
     def test_make_request_using_float_parsing(self, monkeypatch):
         # state
         client = Client('bilbo', 'baggins')
@@ -2145,6 +3091,74 @@ class TestClient:
         assert type(result['amount']) == float
         assert result['amount'] == 1.0
 
+    def test_get_session_creates_new_session_per_call(self, client):
+        first = client.get_session()
+        second = client.get_session()
+        assert first is not second
+
+    def test_cleanup_session_closes_session(self, client):
+        session = Mock(spec=requests.Session)
+        client.cleanup_session(session)
+        session.close.assert_called_once_with()
+
+    def test_get_session_with_keep_alive(self):
+        client = Client('bilbo', 'baggins', keep_alive=True,
+                        pool_connections=2, pool_maxsize=20)
+
+        session = client.get_session()
+
+        assert client.get_session() is session
+        adapter = session.get_adapter('https://api.ticketswitch.com')
+        assert adapter is client.get_adapter()
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 20
+
+    def test_get_session_with_keep_alive_shares_pool_across_threads(self):
+        client = Client('bilbo', 'baggins', keep_alive=True)
+        sessions = []
+
+        def target():
+            sessions.append(client.get_session())
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+        session = client.get_session()
+        assert sessions[0] is not session
+        assert (
+            sessions[0].get_adapter('https://api.ticketswitch.com') is
+            session.get_adapter('https://api.ticketswitch.com')
+        )
+
+    def test_cleanup_session_with_keep_alive(self):
+        client = Client('bilbo', 'baggins', keep_alive=True)
+        session = Mock(spec=requests.Session)
+        client.cleanup_session(session)
+        session.close.assert_not_called()
+
+    def test_close_with_keep_alive(self):
+        client = Client('bilbo', 'baggins', keep_alive=True)
+        session = client.get_session()
+        adapter = client.get_adapter()
+
+        client.close()
+
+        assert client.get_adapter() is not adapter
+        new_session = client.get_session()
+        assert new_session is not session
+        assert new_session.get_adapter(client.url) is client.get_adapter()
+
+    def test_client_as_context_manager(self, monkeypatch):
+        client = Client('bilbo', 'baggins', keep_alive=True)
+        mock_close = Mock()
+        monkeypatch.setattr(client, 'close', mock_close)
+
+        with client as entered:
+            assert entered is client
+
+        mock_close.assert_called_once_with()
+
     def test_make_purchase_with_agent_reference(self, client, monkeypatch):
         # state
         response = {
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+from mock import Mock
+
+from pyticketswitch import exceptions
+from pyticketswitch.coalescing import SingleFlight
+from pyticketswitch.deadline import Deadline
+
+
+def wait_for_waiters(single_flight, count):
+    # spin until the other threads have joined the call in progress
+    while single_flight.shared < count:
+        threading.Event().wait(0.001)
+
+
+class TestSingleFlight:
+
+    def test_do(self):
+        single_flight = SingleFlight()
+        assert single_flight.do('key', lambda: 'result') == 'result'
+        assert single_flight.calls == 1
+        assert len(single_flight) == 0
+
+    def test_do_shares_call_in_progress(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        results = []
+        calls = []
+
+        def func():
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(single_flight.do('key', func)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        while not calls:
+            threading.Event().wait(0.001)
+        for thread in threads[1:]:
+            thread.start()
+
+        wait_for_waiters(single_flight, 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['result'] * 5
+        assert len(calls) == 1
+        assert single_flight.calls == 1
+        assert single_flight.shared == 4
+
+    def test_do_shares_errors(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def func():
+            release.wait()
+            raise ValueError('boom')
+
+        def target():
+            try:
+                single_flight.do('key', func)
+            except ValueError as error:
+                errors.append(error)
+
+        leader = threading.Thread(target=target)
+        leader.start()
+        while not len(single_flight):
+            threading.Event().wait(0.001)
+        waiter = threading.Thread(target=target)
+        waiter.start()
+
+        wait_for_waiters(single_flight, 1)
+        release.set()
+        leader.join()
+        waiter.join()
+
+        assert len(errors) == 2
+        assert errors[0] is errors[1]
+
+    def test_do_after_call_finished(self):
+        single_flight = SingleFlight()
+        with pytest.raises(ValueError):
+            single_flight.do('key', Mock(side_effect=ValueError))
+
+        assert single_flight.do('key', lambda: 'result') == 'result'
+        assert single_flight.calls == 2
+        assert single_flight.shared == 0
+
+    def test_do_waiter_gives_up_at_its_deadline(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        results = []
+
+        def func():
+            release.wait()
+            return 'result'
+
+        leader = threading.Thread(
+            target=lambda: results.append(single_flight.do('key', func)))
+        leader.start()
+        while not len(single_flight):
+            threading.Event().wait(0.001)
+
+        try:
+            with Deadline(0.01):
+                with pytest.raises(exceptions.DeadlineExceededError):
+                    single_flight.do('key', func)
+        finally:
+            release.set()
+            leader.join()
+
+        assert results == ['result']
+        assert single_flight.shared == 1
@@ -0,0 +1,181 @@
+import threading
+import time
+
+import pytest
+
+from pyticketswitch import exceptions
+from pyticketswitch.concurrency import ConcurrencyLimiter
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def wait_until(condition, timeout=5):
+    stop = time.time() + timeout
+    while not condition():
+        assert time.time() < stop, 'timed out'
+        time.sleep(0.001)
+
+
+class TestConcurrencyLimiter:
+
+    def test_acquire_and_release(self, clock):
+        limiter = ConcurrencyLimiter(limit=2, clock=clock)
+
+        assert limiter.acquire('events.v1') == 0
+        assert limiter.acquire('events.v1') == 0
+        assert limiter.stats().active == 2
+
+        limiter.release('events.v1')
+        limiter.release('events.v1')
+
+        stats = limiter.stats()
+        assert stats.active == 0
+        assert stats.acquired == 2
+        assert stats.total_wait == 0
+
+    def test_slot(self):
+        limiter = ConcurrencyLimiter(limit=1)
+
+        with limiter.slot('events.v1'):
+            assert limiter.stats().active == 1
+
+        assert limiter.stats().active == 0
+
+    def test_slot_released_on_error(self):
+        limiter = ConcurrencyLimiter(limit=1)
+
+        with pytest.raises(ValueError):
+            with limiter.slot('events.v1'):
+                raise ValueError('nope')
+
+        assert limiter.stats().active == 0
+
+    def test_acquire_times_out(self):
+        limiter = ConcurrencyLimiter(limit=1)
+        limiter.acquire('events.v1')
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            limiter.acquire('events.v1', timeout=0.01)
+
+        stats = limiter.stats()
+        assert stats.rejected == 1
+        assert stats.waiting == 0
+        assert stats.active == 1
+
+    def test_acquire_max_waiting(self):
+        limiter = ConcurrencyLimiter(limit=1, max_waiting=0)
+        limiter.acquire('events.v1')
+
+        with pytest.raises(exceptions.ClientOverloadedError):
+            limiter.acquire('events.v1')
+
+        assert limiter.stats().rejected == 1
+
+    def test_waiter_gets_released_slot(self, clock):
+        limiter = ConcurrencyLimiter(limit=1, clock=clock)
+        limiter.acquire('events.v1')
+        waits = []
+
+        thread = threading.Thread(
+            target=lambda: waits.append(limiter.acquire('events.v1')))
+        thread.start()
+        wait_until(lambda: limiter.stats().waiting == 1)
+
+        clock.now += 2.5
+        limiter.release('events.v1')
+        thread.join(5)
+
+        assert waits == [2.5]
+        stats = limiter.stats()
+        assert stats.active == 1
+        assert stats.waiting == 0
+        assert stats.total_wait == 2.5
+        assert stats.max_wait == 2.5
+
+    def test_waiters_served_in_order(self):
+        limiter = ConcurrencyLimiter(limit=1)
+        limiter.acquire('events.v1')
+        order = []
+
+        def worker(number):
+            limiter.acquire('events.v1')
+            order.append(number)
+            limiter.release('events.v1')
+
+        threads = []
+        for number in range(3):
+            thread = threading.Thread(target=worker, args=(number,))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: limiter.stats().waiting == number + 1)
+
+        limiter.release('events.v1')
+        for thread in threads:
+            thread.join(5)
+
+        assert order == [0, 1, 2]
+
+    def test_endpoint_limits(self):
+        limiter = ConcurrencyLimiter(
+            limit=3, endpoint_limits={'availability.v1': 1})
+        limiter.acquire('availability.v1')
+
+        with pytest.raises(exceptions.DeadlineExceededError):
+            limiter.acquire('availability.v1', timeout=0.01)
+
+        limiter.acquire('events.v1')
+        limiter.acquire('events.v1')
+        assert limiter.stats().active == 3
+
+    def test_busy_endpoint_does_not_hold_up_others(self):
+        limiter = ConcurrencyLimiter(
+            limit=3, endpoint_limits={'availability.v1': 1})
+        limiter.acquire('availability.v1')
+
+        thread = threading.Thread(
+            target=lambda: limiter.acquire('availability.v1', timeout=5))
+        thread.start()
+        wait_until(lambda: limiter.stats().waiting == 1)
+
+        assert limiter.acquire('events.v1', timeout=1) >= 0
+
+        limiter.release('availability.v1')
+        thread.join(5)
+        assert limiter.stats().active == 2
+        assert limiter.stats().waiting == 0
+
+    def test_shared_between_threads(self):
+        limiter = ConcurrencyLimiter(limit=2)
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def worker():
+            with limiter.slot('events.v1'):
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.005)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert max(peak) <= 2
+        assert limiter.stats().acquired == 8
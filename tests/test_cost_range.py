@@ -40,6 +40,29 @@ class TestCostRange:
         assert cost_range.currency == 'usd'
         assert cost_range.valid_quantities == [1, 2, 3, 4]
 
+    def test_from_cost_range_data(self):
+        data = {
+            'cost_range': {
+                'min_seatprice': 20,
+                'no_singles_cost_range': {'min_seatprice': 25},
+            },
+        }
+
+        cost_range = CostRange.from_cost_range_data(data)
+        no_singles = CostRange.from_cost_range_data(data, singles=False)
+
+        assert cost_range.min_seatprice == 20
+        assert no_singles.min_seatprice == 25
+        assert data == {
+            'cost_range': {
+                'min_seatprice': 20,
+                'no_singles_cost_range': {'min_seatprice': 25},
+            },
+        }
+        assert CostRange.from_cost_range_data({}) is None
+        assert CostRange.from_cost_range_data(
+            {'cost_range': {'min_seatprice': 20}}, singles=False) is None
+
     def test_has_offer_with_no_offers(self):
         cost_range = CostRange()
         assert cost_range.has_offer() is False
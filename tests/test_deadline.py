@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from pyticketswitch import deadline, exceptions
+from pyticketswitch.deadline import Deadline
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestDeadline:
+
+    def test_remaining(self, clock):
+        budget = Deadline(10, clock=clock)
+        clock.now += 4
+
+        assert budget.remaining() == 6
+        assert budget.expired() is False
+        assert budget.check() == 6
+
+    def test_check_when_expired(self, clock):
+        budget = Deadline(10, clock=clock)
+        clock.now += 10
+
+        assert budget.expired() is True
+        with pytest.raises(exceptions.DeadlineExceededError):
+            budget.check()
+
+    def test_context_manager(self, clock):
+        assert deadline.get_current() is None
+
+        with Deadline(10, clock=clock) as budget:
+            assert deadline.get_current() is budget
+
+        assert deadline.get_current() is None
+
+    def test_nested_deadline_never_extends(self, clock):
+        with Deadline(5, clock=clock) as outer:
+            with Deadline(10, clock=clock) as inner:
+                assert inner.remaining() == 5
+                with Deadline(1, clock=clock) as innermost:
+                    assert innermost.remaining() == 1
+                assert deadline.get_current() is inner
+            assert deadline.get_current() is outer
+
+    def test_deadline_is_per_thread(self, clock):
+        seen = []
+        thread = threading.Thread(
+            target=lambda: seen.append(deadline.get_current()))
+
+        with Deadline(10, clock=clock):
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+
+
+class TestGetTimeout:
+
+    def test_without_deadline(self):
+        assert deadline.get_timeout() is None
+        assert deadline.get_timeout(5) == 5
+
+    def test_with_deadline(self, clock):
+        with Deadline(10, clock=clock):
+            assert deadline.get_timeout() == 10
+            assert deadline.get_timeout(5) == 5
+            assert deadline.get_timeout(15) == 10
+
+            clock.now += 10
+            with pytest.raises(exceptions.DeadlineExceededError):
+                deadline.get_timeout(5)
+
+
+class TestAllows:
+
+    def test_allows(self, clock):
+        assert deadline.allows(1000) is True
+
+        with Deadline(10, clock=clock):
+            assert deadline.allows(5) is True
+            assert deadline.allows(10) is False
+
+
+class TestUsing:
+
+    def test_using(self, clock):
+        budget = Deadline(10, clock=clock)
+
+        with deadline.using(budget):
+            assert deadline.get_current() is budget
+            with deadline.using(None):
+                assert deadline.get_current() is None
+            assert deadline.get_current() is budget
+
+        assert deadline.get_current() is None
+        assert budget.expires == 110
+
+
+class TestBind:
+
+    def test_bind(self, clock):
+        seen = []
+
+        with Deadline(10, clock=clock) as budget:
+            func = deadline.bind(lambda: seen.append(deadline.get_current()))
+
+        thread = threading.Thread(target=func)
+        thread.start()
+        thread.join()
+
+        assert seen == [budget]
+        assert deadline.get_current() is None
+
+    def test_bind_without_deadline(self):
+        func = object()
+        assert deadline.bind(func) is func
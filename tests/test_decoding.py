@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import decimal
+
+import pytest
+
+from pyticketswitch import decoding
+
+
+BODY = u'{"name": "Café", "price": 12.5, "count": 3}'.encode('utf-8')
+
+
+@pytest.fixture
+def stdlib(monkeypatch):
+    monkeypatch.setattr(decoding, 'orjson', None)
+    monkeypatch.setattr(decoding, 'ujson', None)
+
+
+class TestLoads:
+
+    def test_loads(self):
+        result = decoding.loads(BODY)
+
+        assert result == {'name': u'Café', 'price': 12.5, 'count': 3}
+        assert type(result['price']) == float
+
+    def test_loads_text(self):
+        assert decoding.loads(u'{"a": [1, 2]}') == {'a': [1, 2]}
+
+    def test_loads_decimal(self):
+        result = decoding.loads(BODY, use_decimal=True)
+
+        assert type(result['price']) == decimal.Decimal
+        assert result['price'] == decimal.Decimal('12.5')
+        assert result['count'] == 3
+
+    def test_loads_invalid(self):
+        with pytest.raises(ValueError):
+            decoding.loads(b'{"name": ')
+
+    def test_loads_invalid_utf8(self, stdlib):
+        with pytest.raises(ValueError):
+            decoding.loads(b'{"name": "\xff"}')
+
+    def test_loads_stdlib(self, stdlib):
+        result = decoding.loads(BODY)
+
+        assert result == {'name': u'Café', 'price': 12.5, 'count': 3}
+        assert type(result['price']) == float
+
+    def test_loads_decimal_ignores_fast_backend(self, monkeypatch):
+        class Broken(object):
+            def loads(self, content):
+                raise AssertionError('should not be used')
+
+        monkeypatch.setattr(decoding, 'orjson', Broken())
+        monkeypatch.setattr(decoding, 'ujson', Broken())
+
+        result = decoding.loads(BODY, use_decimal=True)
+        assert result['price'] == decimal.Decimal('12.5')
+
+
+class TestGetBackend:
+
+    def test_get_backend_stdlib(self, stdlib):
+        assert decoding.get_backend() == 'json'
+
+    def test_get_backend_ujson(self, stdlib, monkeypatch):
+        monkeypatch.setattr(decoding, 'ujson', object())
+        assert decoding.get_backend() == 'ujson'
+
+    def test_get_backend_orjson(self, monkeypatch):
+        monkeypatch.setattr(decoding, 'orjson', object())
+        assert decoding.get_backend() == 'orjson'
@@ -0,0 +1,246 @@
+import pytest
+from pyticketswitch import endpoints, exceptions
+from pyticketswitch.endpoints import APICall, GET, POST
+from pyticketswitch.event import Event
+from pyticketswitch.trolley import Trolley
+
+
+class TestAPICall:
+
+    def test_parse_without_parser(self):
+        call = APICall('test.v1', {})
+        assert call.method == GET
+        assert call.parse({'a': 'b'}) == {'a': 'b'}
+
+    def test_parse_with_parser(self):
+        call = APICall('test.v1', {}, parser=lambda response: response['a'])
+        assert call.parse({'a': 'b'}) == 'b'
+
+    def test_repr(self):
+        call = APICall('reserve.v1', {}, method=POST)
+        assert repr(call) == '<APICall post reserve.v1>'
+
+
+class TestDecodeResponse:
+
+    def test_decode_response(self):
+        contents = endpoints.decode_response('test.v1', 200, lambda: {'a': 1})
+        assert contents == {'a': 1}
+
+    def test_decode_response_with_invalid_json(self):
+        def decode():
+            raise ValueError('nope')
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            endpoints.decode_response('test.v1', 500, decode)
+
+
+class TestCheckResponse:
+
+    def test_check_response(self):
+        contents = {'a': 'b'}
+        assert endpoints.check_response('test.v1', 200, contents) is contents
+
+    def test_check_response_with_auth_error(self):
+        response = object()
+        with pytest.raises(exceptions.AuthenticationError) as info:
+            endpoints.check_response(
+                'test.v1', 401,
+                {'error_code': 3, 'error_desc': 'User authorisation failure'},
+                response,
+            )
+        assert info.value.response is response
+        assert info.value.code == 3
+
+    def test_check_response_with_gone_error(self):
+        with pytest.raises(exceptions.CallbackGoneError):
+            endpoints.check_response(
+                'callback.v1', 410,
+                {'error_code': 8, 'error_desc': 'gone'},
+            )
+
+    def test_check_response_with_api_error(self):
+        with pytest.raises(exceptions.APIError) as info:
+            endpoints.check_response(
+                'test.v1', 400,
+                {'error_code': 1, 'error_desc': 'bad'},
+            )
+        assert info.value.msg == 'bad'
+
+    def test_check_response_with_bad_status(self):
+        with pytest.raises(exceptions.InvalidResponseError) as info:
+            endpoints.check_response('test.v1', 502, {})
+        assert info.value.status_code == 502
+
+
+class TestUniqueIds:
+
+    def test_unique_ids(self):
+        ids = ['b', 'a', 'b', 'c', 'a']
+        assert endpoints.unique_ids(ids) == ['b', 'a', 'c']
+
+    def test_unique_ids_empty(self):
+        assert endpoints.unique_ids([]) == []
+
+
+class TestChunkIds:
+
+    def test_chunk_ids(self):
+        chunks = endpoints.chunk_ids(['a', 'b', 'c', 'a', 'd', 'e'], 2)
+        assert chunks == [['a', 'b'], ['c', 'd'], ['e']]
+
+    def test_chunk_ids_without_chunk_size(self):
+        assert endpoints.chunk_ids(['a', 'b', 'a'], None) == [['a', 'b']]
+
+    def test_chunk_ids_empty(self):
+        assert endpoints.chunk_ids([], 2) == []
+
+
+class TestMergeResultsById:
+
+    def test_merge_results_by_id(self):
+        first = endpoints.parse_events_by_id({
+            'events_by_id': {'ABC1': {'event': {'event_id': 'ABC1'}}},
+            'currency_details': {'gbp': {'currency_code': 'gbp'}},
+        })
+        second = endpoints.parse_events_by_id({
+            'events_by_id': {'DEF2': {'event': {'event_id': 'DEF2'}}},
+            'currency_code': 'usd',
+            'currency_details': {'usd': {'currency_code': 'usd'}},
+        })
+
+        events, meta = endpoints.merge_results_by_id([first, second])
+
+        assert sorted(events) == ['ABC1', 'DEF2']
+        assert sorted(meta.currencies) == ['gbp', 'usd']
+        assert meta.default_currency_code == 'usd'
+
+    def test_merge_results_by_id_empty(self):
+        assert endpoints.merge_results_by_id([]) == ({}, None)
+
+
+class TestEndpoints:
+
+    def test_list_events(self):
+        call = endpoints.list_events(
+            keywords=['foo', 'bar'], page=2, extra_info=True)
+
+        assert call.endpoint == 'events.v1'
+        assert call.method == GET
+        assert call.params == {
+            'keywords': 'foo,bar',
+            'page_no': 2,
+            'req_extra_info': True,
+        }
+
+        events, meta = call.parse({
+            'results': {
+                'event': [{'event_id': 'ABC1'}],
+                'paging_status': {'total_unpaged_results': 1},
+            },
+        })
+        assert isinstance(events[0], Event)
+        assert events[0].id == 'ABC1'
+        assert meta.total_results == 1
+
+    def test_list_events_without_results(self):
+        call = endpoints.list_events()
+        with pytest.raises(exceptions.InvalidResponseError):
+            call.parse({})
+
+    def test_get_events(self):
+        call = endpoints.get_events(['ABC1', 'DEF2'], with_addons=True)
+
+        assert call.endpoint == 'events_by_id.v1'
+        assert call.params == {
+            'event_id_list': 'ABC1,DEF2',
+            'add_add_ons': True,
+        }
+
+        events, meta = call.parse({
+            'events_by_id': {
+                'ABC1': {'event': {'event_id': 'ABC1'}},
+                'DEF2': {},
+            },
+        })
+        assert list(events) == ['ABC1']
+
+    def test_get_events_lazy(self):
+        call = endpoints.get_events(['ABC1'], lazy=True)
+
+        assert call.params == {'event_id_list': 'ABC1'}
+
+        events, meta = call.parse({
+            'events_by_id': {'ABC1': {'event': {'event_id': 'ABC1'}}},
+        })
+        assert events['ABC1'].is_deferred('cost_range')
+
+    def test_list_events_keep_raw(self):
+        call = endpoints.list_events(keep_raw=False)
+
+        assert call.params == {}
+
+        events, meta = call.parse({'results': {'event': [{'event_id': 'A'}]}})
+        assert events[0].raw is None
+
+    def test_list_performances_lazy(self):
+        call = endpoints.list_performances('ABC1', lazy=True)
+
+        assert call.params == {'event_id': 'ABC1'}
+
+        performances, meta = call.parse({
+            'results': {'performance': [{'perf_id': 'ABC1-1'}]},
+        })
+        assert performances[0].is_deferred('cost_range')
+        assert performances[0].cost_range is None
+
+    def test_add_optional_kwargs_with_tracking_id(self):
+        params = {}
+        endpoints.add_optional_kwargs(params, tracking_id='abc', foo='bar')
+        assert params == {'tsw_session_track_id': 'abc', 'foo': 'bar'}
+
+    def test_get_trolley(self):
+        call = endpoints.get_trolley(
+            token='ABC', item_numbers_to_remove=[1, 2],
+            raise_on_unavailable_order=True)
+
+        assert call.endpoint == 'trolley.v1'
+        assert call.params == {
+            'trolley_token': 'ABC',
+            'remove_items_list': '1,2',
+        }
+
+        trolley, meta = call.parse({'trolley_token': 'ABC'})
+        assert isinstance(trolley, Trolley)
+
+    def test_get_trolley_with_unavailable_order(self):
+        call = endpoints.get_trolley(raise_on_unavailable_order=True)
+
+        with pytest.raises(exceptions.OrderUnavailableError):
+            call.parse({'input_contained_unavailable_order': True})
+
+    def test_make_reservation(self):
+        call = endpoints.make_reservation(token='ABC')
+
+        assert call.endpoint == 'reserve.v1'
+        assert call.method == POST
+        assert call.params == {'trolley_token': 'ABC'}
+
+    def test_get_status_with_transaction_id(self):
+        call = endpoints.get_status(transaction_id='T000-0000')
+
+        assert call.endpoint == 'trans_id_status.v1'
+        assert call.params == {'transaction_id': 'T000-0000'}
+
+    def test_next_callout(self):
+        call = endpoints.next_callout('abc', 'def', {'foo': 'bar'}, lol='beans')
+
+        assert call.endpoint == 'callback.v1/this.abc/next.def'
+        assert call.method == POST
+        assert call.params == {'foo': 'bar', 'lol': 'beans'}
+
+        status, callout, meta = call.parse({
+            'callout': {'bundle_source_code': 'ext_test0'},
+        })
+        assert status is None
+        assert callout.code == 'ext_test0'
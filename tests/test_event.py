@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from pyticketswitch import exceptions
 from pyticketswitch.event import Event
@@ -331,3 +333,92 @@ class TestEvent:
         assert event.addon_events
         assert event.upsell_events
         assert event.venue_is_enforced is False
+
+    def test_from_api_data_lazy(self, data):
+        event = Event.from_api_data(data, lazy=True)
+
+        assert event.id == 'ABC1'
+        assert event.is_deferred('cost_range')
+        assert event.is_deferred('component_events')
+        assert 'cost_range' not in event.__dict__
+
+        assert event.cost_range.max_seatprice == 47
+        assert not event.is_deferred('cost_range')
+        assert event.is_deferred('media')
+
+    def test_from_api_data_lazy_matches_eager(self, data):
+        eager = Event.from_api_data(copy.deepcopy(data))
+        lazy = Event.from_api_data(copy.deepcopy(data), lazy=True)
+
+        assert lazy.as_dict_for_json() == eager.as_dict_for_json()
+        assert lazy.lazy_attributes() == eager.lazy_attributes()
+        assert not lazy.is_deferred('reviews')
+        assert '_deferred' not in lazy.__dict__
+
+    def test_from_api_data_leaves_data_unchanged(self, data):
+        original = copy.deepcopy(data)
+
+        eager = Event.from_api_data(data)
+        lazy = Event.from_api_data(data, lazy=True)
+
+        assert lazy.as_dict_for_json() == eager.as_dict_for_json()
+        assert data == original
+
+    def test_from_api_data_lazy_copy(self, data):
+        event = Event.from_api_data(data, lazy=True)
+        copied = copy.copy(event)
+
+        assert event.cost_range.max_seatprice == 47
+        assert copied.is_deferred('cost_range')
+        assert copied.cost_range.max_seatprice == 47
+        assert copied.component_events[0].id == 'META123'
+
+    def test_from_api_data_lazy_set_attribute(self, data):
+        event = Event.from_api_data(data, lazy=True)
+
+        event.media = {}
+
+        assert event.media == {}
+        assert not event.is_deferred('media')
+
+    def test_from_api_data_without_raw(self, data):
+        event = Event.from_api_data(data, keep_raw=False)
+
+        assert event.raw is None
+        assert event.id == 'ABC1'
+        assert 'raw' not in event.as_dict_for_json()
+
+    def test_from_api_data_without_raw_on_component_events(self, data):
+        eager = Event.from_api_data(copy.deepcopy(data), keep_raw=False)
+        lazy = Event.from_api_data(
+            copy.deepcopy(data), lazy=True, keep_raw=False)
+
+        assert eager.component_events[0].raw is None
+        assert lazy.component_events[0].raw is None
+        assert lazy.component_events[0].is_deferred('content')
+
+    def test_from_api_data_compact_raw(self, data):
+        eager = Event.from_api_data(copy.deepcopy(data))
+        compact = Event.from_api_data(copy.deepcopy(data), keep_raw='compact')
+
+        assert compact.raw == eager.raw
+        assert compact.as_dict_for_json() == eager.as_dict_for_json()
+
+    def test_from_api_data_invalid_keep_raw(self, data):
+        with pytest.raises(ValueError):
+            Event.from_api_data(data, keep_raw='weak')
+
+    def test_from_events_by_id_api_data_lazy(self, data):
+        raw_data = {
+            'event': data,
+            'add_ons': [{'event_id': 'FOO', 'event_desc': 'Foo Test'}],
+        }
+
+        event = Event.from_events_by_id_api_data(
+            raw_data, lazy=True, keep_raw=False)
+
+        assert event.is_deferred('content')
+        assert event.addon_events[0].is_deferred('content')
+        assert event.raw is None
+        assert event.addon_events[0].raw is None
+        assert len(event.component_events) == 1
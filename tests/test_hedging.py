@@ -0,0 +1,84 @@
+import threading
+
+from pyticketswitch.endpoints import APICall, GET, POST
+from pyticketswitch.hedging import HedgePolicy
+
+
+def make_call(endpoint='availability.v1', method=GET):
+    return APICall(endpoint, {}, method=method)
+
+
+class TestHedgePolicy:
+
+    def test_is_hedgeable(self):
+        policy = HedgePolicy()
+
+        assert policy.is_hedgeable(make_call('availability.v1'))
+        assert policy.is_hedgeable(make_call('events_by_id.v1'))
+        assert not policy.is_hedgeable(make_call('trolley.v1'))
+        assert not policy.is_hedgeable(make_call('reserve.v1', method=POST))
+
+    def test_is_hedgeable_with_endpoints(self):
+        policy = HedgePolicy(endpoints=['availability.v1'])
+
+        assert policy.is_hedgeable(make_call('availability.v1'))
+        assert not policy.is_hedgeable(make_call('events_by_id.v1'))
+
+    def test_get_delay_without_samples(self):
+        assert HedgePolicy().get_delay('availability.v1') is None
+        assert HedgePolicy(delay=0.5).get_delay('availability.v1') == 0.5
+
+    def test_get_delay_percentile(self):
+        policy = HedgePolicy(percentile=90, min_samples=10)
+        for seconds in range(1, 11):
+            policy.record('availability.v1', seconds / 10.0)
+
+        assert policy.get_delay('availability.v1') == 0.9
+        assert policy.get_delay('events.v1') is None
+
+    def test_get_delay_needs_min_samples(self):
+        policy = HedgePolicy(delay=2, min_samples=3)
+        policy.record('availability.v1', 0.1)
+        policy.record('availability.v1', 0.2)
+
+        assert policy.get_delay('availability.v1') == 2
+
+        policy.record('availability.v1', 0.3)
+        assert policy.get_delay('availability.v1') == 0.3
+
+    def test_get_delay_fixed(self):
+        policy = HedgePolicy(percentile=None, delay=0.25, min_samples=1)
+        policy.record('availability.v1', 5)
+
+        assert policy.get_delay('availability.v1') == 0.25
+
+    def test_get_delay_min_delay(self):
+        policy = HedgePolicy(min_delay=0.05, min_samples=1)
+        policy.record('availability.v1', 0.001)
+
+        assert policy.get_delay('availability.v1') == 0.05
+
+    def test_record_window(self):
+        policy = HedgePolicy(percentile=100, window=2, min_samples=1)
+        policy.record('availability.v1', 10)
+        policy.record('availability.v1', 0.1)
+        policy.record('availability.v1', 0.2)
+
+        assert policy.get_delay('availability.v1') == 0.2
+
+    def test_record_hedge_and_win_from_threads(self):
+        policy = HedgePolicy()
+
+        def record():
+            for _ in range(1000):
+                policy.record_hedge()
+                policy.record_win()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert policy.hedged == 4000
+        assert policy.wins == 4000
@@ -1,8 +1,12 @@
+import copy
 import pytest
 import datetime
 from dateutil.tz import tzoffset
 from decimal import Decimal
-from pyticketswitch.mixins import JSONMixin, PaginationMixin, SeatPricingMixin
+from mock import Mock
+from pyticketswitch.mixins import (
+    CompactData, JSONMixin, LazyAttribute, LazyMixin, PaginationMixin,
+    RawAttribute, SeatPricingMixin, retain_raw)
 
 
 class TestJSONMixin:
@@ -110,6 +114,201 @@ class TestJSONMixin:
         assert result == {'bar': 'hello world!'}
 
 
+class TestJSONMixinWithSlots:
+
+    class Foo(JSONMixin, object):
+
+        __slots__ = ('bar', 'baz', '__dict__')
+
+        def __init__(self, bar, qux=None):
+            self.bar = bar
+            self.qux = qux
+
+    class Bar(Foo):
+
+        __slots__ = ('quux',)
+
+    def test_slots(self):
+        obj = self.Foo('hello', qux=2)
+        assert obj.__jsondict__() == {'bar': 'hello', 'qux': 2}
+
+    def test_inherited_slots(self):
+        obj = self.Bar('hello')
+        obj.quux = [1]
+        assert obj.__jsondict__() == {'bar': 'hello', 'quux': [1]}
+
+
+class TestLazyMixin:
+
+    class Foo(LazyMixin, JSONMixin, object):
+
+        bar = LazyAttribute('bar', lambda data: data['bar'].upper())
+        baz = LazyAttribute('baz', lambda data: len(data['baz']))
+
+        def __init__(self, bar=None, baz=None, qux=None):
+            self.bar = bar
+            self.baz = baz
+            self.qux = qux
+
+    def test_lazy_attributes(self):
+        assert self.Foo.lazy_attributes() == ['bar', 'baz']
+
+    def test_not_deferred(self):
+        obj = self.Foo('hello', 3)
+        assert obj.bar == 'hello'
+        assert obj.baz == 3
+        assert not obj.is_deferred('bar')
+
+    def test_defer(self):
+        obj = self.Foo(qux=1)
+        obj.defer({'bar': 'hello', 'baz': [1, 2]})
+
+        assert obj.is_deferred('bar')
+        assert obj.is_deferred('baz')
+        assert obj.qux == 1
+
+        assert obj.bar == 'HELLO'
+        assert not obj.is_deferred('bar')
+        assert obj.is_deferred('baz')
+
+        assert obj.baz == 2
+        assert '_deferred' not in obj.__dict__
+
+    def test_parses_once(self):
+        parse = Mock(return_value='parsed')
+
+        class Bar(LazyMixin, object):
+            bar = LazyAttribute('bar', parse)
+
+        obj = Bar()
+        obj.defer({'bar': 'hello'})
+
+        assert obj.bar == 'parsed'
+        assert obj.bar == 'parsed'
+        parse.assert_called_once_with({'bar': 'hello'})
+
+    def test_defer_with_options(self):
+        parse = Mock(return_value='parsed')
+
+        class Bar(LazyMixin, object):
+            bar = LazyAttribute('bar', parse, options=('upper',))
+            baz = LazyAttribute('baz', lambda data: data['baz'])
+
+        obj = Bar()
+        obj.defer({'bar': 'hello', 'baz': 1}, upper=True, other=False)
+
+        assert obj.bar == 'parsed'
+        parse.assert_called_once_with({'bar': 'hello', 'baz': 1}, upper=True)
+        assert obj.baz == 1
+        assert '_deferred' not in obj.__dict__
+
+    def test_copy(self):
+        obj = self.Foo(qux=1)
+        obj.defer({'bar': 'hello', 'baz': [1, 2]})
+
+        shallow = copy.copy(obj)
+        deep = copy.deepcopy(obj)
+
+        assert obj.bar == 'HELLO'
+        assert obj.baz == 2
+        assert shallow.is_deferred('bar')
+        assert shallow.bar == 'HELLO'
+        assert deep.bar == 'HELLO'
+        assert deep.baz == 2
+        assert shallow.is_deferred('baz')
+
+    def test_keeps_first_value(self):
+
+        class Bar(LazyMixin, object):
+            bar = LazyAttribute('bar', lambda data: parse(data))
+
+        obj = Bar()
+        obj.defer({'bar': 'hello'})
+
+        def parse(data):
+            # another thread stores its value while this one is parsing
+            obj.__dict__['bar'] = 'first'
+            return 'second'
+
+        assert obj.bar == 'first'
+        assert obj.bar == 'first'
+
+    def test_set_deferred(self):
+        obj = self.Foo()
+        obj.defer({'bar': 'hello', 'baz': [1, 2]})
+
+        obj.bar = 'goodbye'
+
+        assert obj.bar == 'goodbye'
+        assert not obj.is_deferred('bar')
+
+    def test_missing(self):
+        class Bar(LazyMixin, object):
+            bar = LazyAttribute('bar', lambda data: data)
+
+        with pytest.raises(AttributeError):
+            Bar().bar
+
+    def test_jsondict(self):
+        obj = self.Foo(qux=1)
+        obj.defer({'bar': 'hello', 'baz': [1, 2]})
+
+        assert obj.__jsondict__() == {'bar': 'HELLO', 'baz': 2, 'qux': 1}
+        assert '_deferred' not in obj.__dict__
+
+
+class TestRetainRaw:
+
+    DATA = {'event_id': 'ABC1', 'price': Decimal('12.50'), 'list': [1, 2]}
+
+    def test_keep(self):
+        assert retain_raw(self.DATA) is self.DATA
+        assert retain_raw(self.DATA, True) is self.DATA
+
+    def test_drop(self):
+        assert retain_raw(self.DATA, False) is None
+
+    def test_compact(self):
+        compact = retain_raw(self.DATA, 'compact')
+
+        assert isinstance(compact, CompactData)
+        assert compact.load() == self.DATA
+        assert compact.load() is not compact.load()
+
+    def test_compact_jsondict(self):
+        compact = CompactData(self.DATA)
+        assert compact.__jsondict__() == {
+            'event_id': 'ABC1', 'price': 12.5, 'list': [1, 2]}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            retain_raw(self.DATA, 'weak')
+
+
+class TestRawAttribute:
+
+    class Foo(JSONMixin, object):
+
+        raw = RawAttribute('raw')
+
+        def __init__(self, raw=None):
+            self.raw = raw
+
+    def test_plain(self):
+        data = {'foo': 'bar'}
+        assert self.Foo(data).raw is data
+
+    def test_compact(self):
+        obj = self.Foo(CompactData({'foo': 'bar'}))
+
+        assert obj.raw == {'foo': 'bar'}
+        assert obj.as_dict_for_json() == {'raw': {'foo': 'bar'}}
+
+    def test_missing(self):
+        with pytest.raises(AttributeError):
+            self.Foo.__new__(self.Foo).raw
+
+
 class TestPaginationMixin:
 
     def test_from_api_data(self):
@@ -143,6 +342,17 @@ class TestPaginationMixin:
         assert meta.results_remaining == 150
         assert meta.total_results == 250
 
+    def test_remaining_pages(self):
+        meta = PaginationMixin(page_number=2, pages_remaining=3)
+        assert meta.remaining_pages() == [3, 4, 5]
+
+    def test_remaining_pages_on_last_page(self):
+        meta = PaginationMixin(page_number=5, pages_remaining=0)
+        assert meta.remaining_pages() == []
+
+    def test_remaining_pages_when_not_paginated(self):
+        assert PaginationMixin().remaining_pages() == []
+
     def test_is_paginated_pages_remaining(self):
         meta = PaginationMixin(
             page_length=50,
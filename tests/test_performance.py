@@ -195,6 +195,45 @@ class TestPerformance:
 
         assert len(performance.availability_details) == 6
 
+    def test_from_api_data_lazy(self):
+        data = {
+            'perf_id': '25DR-52O',
+            'event_id': '25DR',
+            'cost_range': {
+                'min_seatprice': 57.5,
+                'no_singles_cost_range': {'min_seatprice': 69.5},
+            },
+        }
+
+        performance = Performance.from_api_data(data, lazy=True)
+
+        assert performance.id == '25DR-52O'
+        assert performance.is_deferred('cost_range')
+        assert performance.is_deferred('availability_details')
+
+        assert performance.cost_range.min_seatprice == 57.5
+        assert performance.no_singles_cost_range.min_seatprice == 69.5
+        assert performance.availability_details == []
+        assert not performance.is_deferred('availability_details')
+
+    def test_as_dict_for_json_lazy(self):
+        data = {
+            'perf_id': '25DR-52O',
+            'event_id': '25DR',
+            'cost_range': {'min_seatprice': 57.5},
+        }
+
+        performance = Performance.from_api_data(data, lazy=True)
+
+        assert performance.as_dict_for_json() == {
+            'id': '25DR-52O',
+            'event_id': '25DR',
+            'has_pool_seats': False,
+            'is_limited': False,
+            'is_ghost': False,
+            'cost_range': {'min_seatprice': 57.5},
+        }
+
     def test_repr_with_date(self):
         performance = Performance(
             'ABC1-23',
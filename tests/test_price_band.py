@@ -102,6 +102,15 @@ class TestPriceBand:
         assert len(price_band.seat_blocks) == 4
         assert price_band.seat_blocks[0].length == 2
 
+        seats = {seat.id: seat for seat in price_band.get_seats()}
+        assert seats['A1'].is_restricted is True
+        assert seats['A1'].seat_text == 'Death Trap'
+        assert seats['B-2'].is_restricted is True
+        assert seats['B-2'].column == '2'
+        assert seats['B-2'].seat_text == 'Death Trap'
+        assert seats['A2'].is_restricted is False
+        assert seats['A2'].seat_text == ''
+
         assert price_band.user_commission.excluding_vat == 2.93
 
         assert len(price_band.discounts) == 2
@@ -117,6 +126,11 @@ class TestPriceBand:
         assert price_band.percentage_saving == 20
         assert price_band.is_offer is True
 
+        result = price_band.as_dict_for_json()
+        assert result['code'] == 'B'
+        assert result['seatprice'] == 160.00
+        assert result['default_discount']['code'] == 'ABC123'
+
     def test_get_seats(self):
 
         price_band = PriceBand(
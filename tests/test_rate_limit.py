@@ -0,0 +1,102 @@
+import pytest
+
+from pyticketswitch import exceptions
+from pyticketswitch.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTokenBucket:
+
+    def test_reserve(self, clock):
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1
+
+    def test_reserve_refills(self, clock):
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 0.5
+        assert bucket.reserve() == 0
+
+        clock.now += 10
+        assert bucket.reserve() == 0
+        assert bucket.tokens == 1
+
+
+class TestRateLimiter:
+
+    def test_acquire_per_endpoint_and_sub_user(self, clock):
+        limiter = RateLimiter(
+            rate=1, rates={'availability.v1': 2}, clock=clock)
+
+        assert limiter.acquire('events.v1') == 0
+        assert limiter.acquire('events.v1') == 1
+        assert limiter.acquire('events.v1', 'fred') == 0
+        assert limiter.acquire('availability.v1') == 0
+        assert limiter.acquire('availability.v1') == 0
+        assert limiter.acquire('availability.v1') == 0.5
+
+    def test_burst(self, clock):
+        limiter = RateLimiter(rate=1, burst=3, clock=clock)
+
+        assert [limiter.acquire('events.v1') for _ in range(4)] == [0, 0, 0, 1]
+
+    def test_decrease_and_recover(self, clock):
+        limiter = RateLimiter(
+            rate=8, min_rate=1, decrease_factor=0.5, increase=1, clock=clock)
+        limiter.acquire('availability.v1')
+
+        limiter.record_response(
+            'availability.v1', None, {'backend_throttle_failed': True})
+        assert limiter.get_rate('availability.v1') == 4
+        assert limiter.throttled == 1
+
+        for _ in range(3):
+            limiter.decrease('availability.v1')
+        assert limiter.get_rate('availability.v1') == 1
+
+        limiter.record_response('availability.v1', None, {})
+        assert limiter.get_rate('availability.v1') == 2
+
+        for _ in range(10):
+            limiter.record_response('availability.v1', None, {})
+        assert limiter.get_rate('availability.v1') == 8
+
+    def test_decrease_only_affects_bucket(self, clock):
+        limiter = RateLimiter(rate=8, clock=clock)
+        limiter.decrease('availability.v1', 'fred')
+
+        assert limiter.get_rate('availability.v1', 'fred') == 4
+        assert limiter.get_rate('availability.v1') == 8
+        assert limiter.get_rate('events.v1', 'fred') == 8
+
+    @pytest.mark.parametrize('error,throttled', [
+        (exceptions.InvalidResponseError('slow down', status_code=429), True),
+        (exceptions.InvalidResponseError('unavailable', status_code=503), True),
+        (exceptions.InvalidResponseError('broken', status_code=500), False),
+        (exceptions.BackendThrottleError('slow down'), True),
+        (exceptions.APIError('bad', 1), False),
+    ])
+    def test_record_error(self, clock, error, throttled):
+        limiter = RateLimiter(rate=8, clock=clock)
+        limiter.record_error('events.v1', None, error)
+
+        assert limiter.get_rate('events.v1') == (4 if throttled else 8)
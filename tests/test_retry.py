@@ -0,0 +1,100 @@
+import pytest
+import requests
+
+from pyticketswitch import endpoints, exceptions
+from pyticketswitch.customer import Customer
+from pyticketswitch.retry import RetryPolicy
+
+
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError,)
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy:
+
+    def test_is_idempotent(self):
+        policy = RetryPolicy(never_retry=['trolley.v1'])
+
+        assert policy.is_idempotent(endpoints.get_events(['6IF'])) is True
+        assert policy.is_idempotent(endpoints.get_trolley()) is False
+        assert policy.is_idempotent(
+            endpoints.make_reservation(token='ABC')) is False
+        assert policy.is_idempotent(
+            endpoints.make_purchase(
+                'abc', Customer('fred', 'bloggs', [], 'uk'))) is False
+        assert policy.is_idempotent(
+            endpoints.cancel_purchase('abc')) is False
+
+    @pytest.mark.parametrize('error,expected', [
+        (exceptions.InvalidResponseError('bad', status_code=503), True),
+        (exceptions.InvalidResponseError('bad', status_code=429), True),
+        (exceptions.InvalidResponseError('bad', status_code=200), False),
+        (exceptions.InvalidResponseError('bad'), False),
+        (exceptions.BackendThrottleError('slow down'), True),
+        (exceptions.APIError('bad', 1), False),
+        (requests.exceptions.ConnectionError('reset'), True),
+        (ValueError('bad'), False),
+    ])
+    def test_is_transient(self, error, expected):
+        policy = RetryPolicy()
+        assert policy.is_transient(error, TRANSIENT_ERRORS) is expected
+
+    def test_get_backoff(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.get_backoff(attempt) for attempt in range(1, 6)] == [
+            0.5, 1, 2, 3, 3,
+        ]
+
+    def test_get_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=3)
+
+        for attempt in range(1, 6):
+            assert 0 <= policy.get_backoff(attempt) <= 3
+
+    def test_get_delay(self):
+        policy = RetryPolicy(max_attempts=3, backoff=1, jitter=False)
+        call = endpoints.get_events(['6IF'])
+        error = requests.exceptions.ConnectionError()
+
+        assert policy.get_delay(call, error, 1, 0, TRANSIENT_ERRORS) == 1
+        assert policy.get_delay(call, error, 2, 0, TRANSIENT_ERRORS) == 2
+        assert policy.get_delay(call, error, 3, 0, TRANSIENT_ERRORS) is None
+        assert policy.retries == 2
+
+    def test_get_delay_never_retries_post(self):
+        policy = RetryPolicy()
+        call = endpoints.make_reservation(token='ABC')
+        error = requests.exceptions.ConnectionError()
+
+        assert policy.get_delay(call, error, 1, 0, TRANSIENT_ERRORS) is None
+
+    def test_get_delay_with_permanent_error(self):
+        policy = RetryPolicy()
+        call = endpoints.get_events(['6IF'])
+        error = exceptions.APIError('bad', 1)
+
+        assert policy.get_delay(call, error, 1, 0, TRANSIENT_ERRORS) is None
+
+    def test_get_delay_past_deadline(self):
+        clock = FakeClock()
+        policy = RetryPolicy(
+            backoff=1, jitter=False, deadline=2.5, max_attempts=10,
+            clock=clock)
+        call = endpoints.get_events(['6IF'])
+        error = requests.exceptions.ConnectionError()
+        started = clock()
+
+        clock.now += 0.5
+        assert policy.get_delay(call, error, 1, started, TRANSIENT_ERRORS) == 1
+        clock.now += 1.5
+        assert policy.get_delay(
+            call, error, 2, started, TRANSIENT_ERRORS) is None
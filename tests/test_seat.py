@@ -20,9 +20,66 @@ class TestSeatBlock:
         assert seat_block.seats[0].id == 'D1'
         assert seat_block.seats[1].id == 'B2'
 
+    def test_from_api_data_with_seat_ids(self):
+        seat_block = SeatBlock.from_api_data(
+            ['B-1', 'B-2', 'B-3'],
+            row_id='B',
+            separator='-',
+            restricted_view_seats=['B-2'],
+            seats_by_text_message={
+                'Pillar': ['B-1', 'B-2'],
+                'Near toilet': ['B-2'],
+            },
+        )
+
+        assert seat_block.length == 3
+        assert [seat.column for seat in seat_block.seats] == ['1', '2', '3']
+        assert [seat.is_restricted for seat in seat_block.seats] == [
+            False, True, False]
+        assert seat_block.seats[0].seat_text == 'Pillar'
+        assert seat_block.seats[1].seat_text in ('Pillar', 'Near toilet')
+        assert seat_block.seats[2].seat_text == ''
+
+    def test_from_api_data_with_indexes(self):
+        seat_block = SeatBlock.from_api_data(
+            ['A1', 'A2'],
+            row_id='A',
+            restricted_view_seats={'A1'},
+            text_by_seat={'A2': 'Pillar'},
+        )
+
+        assert seat_block.seats[0].column == '1'
+        assert seat_block.seats[0].is_restricted is True
+        assert seat_block.seats[0].seat_text == ''
+        assert seat_block.seats[1].is_restricted is False
+        assert seat_block.seats[1].seat_text == 'Pillar'
+
+    def test_from_api_data_without_indexes(self):
+        seat_block = SeatBlock.from_api_data(['A1'], row_id='A')
+
+        assert seat_block.seats[0].is_restricted is False
+        assert seat_block.seats[0].seat_text == ''
+
+    def test_index_seat_text(self):
+        text_by_seat = SeatBlock.index_seat_text({
+            'Pillar': ['A1', 'A2'],
+            'Near toilet': ['B1'],
+        })
+
+        assert text_by_seat == {
+            'A1': 'Pillar', 'A2': 'Pillar', 'B1': 'Near toilet'}
+        assert SeatBlock.index_seat_text(None) == {}
+
 
 class TestSeat:
 
+    def test_slots(self):
+        seat = Seat(id_='A1', column='1', row='A', is_restricted=True)
+
+        assert not hasattr(seat, '__dict__')
+        assert seat.as_dict_for_json() == {
+            'id': 'A1', 'column': '1', 'row': 'A', 'is_restricted': True}
+
     def from_api_data(self):
 
         data = {
@@ -0,0 +1,311 @@
+import pytest
+
+from pyticketswitch.availability import AvailabilityMeta
+from pyticketswitch.discount import Discount
+from pyticketswitch.price_band import PriceBand
+from pyticketswitch.seat import Seat, SeatBlock
+from pyticketswitch.seat_map import SeatChoice, SeatMap, SeatMapBlock
+from pyticketswitch.ticket_type import TicketType
+
+
+def make_block(row, columns, restricted=(), separator=''):
+    return SeatBlock(len(columns), seats=[
+        Seat(
+            id_='{}{}{}'.format(row, separator, column),
+            row=row,
+            column=str(column),
+            separator=separator,
+            is_restricted=column in restricted,
+        )
+        for column in columns
+    ])
+
+
+@pytest.fixture
+def stalls():
+    return PriceBand(
+        'A', Discount('ADULT'), seatprice=50, surcharge=5,
+        seat_blocks=[
+            make_block('A', [1, 2, 3, 4, 5], restricted=(1,)),
+            make_block('B', [7, 8]),
+        ],
+    )
+
+
+@pytest.fixture
+def circle():
+    return PriceBand(
+        'B', Discount('ADULT'), seatprice=20, surcharge=2,
+        seat_blocks=[
+            make_block('C', [1, 2]),
+            make_block('C', [5, 6, 7], restricted=(7,)),
+        ],
+    )
+
+
+@pytest.fixture
+def seat_map(stalls, circle):
+    return SeatMap.from_price_bands([stalls, circle])
+
+
+class TestSeatMap:
+
+    def test_from_price_bands(self, seat_map, stalls):
+        assert len(seat_map) == 12
+        assert seat_map.seat_ids[:3] == ['A1', 'A2', 'A3']
+
+        seat = seat_map.seat(0)
+        assert seat.id == 'A1'
+        assert seat.row == 'A'
+        assert seat.column == '1'
+        assert seat.is_restricted is True
+        assert seat_map.price_band_of(0) is stalls
+        assert seat_map.price_of(0) == 55
+
+    def test_from_ticket_types(self, stalls, circle):
+        stalls_tt = TicketType('STALLS', price_bands=[stalls])
+        circle_tt = TicketType('CIRCLE', price_bands=[circle])
+
+        seat_map = SeatMap.from_ticket_types([stalls_tt, circle_tt])
+
+        assert len(seat_map) == 12
+        assert seat_map.ticket_type_of(0) is stalls_tt
+        assert seat_map.ticket_type_of(11) is circle_tt
+
+    def test_add_free_seat_blocks(self):
+        price_band = PriceBand('A', Discount('ADULT'))
+        seat_map = SeatMap()
+
+        seat_map.add_free_seat_blocks({
+            'blocks_by_row': {'B': [['B-1', 'B-2'], ['B-4']]},
+            'separators_by_row': {'B': '-'},
+            'restricted_view_seats': ['B-2'],
+            'seats_by_text_message': {'Pillar': ['B-2']},
+        }, price_band)
+
+        assert seat_map.seat_ids == ['B-1', 'B-2', 'B-4']
+        seat = seat_map.seat(1)
+        assert seat.column == '2'
+        assert seat.separator == '-'
+        assert seat.is_restricted is True
+        assert seat.seat_text == 'Pillar'
+        assert seat_map.seat(0).seat_text == ''
+        assert seat_map.price_of(0) is None
+        assert [block.length for block in seat_map.blocks()] == [2, 1]
+
+    def test_add_price_band_without_seat_blocks(self):
+        seat_map = SeatMap()
+
+        seat_map.add_price_band(PriceBand('A', Discount('ADULT')))
+
+        assert len(seat_map) == 0
+        assert seat_map.blocks() == []
+        assert seat_map.cheapest_contiguous(1) is None
+
+    def test_blocks(self, seat_map):
+        blocks = seat_map.blocks(min_length=3)
+
+        assert [block.seat_ids for block in blocks] == [
+            ['A1', 'A2', 'A3', 'A4', 'A5'],
+            ['C5', 'C6', 'C7'],
+        ]
+        assert len(seat_map.blocks()) == 4
+        assert seat_map.blocks(min_length=6) == []
+
+    def test_blocks_after_adding_more(self, seat_map):
+        assert len(seat_map.blocks(min_length=4)) == 1
+
+        seat_map.add_price_band(PriceBand(
+            'C', Discount('ADULT'),
+            seat_blocks=[make_block('D', [1, 2, 3, 4])]))
+
+        assert len(seat_map.blocks(min_length=4)) == 2
+
+    def test_blocks_in_band(self, seat_map, circle):
+        blocks = seat_map.blocks_in_band(circle)
+
+        assert [block.row for block in blocks] == ['C', 'C']
+        with pytest.raises(ValueError):
+            seat_map.blocks_in_band(PriceBand('Z', Discount('ADULT')))
+
+    def test_row(self, seat_map):
+        seats = seat_map.row('C')
+
+        assert [seat.id for seat in seats] == ['C1', 'C2', 'C5', 'C6', 'C7']
+        assert seat_map.row('Z') == []
+        assert seat_map.rows() == ['A', 'B', 'C']
+
+    def test_restricted_seats(self, seat_map):
+        seats = seat_map.restricted_seats()
+
+        assert [seat.id for seat in seats] == ['A1', 'C7']
+        assert seat_map.is_restricted(0) is True
+        assert seat_map.is_restricted(1) is False
+
+    def test_bands_by_price(self, seat_map, stalls, circle):
+        unpriced = PriceBand('Z', Discount('ADULT'))
+        seat_map.add_price_band(unpriced)
+
+        assert seat_map.bands_by_price() == [circle, stalls, unpriced]
+
+    def test_cheapest_contiguous(self, seat_map, stalls, circle):
+        block = seat_map.cheapest_contiguous(2)
+
+        assert block.seat_ids == ['C1', 'C2']
+        assert block.price_band is circle
+        assert block.price == 22
+
+        block = seat_map.cheapest_contiguous(3)
+        assert block.seat_ids == ['C5', 'C6', 'C7']
+
+        block = seat_map.cheapest_contiguous(4)
+        assert block.seat_ids == ['A1', 'A2', 'A3', 'A4']
+        assert block.price_band is stalls
+
+        assert seat_map.cheapest_contiguous(6) is None
+
+
+class TestBestAvailable:
+
+    def make_seat_map(self, rule, *blocks):
+        return SeatMap.from_price_bands([PriceBand(
+            'A', Discount('ADULT'), seatprice=30, surcharge=3,
+            allows_leaving_single_seats=rule,
+            seat_blocks=list(blocks),
+        )])
+
+    def ids(self, choices):
+        return [choice.seat_ids for choice in choices]
+
+    def test_always(self):
+        seat_map = self.make_seat_map(
+            'always', make_block('A', [1, 2, 3, 4, 5], restricted=(1,)))
+
+        choices = seat_map.best_available(2)
+
+        assert self.ids(choices) == [
+            ['A4', 'A5'], ['A1', 'A2'], ['A2', 'A3'], ['A3', 'A4']]
+        assert [choice.leaves_single_seat for choice in choices] == [
+            False, False, True, True]
+        assert [choice.restricted for choice in choices] == [0, 1, 0, 0]
+        assert choices[0].contiguous is True
+        assert choices[0].price == 33
+
+    def test_never(self):
+        seat_map = self.make_seat_map(
+            'never', make_block('A', [1, 2, 3, 4, 5], restricted=(1,)))
+
+        choices = seat_map.best_available(2)
+
+        assert self.ids(choices) == [['A4', 'A5'], ['A1', 'A2']]
+
+    def test_never_without_choices(self):
+        seat_map = self.make_seat_map('never', make_block('A', [1, 2, 3]))
+
+        assert seat_map.best_available(2) == []
+        assert self.ids(seat_map.best_available(3)) == [['A1', 'A2', 'A3']]
+
+    def test_if_necessary(self):
+        seat_map = self.make_seat_map(
+            'if_necessary', make_block('A', [1, 2, 3, 4, 5]))
+
+        assert self.ids(seat_map.best_available(2)) == [
+            ['A1', 'A2'], ['A4', 'A5']]
+
+        seat_map = self.make_seat_map('if_necessary', make_block('A', [1, 2, 3]))
+
+        assert self.ids(seat_map.best_available(2)) == [
+            ['A1', 'A2'], ['A2', 'A3']]
+
+    def test_prefers_middle_of_block(self):
+        seat_map = self.make_seat_map(
+            'always', make_block('A', [1, 2, 3, 4, 5, 6, 7]))
+
+        choices = seat_map.best_available(3)
+
+        assert choices[0].seat_ids == ['A3', 'A4', 'A5']
+
+    def test_ranked_by_price(self, seat_map, stalls, circle):
+        choices = seat_map.best_available(2)
+
+        assert [choice.price_band for choice in choices[:3]] == [circle] * 3
+        assert choices[-1].price_band is stalls
+        assert choices[0].seat_ids == ['C1', 'C2']
+
+    def test_limit(self, seat_map):
+        choices = seat_map.best_available(2, limit=2)
+
+        assert self.ids(choices) == [['C1', 'C2'], ['C5', 'C6']]
+        assert seat_map.best_available(0) == []
+
+    def test_valid_quantities(self, seat_map):
+        meta = AvailabilityMeta(currencies={}, valid_quantities=[2, 4])
+
+        assert seat_map.best_available(3, meta=meta) == []
+        assert len(seat_map.best_available(2, meta=meta)) > 0
+
+    def test_contiguous_only(self):
+        seat_map = self.make_seat_map(
+            'always', make_block('A', [1, 2]), make_block('B', [1, 2]))
+
+        assert seat_map.best_available(3) == []
+        meta = AvailabilityMeta(
+            currencies={}, contiguous_seat_selection_only=True)
+        assert seat_map.best_available(3, meta=meta) == []
+
+    def test_not_contiguous_only(self):
+        meta = AvailabilityMeta(currencies={}, contiguous_seat_selection_only=False)
+        seat_map = self.make_seat_map(
+            'always',
+            make_block('A', [1, 2, 3]),
+            make_block('B', [1, 2, 3]),
+            make_block('C', [1, 2]),
+        )
+
+        choices = seat_map.best_available(4, meta=meta)
+
+        assert len(choices) == 1
+        assert choices[0].contiguous is False
+        assert choices[0].seat_ids == ['A1', 'A2', 'A3', 'B1']
+        assert choices[0].leaves_single_seat is False
+
+    def test_not_contiguous_only_leaving_single(self):
+        meta = AvailabilityMeta(currencies={}, contiguous_seat_selection_only=False)
+        blocks = [make_block('A', [1, 2]), make_block('B', [1, 2])]
+
+        seat_map = self.make_seat_map('always', *blocks)
+        choices = seat_map.best_available(3, meta=meta)
+        assert choices[0].seat_ids == ['A1', 'A2', 'B1']
+        assert choices[0].leaves_single_seat is True
+
+        seat_map = self.make_seat_map('never', *blocks)
+        assert seat_map.best_available(3, meta=meta) == []
+
+        seat_map = self.make_seat_map('always', *blocks)
+        assert seat_map.best_available(5, meta=meta) == []
+
+    def test_contiguous_before_split(self):
+        meta = AvailabilityMeta(currencies={}, contiguous_seat_selection_only=False)
+        seat_map = SeatMap.from_price_bands([
+            PriceBand('A', Discount('ADULT'), seatprice=10, surcharge=1,
+                      seat_blocks=[make_block('A', [1]), make_block('B', [1])]),
+            PriceBand('B', Discount('ADULT'), seatprice=50, surcharge=5,
+                      seat_blocks=[make_block('C', [1, 2])]),
+        ])
+
+        choices = seat_map.best_available(2, meta=meta)
+
+        assert self.ids(choices) == [['C1', 'C2'], ['A1', 'B1']]
+        assert isinstance(choices[0], SeatChoice)
+
+
+class TestSeatMapBlock:
+
+    def test_seats(self, seat_map):
+        block = SeatMapBlock(seat_map, 5, 2)
+
+        assert block.row == 'B'
+        assert [seat.id for seat in block.seats] == ['B7', 'B8']
+        assert block == SeatMapBlock(seat_map, 5, 2)
+        assert block != SeatMapBlock(seat_map, 5, 1)
+        assert len({block, SeatMapBlock(seat_map, 5, 2)}) == 1
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import decimal
+import json
+
+import pytest
+from mock import Mock
+
+from pyticketswitch.streaming import ItemParser, ResultStream
+
+
+EVENTS = {
+    'results': {
+        'event': [
+            {'event_id': '6IF', 'event_desc': 'Nutcracker {with [brackets]}'},
+            {'event_id': '25DR', 'event_desc': u'Quote \\" and café',
+             'venue_desc': ['a', {'b': []}]},
+            {'event_id': '3CVE', 'event_desc': ''},
+        ],
+        'paging_status': {'total_unpaged_results': 3},
+    },
+    'currency_details': {'gbp': {'currency_code': 'gbp'}},
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def parse(document, path, size):
+    parser = ItemParser(path)
+    items = []
+    for chunk in chunked(document, size):
+        items.extend(parser.feed(chunk))
+    return parser, items
+
+
+class TestItemParser:
+
+    def test_feed_decimal(self):
+        parser = ItemParser(('results', 'event'), use_decimal=True)
+
+        items = parser.feed(b'{"results": {"event": [{"price": 12.5}]}}')
+
+        assert items == [(None, {'price': decimal.Decimal('12.5')})]
+
+    def test_feed_split_utf8(self):
+        document = u'{"results": {"event": [{"desc": "café ☕"}]}}'.encode(
+            'utf-8')
+
+        parser, items = parse(document, ('results', 'event'), 1)
+
+        assert items == [(None, {'desc': u'café ☕'})]
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 100000])
+    def test_feed_list(self, size):
+        document = json.dumps(EVENTS).encode('utf-8')
+
+        parser, items = parse(document, ('results', 'event'), size)
+
+        assert parser.found
+        assert [key for key, _ in items] == [None, None, None]
+        assert [item for _, item in items] == EVENTS['results']['event']
+
+    @pytest.mark.parametrize('size', [1, 5, 100000])
+    def test_feed_dict(self, size):
+        document = json.dumps({
+            'events_by_id': {
+                '6IF': {'event': {'event_id': '6IF'}},
+                '25DR': {'event': {'event_id': '25DR'}},
+            },
+            'currency_details': {},
+        }).encode('utf-8')
+
+        parser, items = parse(document, ('events_by_id',), size)
+
+        assert sorted(items) == [
+            ('25DR', {'event': {'event_id': '25DR'}}),
+            ('6IF', {'event': {'event_id': '6IF'}}),
+        ]
+
+    @pytest.mark.parametrize('size', [1, 4, 100000])
+    def test_remainder(self, size):
+        document = json.dumps(EVENTS).encode('utf-8')
+
+        parser, _ = parse(document, ('results', 'event'), size)
+
+        rest = json.loads(parser.remainder())
+        assert rest['results']['event'] == []
+        assert rest['results']['paging_status'] == \
+            EVENTS['results']['paging_status']
+        assert rest['currency_details'] == EVENTS['currency_details']
+
+    def test_ignores_same_key_elsewhere(self):
+        document = json.dumps({
+            'event': [{'event_id': 'nope'}],
+            'results': {'other': {'event': [{'event_id': 'nope'}]},
+                        'event': [{'event_id': 'yes'}]},
+        }).encode('utf-8')
+
+        parser, items = parse(document, ('results', 'event'), 3)
+
+        assert items == [(None, {'event_id': 'yes'})]
+
+    def test_not_found(self):
+        document = b'{"error_code": 3, "error_desc": "bad"}'
+
+        parser, items = parse(document, ('results', 'event'), 4)
+
+        assert not parser.found
+        assert items == []
+        assert parser.remainder() == document.decode('utf-8')
+
+    def test_only_keeps_item_in_progress(self):
+        parser = ItemParser(('results', 'event'))
+        parser.feed(b'{"results": {"event": [{"event_id": "1"}, {"event')
+
+        assert parser._buffer == u'{"event'
+
+
+class TestResultStream:
+
+    def test_iter(self):
+        document = json.dumps(EVENTS).encode('utf-8')
+        close = Mock()
+        finish = Mock(return_value='meta')
+
+        stream = ResultStream(
+            chunked(document, 10), ('results', 'event'),
+            lambda data: data['event_id'], finish, close=close)
+
+        assert stream.meta is None
+        assert list(stream) == ['6IF', '25DR', '3CVE']
+        assert stream.meta == 'meta'
+        rest = json.loads(finish.call_args[0][0])
+        assert rest['results']['event'] == []
+        close.assert_called_once_with()
+
+    def test_iter_skips_none(self):
+        document = json.dumps(EVENTS).encode('utf-8')
+
+        stream = ResultStream(
+            [document], ('results', 'event'),
+            lambda data: data['event_desc'] or None, Mock())
+
+        assert len(list(stream)) == 2
+
+    def test_close_early(self):
+        document = json.dumps(EVENTS).encode('utf-8')
+        close = Mock()
+        finish = Mock()
+
+        stream = ResultStream(
+            chunked(document, 10), ('results', 'event'),
+            lambda data: data['event_id'], finish, close=close)
+
+        for _ in stream:
+            break
+
+        stream.close()
+        close.assert_called_once_with()
+        finish.assert_not_called()
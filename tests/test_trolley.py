@@ -84,6 +84,31 @@ class TestTrolley:
         assert trolley.token == 'abc123'
         assert trolley.input_contained_unavailable_order is True
 
+    def test_from_api_data_without_raw(self):
+        data = {
+            'discarded_orders': [
+                {'item_number': 3, 'event': {'event_id': 'DEF456'}},
+            ],
+            'trolley_contents': {
+                'bundle': [{
+                    'order': [{
+                        'item_number': 1,
+                        'event': {'event_id': 'ABC123'},
+                        'performance': {'perf_id': 'ABC123-1'},
+                    }],
+                }],
+            },
+        }
+
+        trolley = Trolley.from_api_data(data, lazy=True, keep_raw=False)
+
+        order = trolley.bundles[0].orders[0]
+        assert order.event.id == 'ABC123'
+        assert order.event.raw is None
+        assert order.event.is_deferred('content')
+        assert order.performance.is_deferred('cost_range')
+        assert trolley.discarded_orders[0].event.raw is None
+
 
     def test_get_events(self):
 
@@ -97,6 +97,58 @@ class TestIsoStrToDatetime:
         with pytest.raises(ValueError):
             utils.isostr_to_datetime(date_str)
 
+    def test_with_fraction_and_negative_offset(self):
+        date_str = '2016-09-16T19:30:00.25-05:30'
+        dt = utils.isostr_to_datetime(date_str)
+
+        assert dt == datetime.datetime(
+            2016, 9, 16, 19, 30, 0, 250000,
+            tzinfo=tzoffset(None, -19800))
+        assert dt.utcoffset() == datetime.timedelta(hours=-5, minutes=-30)
+
+    def test_without_offset(self):
+        dt = utils.isostr_to_datetime('2016-09-16T19:30:00')
+
+        assert dt == datetime.datetime(2016, 9, 16, 19, 30, 0)
+        assert dt.tzinfo is None
+
+    def test_date_only(self):
+        dt = utils.isostr_to_datetime('2016-09-16')
+
+        assert dt == datetime.datetime(2016, 9, 16)
+
+    def test_matches_dateutil(self):
+        from dateutil import parser
+
+        for date_str in ('2016-09-16T19:30:00+01:00',
+                         '2016-09-16T19:30+0100',
+                         '2016-09-16 19:30:00.123456-08:00',
+                         '2016-09-16T19:30:00Z'):
+            dt = utils._parse_iso_datetime(date_str)
+            expected = parser.parse(date_str)
+            assert dt == expected
+            assert dt.utcoffset() == expected.utcoffset()
+
+    def test_falls_back_to_dateutil(self):
+        dt = utils.isostr_to_datetime('16 Sep 2016 19:30')
+
+        assert dt == datetime.datetime(2016, 9, 16, 19, 30)
+
+    def test_with_invalid_values(self):
+        with pytest.raises(ValueError):
+            utils.isostr_to_datetime('2016-13-16T19:30:00+01:00')
+
+    def test_cached(self, monkeypatch):
+        monkeypatch.setattr(utils, '_ISO_CACHE', {})
+        monkeypatch.setattr(utils, 'ISO_CACHE_SIZE', 2)
+
+        first = utils.isostr_to_datetime('2016-09-16T19:30:00+01:00')
+        assert utils.isostr_to_datetime('2016-09-16T19:30:00+01:00') is first
+
+        utils.isostr_to_datetime('2016-09-17T19:30:00+01:00')
+        utils.isostr_to_datetime('2016-09-18T19:30:00+01:00')
+        assert len(utils._ISO_CACHE) == 1
+
 
 class TestYYYYToDate:
 
@@ -116,6 +168,20 @@ class TestYYYYToDate:
         with pytest.raises(ValueError):
             utils.yyyymmdd_to_date('wrong_date')
 
+        with pytest.raises(ValueError):
+            utils.yyyymmdd_to_date('20161301')
+
+    def test_yyyymmdd_to_date_cached(self, monkeypatch):
+        monkeypatch.setattr(utils, '_DATE_CACHE', {})
+        monkeypatch.setattr(utils, 'DATE_CACHE_SIZE', 2)
+
+        first = utils.yyyymmdd_to_date('20160801')
+        assert utils.yyyymmdd_to_date('20160801') is first
+
+        utils.yyyymmdd_to_date('20160802')
+        utils.yyyymmdd_to_date('20160803')
+        assert len(utils._DATE_CACHE) == 1
+
 
 class TestSpecificDatesFromAPI:
 
@@ -319,3 +385,10 @@ class TestFilterNoneFromParameters:
             'foo': 'bar',
             'lol': 'beans',
         }
+
+
+class TestMonotonic:
+
+    def test_monotonic(self):
+        first = utils.monotonic()
+        assert utils.monotonic() >= first